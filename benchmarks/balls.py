@@ -0,0 +1,54 @@
+"""
+Multi-ball stress test: simulation step time with many balls in play.
+
+Starts a headless game, splits the ball into the requested number of balls and
+times the fixed simulation steps (no rendering).
+
+    python -m benchmarks.balls [--balls N] [--ticks N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.game import Game  # noqa: E402
+from state_manager.headless import HeadlessRunner, enable_headless  # noqa: E402
+
+
+def measure_balls(balls=300, ticks=300):
+    """
+    Time game steps with the given number of balls.
+
+    Args:
+        balls (int): Balls in play at the start.
+        ticks (int): Simulation steps to time.
+
+    Returns:
+        dict: 'ms_per_tick', plus 'balls_left' and 'bricks_left' at the end.
+    """
+    enable_headless()
+    runner = HeadlessRunner(Game())
+    game = runner.state
+    game.ball.launch()
+    game.ball_launched = True
+    game.add_balls(balls - 1)
+    start = time.perf_counter()
+    runner.run(ticks, until_done=False)
+    elapsed = time.perf_counter() - start
+    return {
+        'ms_per_tick': elapsed * 1000.0 / ticks,
+        'balls_left': len(game.balls),
+        'bricks_left': len(game.brick_wall),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--balls', type=int, default=300)
+    parser.add_argument('--ticks', type=int, default=300)
+    args = parser.parse_args()
+    result = measure_balls(args.balls, args.ticks)
+    print(f"{args.balls} balls: {result['ms_per_tick']:.3f} ms per tick over {args.ticks} ticks "
+          f"({result['balls_left']} balls, {result['bricks_left']} bricks left)")
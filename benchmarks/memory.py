@@ -0,0 +1,89 @@
+"""
+Memory footprint of a large brick wall: private surfaces vs shared flyweights.
+
+Builds a 100x40 wall (one color per row, like create_bricks) twice: once with
+bricks that each own a Surface and carry a full instance dict, the way Brick
+used to, and once with the current slotted Brick drawing from the shared
+surface cache. Reports Python heap allocated while building (tracemalloc) and
+the pixel memory of the distinct surfaces the bricks reference.
+
+    python -m benchmarks.memory [--columns N] [--rows N]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+import pygame as pg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.surfaces import surfaces  # noqa: E402
+from objects.brick import Brick  # noqa: E402
+from objects.brick_wall import BrickWall  # noqa: E402
+
+BRICK_SIZE = (60, 15)
+
+
+class PrivateSurfaceBrick(pg.sprite.Sprite):
+    """Brick as it was before the surface cache: its own Surface, no __slots__."""
+
+    def __init__(self, color, width, height):
+        super().__init__()
+        self.color = color
+        self.image = pg.Surface([width, height])
+        self.image.fill(color)
+        self.rect = self.image.get_rect()
+
+
+def build_wall(brick_class, columns, rows):
+    wall = BrickWall(BRICK_SIZE[0], BRICK_SIZE[1])
+    for row in range(rows):
+        color = (40 + row * 5 % 200, 30, 150 - row * 3 % 140)
+        for col in range(columns):
+            brick = brick_class(color, *BRICK_SIZE)
+            brick.rect.topleft = (col * BRICK_SIZE[0], row * BRICK_SIZE[1])
+            wall.add(brick)
+    return wall
+
+
+def measure(brick_class, columns, rows):
+    """
+    Build a wall and measure it.
+
+    Returns:
+        dict: 'python_bytes' allocated while building, 'surface_bytes' of the
+        distinct brick surfaces and their count 'surfaces'.
+    """
+    surfaces.clear()
+    tracemalloc.start()
+    wall = build_wall(brick_class, columns, rows)
+    python_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    images = {id(brick.image): brick.image for brick in wall}
+    return {
+        'python_bytes': python_bytes,
+        'surface_bytes': sum(s.get_width() * s.get_height() * s.get_bytesize() for s in images.values()),
+        'surfaces': len(images),
+    }
+
+
+def compare(columns=100, rows=40):
+    """Return the measurements of the old and the current brick, keyed 'before' and 'after'."""
+    pg.init()
+    return {
+        'before': measure(PrivateSurfaceBrick, columns, rows),
+        'after': measure(Brick, columns, rows),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--columns', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=40)
+    args = parser.parse_args()
+    results = compare(args.columns, args.rows)
+    print(f"{args.columns}x{args.rows} wall")
+    for label, result in results.items():
+        print(f"  {label:6}: {result['python_bytes'] / 1024:8.1f} KiB Python heap, "
+              f"{result['surface_bytes'] / 1024:8.1f} KiB pixels in {result['surfaces']} surfaces")
@@ -0,0 +1,94 @@
+"""
+Startup-time measurement: from main.main() to the first Menu frame on screen.
+
+Counts pygame.display.set_mode() calls and times the cold start. Runs with the
+real video driver when one is available; pass --headless to use SDL's dummy
+drivers (window creation is nearly free there, so the set_mode count is the
+interesting number).
+
+    python -m benchmarks.startup [--runs N] [--headless]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import pygame as pg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from engine.assets import assets  # noqa: E402
+from engine.fonts import clear_font_cache  # noqa: E402
+from state_manager.control import Control  # noqa: E402
+
+
+class _FirstFrame(Exception):
+    """Raised to leave the main loop once the first frame is on screen."""
+
+
+def measure_startup(runs=5, headless=False):
+    """
+    Time main.main() up to the first presented Menu frame.
+
+    Args:
+        runs (int): Number of cold starts to time.
+        headless (bool): Use the dummy video/audio drivers. The game's own
+            headless mode skips the menu, so the normal start is timed on them.
+
+    Returns:
+        dict: 'set_mode_calls' per start, and 'mean_ms', 'min_ms', 'max_ms' timings.
+    """
+    real_set_mode = pg.display.set_mode
+    real_loop = Control.main_game_loop
+    calls = []
+
+    def counting_set_mode(*args, **kwargs):
+        calls.append(args)
+        return real_set_mode(*args, **kwargs)
+
+    def first_frame(control):
+        control.update(control.step)
+        control.draw(0.0)
+        pg.display.update()
+        raise _FirstFrame
+
+    if headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    timings = []
+    pg.display.set_mode = counting_set_mode
+    Control.main_game_loop = first_frame
+    try:
+        for _ in range(runs):
+            calls.clear()
+            start = time.perf_counter()
+            try:
+                main.main()
+            except _FirstFrame:
+                timings.append((time.perf_counter() - start) * 1000.0)
+            pg.quit()
+            clear_font_cache()
+            assets.evict()
+    finally:
+        pg.display.set_mode = real_set_mode
+        Control.main_game_loop = real_loop
+
+    return {
+        'set_mode_calls': len(calls),
+        'mean_ms': statistics.mean(timings),
+        'min_ms': min(timings),
+        'max_ms': max(timings),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args()
+    result = measure_startup(args.runs, args.headless)
+    print(f"set_mode calls: {result['set_mode_calls']}")
+    print(f"startup to first menu frame: mean {result['mean_ms']:.1f} ms "
+          f"(min {result['min_ms']:.1f}, max {result['max_ms']:.1f}) over {args.runs} runs")
@@ -0,0 +1,344 @@
+"""
+Benchmark suite: fixed headless scenarios timed against a baseline in the repo.
+
+Every scenario runs with SDL's dummy drivers and seeded games, so two runs on
+the same machine time the same work. Each one is run --repeat times and its
+median is compared with benchmarks/baseline.json:
+
+    python -m benchmarks.suite                  # run and print
+    python -m benchmarks.suite --compare        # flag regressions over 15 %
+    python -m benchmarks.suite --save           # record a new baseline
+    python -m benchmarks.suite --only draw_stress particles_4096 --compare
+
+Scenarios:
+    collisions_*      Game._handle_collisions plus the swept ball movement
+                      of Game._move_balls per step, 8 balls under the
+                      autopilot, on the default 45-brick wall and on walls
+                      of 1000 and 10000 bricks packed above the ball's
+                      spawn point (see fitted_wall())
+    draw_default      Game.draw of a default game in play
+    draw_stress       Game.draw with 200 balls, 4096 debris and 100 power items
+    particles_*       ParticleSystem.update, 4096 and 20000 debris spawning
+                      and expiring continuously
+    create_bricks_*   create_bricks() baked onto a background, 45 to 10000 bricks
+    startup           main.main() to the first Menu frame
+
+create_bricks() keeps its brick gaps, so create_bricks_10000 (125 x 80) builds
+a wall far deeper than the window. That scenario only times building and
+baking a wall; play on large walls is timed by collisions_*.
+
+Baselines are only comparable on the machine they were recorded on: --save
+again after changing hardware, then compare performance changes against it.
+--compare exits with status 1 if any scenario regressed.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from functools import partial
+
+import numpy as np
+import pygame as pg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT  # noqa: E402
+from objects.ball import WALL_WIDTH  # noqa: E402
+from objects.brick import Brick  # noqa: E402
+from objects.brick_wall import BrickWall  # noqa: E402
+from objects.debris import Debris  # noqa: E402
+from objects.particles import ParticleSystem, PARTICLE_CAPACITY  # noqa: E402
+from screens.game import Game, create_bricks  # noqa: E402
+from state_manager.headless import HeadlessRunner, enable_headless  # noqa: E402
+from state_manager.states import States  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.15  # slowdown of the median that counts as a regression
+SEED = 1234
+
+# Collision walls fill this band, above the ball's spawn point (screen center)
+WALL_TOP = 100
+WALL_BOTTOM = WINDOW_HEIGHT // 2 - 30
+
+
+def _quiet_game(**options):
+    """A started Game under a HeadlessRunner, without its startup prints."""
+    game = Game(seed=SEED, **options)
+    game.verbose = False
+    return HeadlessRunner(game)
+
+
+def fitted_wall(rows, columns, top=WALL_TOP, bottom=WALL_BOTTOM):
+    """
+    A rows x columns wall packed between the side walls and from top to bottom.
+
+    create_bricks() keeps its 60 x 15 style gaps and so runs off the screen
+    past a few hundred bricks; this shrinks the bricks instead, leaving the
+    ball's spawn point and the paddle in the open like a real level.
+    """
+    pitch_x = int(WINDOW_WIDTH - 2 * WALL_WIDTH) // columns
+    pitch_y = (bottom - top) // rows
+    left = WALL_WIDTH + (WINDOW_WIDTH - 2 * WALL_WIDTH - columns * pitch_x) // 2
+    wall = BrickWall(pitch_x, pitch_y, (left, top))
+    bricks = []
+    for row in range(rows):
+        shade = 60 + 140 * row // max(rows - 1, 1)
+        for col in range(columns):
+            brick = Brick((shade, 40, 200 - shade), pitch_x - 1, pitch_y - 1)
+            brick.rect.topleft = (left + col * pitch_x, top + row * pitch_y)
+            bricks.append(brick)
+    wall.add(*bricks)
+    return wall
+
+
+def time_collisions(build_wall, ticks=300, balls=8):
+    """
+    Mean ms of collision work per step over an autopilot game on the wall build_wall() returns.
+
+    A step's collision work is Game._handle_collisions(), which resolves
+    overlaps left at the start of the step, plus Game._move_balls(), where the
+    balls are swept against the bricks near them and the paddle and the hits
+    are applied.
+    """
+    enable_headless()
+    game = Game(seed=SEED, autopilot=True, render=False)
+    game._create_wall = build_wall
+    game.verbose = False
+    runner = HeadlessRunner(game)
+    runner.step()  # the autopilot launches the ball
+    game.add_balls(balls - 1)
+
+    spent = []
+
+    def timed(method):
+        def call(*args):
+            start = time.perf_counter()
+            method(*args)
+            spent.append(time.perf_counter() - start)
+        return call
+
+    game._handle_collisions = timed(game._handle_collisions)
+    game._move_balls = timed(game._move_balls)
+    runner.run(ticks, until_done=False)
+    return sum(spent) * 1000.0 / ticks
+
+
+def time_draw(stress=False, frames=200):
+    """Mean ms per Game.draw() of a game frozen mid-play (full redraw, no dirty rects)."""
+    screen = enable_headless()
+    runner = _quiet_game(autopilot=True)
+    game = runner.state
+    runner.run(120, until_done=False)
+    if stress:
+        rng = np.random.default_rng(SEED)
+        game.add_balls(199)
+        for ball, (x, y) in zip(game.balls.members, rng.uniform((40, 250), (WINDOW_WIDTH - 40, 800), (200, 2))):
+            ball.rect.center = (x, y)
+        centers = rng.uniform((40, 100), (WINDOW_WIDTH - 40, 600), (PARTICLE_CAPACITY, 2)).astype(int)
+        game.particles.add(*[Debris(tuple(center), (200, 80, 40)) for center in centers.tolist()])
+        game.particles.update()
+        effects = ['expand', 'shrink', 'laser', 'sticky']
+        for i, (x, y) in enumerate(rng.uniform((40, 100), (WINDOW_WIDTH - 40, 700), (100, 2)).astype(int).tolist()):
+            item = game.power_item_pool.acquire(x, y, effects[i % len(effects)])
+            game.power_items.add(item)
+            game.all_sprites.add(item)
+    game.dirty_rects = False
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.draw(screen, 0.5)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def time_particles(count=PARTICLE_CAPACITY, lifetimes=3):
+    """
+    Mean ms per ParticleSystem.update() holding about count live debris.
+
+    A lifetime's worth of debris is spawned spread over each lifetime, so the
+    system runs full with particles expiring (and being compacted) every step.
+    Spawning is not timed.
+    """
+    enable_headless()
+    particles = ParticleSystem(capacity=count, rng=np.random.default_rng(SEED))
+    per_step = count // particles.lifetime
+    centers = np.random.default_rng(SEED).uniform((0, 0), (WINDOW_WIDTH, WINDOW_HEIGHT), (per_step, 2)).astype(int)
+    wave = [Debris(tuple(center), (200, 80, 40)) for center in centers.tolist()]
+    spent = 0.0
+    steps = lifetimes * particles.lifetime
+    for _ in range(steps):
+        particles.add(*wave)
+        start = time.perf_counter()
+        particles.update()
+        spent += time.perf_counter() - start
+    return spent * 1000.0 / steps
+
+
+def time_create_bricks(rows, columns):
+    """ms for one create_bricks() call baked onto a window-sized background."""
+    enable_headless()
+    background = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    start = time.perf_counter()
+    create_bricks(rows, columns, background)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def time_startup():
+    """ms from main.main() to the first Menu frame (see benchmarks.startup)."""
+    from benchmarks.startup import measure_startup
+    States.verbose = False  # every screen main.main() creates
+    try:
+        result = measure_startup(runs=1, headless=True)
+    finally:
+        States.verbose = True
+    enable_headless()  # measure_startup() quits pygame
+    return result['mean_ms']
+
+
+# name -> callable returning one sample in ms; startup last, it quits pygame
+SCENARIOS = {
+    'collisions_45': partial(time_collisions, partial(create_bricks, 5, 9)),
+    'collisions_1000': partial(time_collisions, partial(fitted_wall, 25, 40)),
+    'collisions_10000': partial(time_collisions, partial(fitted_wall, 80, 125)),
+    'draw_default': partial(time_draw, stress=False),
+    'draw_stress': partial(time_draw, stress=True),
+    'particles_4096': time_particles,
+    'particles_20000': partial(time_particles, 20000),
+    'create_bricks_45': partial(time_create_bricks, 5, 9),
+    'create_bricks_1000': partial(time_create_bricks, 25, 40),
+    'create_bricks_10000': partial(time_create_bricks, 125, 80),
+    'startup': time_startup,
+}
+
+
+def run_suite(names=None, repeat=5, progress=None):
+    """
+    Run scenarios.
+
+    Args:
+        names (list): Scenarios to run, all of SCENARIOS when None.
+        repeat (int): Samples per scenario.
+        progress (callable): Called with each scenario's name before it runs.
+
+    Returns:
+        dict: Scenario name -> 'median_ms', 'min_ms', 'max_ms' and 'samples'.
+    """
+    results = {}
+    for name in names or SCENARIOS:
+        if progress:
+            progress(name)
+        samples = [SCENARIOS[name]() for _ in range(repeat)]
+        results[name] = {
+            'median_ms': statistics.median(samples),
+            'min_ms': min(samples),
+            'max_ms': max(samples),
+            'samples': samples,
+        }
+    return results
+
+
+def environment():
+    """What the numbers were measured on."""
+    return {
+        'python': platform.python_version(),
+        'pygame': pg.version.ver,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Write results as the baseline, keeping other scenarios already in the file."""
+    baseline = load_baseline(path) or {'results': {}}
+    baseline['environment'] = environment()
+    baseline['results'].update(results)
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Return the baseline file's contents, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare medians with a baseline.
+
+    Args:
+        results (dict): From run_suite().
+        baseline (dict): The 'results' of a baseline file.
+        threshold (float): Relative change of the median that counts, e.g. 0.15.
+
+    Returns:
+        list: (name, baseline ms or None, current ms, ratio or None, verdict)
+        per scenario; verdict is 'regression', 'improvement', 'ok' or 'new'.
+    """
+    rows = []
+    for name, result in results.items():
+        current = result['median_ms']
+        before = baseline.get(name, {}).get('median_ms')
+        if before is None:
+            rows.append((name, None, current, None, 'new'))
+            continue
+        ratio = current / before
+        if ratio > 1 + threshold:
+            verdict = 'regression'
+        elif ratio < 1 - threshold:
+            verdict = 'improvement'
+        else:
+            verdict = 'ok'
+        rows.append((name, before, current, ratio, verdict))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--only', nargs='+', choices=list(SCENARIOS), metavar='SCENARIO',
+                        help=f"scenarios to run: {', '.join(SCENARIOS)}")
+    parser.add_argument('--repeat', type=int, default=5, help="samples per scenario; the median counts")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--save', action='store_true', help="write the results to the baseline file")
+    parser.add_argument('--compare', action='store_true', help="compare with the baseline and flag regressions")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown counted as a regression (default 0.15)")
+    parser.add_argument('--out', help="also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.only, args.repeat, lambda name: print(f"running {name}...", flush=True))
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2, sort_keys=True)
+
+    regressions = 0
+    baseline = load_baseline(args.baseline) if args.compare else None
+    if args.compare and baseline is None:
+        print(f"no baseline at {args.baseline}; run with --save first")
+    if baseline is not None:
+        print(f"\n{'scenario':<22}{'baseline':>11}{'now':>11}{'change':>9}")
+        for name, before, current, ratio, verdict in compare(results, baseline['results'], args.threshold):
+            before_text = f"{before:9.3f}ms" if before is not None else f"{'-':>11}"
+            change = f"{(ratio - 1):+8.1%}" if ratio is not None else f"{'-':>8}"
+            flag = '' if verdict == 'ok' else f"  {verdict.upper()}"
+            print(f"{name:<22}{before_text}{current:9.3f}ms {change}{flag}")
+            regressions += verdict == 'regression'
+        print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+    else:
+        print(f"\n{'scenario':<22}{'median':>11}{'min':>11}{'max':>11}")
+        for name, result in results.items():
+            print(f"{name:<22}{result['median_ms']:9.3f}ms{result['min_ms']:9.3f}ms{result['max_ms']:9.3f}ms")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"baseline written to {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,17 @@ WINDOW_WIDTH = CONFIG["window"]["width"]
 WINDOW_HEIGHT = CONFIG["window"]["height"]
 FPS = CONFIG["fps"]
 
+# Simulation Settings
+"""The game logic runs in fixed steps of 1 / TICK_RATE seconds, independent of
+the render frame rate. Object speeds (ball, paddle, lasers, debris, power items)
+are expressed in pixels per frame at BASE_FPS and scaled by the step length."""
+TICK_RATE = CONFIG.get("tick_rate", FPS)
+BASE_FPS = 60
+MAX_FRAME_TIME = 0.25  # seconds of simulation allowed per rendered frame
+
+# Rendering Settings
+DIRTY_RECTS = CONFIG.get("dirty_rects", False)  # push only changed regions to the display
+
 # Game Settings
 STARTING_LIVES = CONFIG["starting_lives"]
 
@@ -42,8 +53,18 @@ IMAGE_PATHS = {
     for key, path in CONFIG.get("images", {}).items()
 }
 
+SOUND_PATHS = {
+    key: os.path.join(PROJECT_ROOT, path)
+    for key, path in CONFIG.get("sounds", {}).items()
+}
+
+# Level files and their compiled binary cache
+LEVEL_DIR = os.path.join(PROJECT_ROOT, CONFIG.get("levels", {}).get("dir", "assets/levels"))
+LEVEL_CACHE_DIR = os.path.join(PROJECT_ROOT, CONFIG.get("levels", {}).get("cache_dir", "assets/levels/.cache"))
+
 # SETTINGS for game setup
 SETTINGS = {
     'SIZE': (WINDOW_WIDTH, WINDOW_HEIGHT),
-    'FPS': FPS
+    'FPS': FPS,
+    'TICK_RATE': TICK_RATE
 }
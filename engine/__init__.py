@@ -0,0 +1,12 @@
+from .assets import AssetManager, assets
+from .dirty_rects import DirtyRectTracker
+from .fonts import get_font, render_text, text_cache, TextCache
+from .levels import Level, LevelLoader, levels
+from .profiler import FrameProfiler, ProfilerOverlay, profiler
+from .static_layer import StaticLayer
+from .surfaces import surfaces, SurfaceCache
+
+
+__all__ = ['AssetManager', 'assets', 'DirtyRectTracker', 'get_font', 'render_text', 'text_cache', 'TextCache',
+           'Level', 'LevelLoader', 'levels', 'FrameProfiler', 'ProfilerOverlay', 'profiler', 'StaticLayer',
+           'surfaces', 'SurfaceCache']
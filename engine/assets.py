@@ -0,0 +1,131 @@
+import pygame as pg
+
+from config import IMAGE_PATHS, SOUND_PATHS
+"""
+Central asset manager: every image and sound is loaded once and shared.
+
+Images are looked up by their key in the "images" section of settings.json and
+cached per variant (target size, alpha, colorkey) already converted to the
+display format, so screens never load or scale anything while drawing. Sounds
+are looked up by their key in the "sounds" section and cached as decoded
+pygame.mixer.Sound objects.
+
+Cached surfaces are shared between screens; blit them, never draw on them.
+"""
+
+
+class SilentSound:
+    """Stands in for a pygame.mixer.Sound where nothing should be heard."""
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        return None
+
+
+SILENT = SilentSound()
+
+
+class AssetManager:
+    """
+    Load-once cache for images and sounds.
+
+    Attributes:
+        image_paths (dict): Image key -> file path.
+        sound_paths (dict): Sound key -> file path.
+        hits (int): Requests served from the cache.
+        misses (int): Requests that had to load from disk.
+    """
+
+    def __init__(self, image_paths=IMAGE_PATHS, sound_paths=SOUND_PATHS):
+        self.image_paths = image_paths
+        self.sound_paths = sound_paths
+        self.hits = 0
+        self.misses = 0
+        self._images = {}
+        self._sounds = {}
+
+    def image(self, key, size=None, alpha=False, colorkey=None):
+        """
+        Return an image, loading, converting and scaling it on first request.
+
+        Args:
+            key (str): Image key from settings.json, e.g. 'game_bg'.
+            size (tuple): Optional (width, height) to scale to.
+            alpha (bool): Keep per-pixel alpha (convert_alpha instead of convert).
+            colorkey (tuple): Optional transparent color.
+
+        Raises:
+            KeyError: If the key is not configured.
+            pygame.error / FileNotFoundError: If the file cannot be loaded.
+        """
+        cache_key = (key, tuple(size) if size else None, alpha, colorkey)
+        surface = self._images.get(cache_key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = pg.image.load(self.image_paths[key])
+        if pg.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        if size:
+            surface = pg.transform.scale(surface, size)
+        if colorkey is not None:
+            surface.set_colorkey(colorkey)
+        self._images[cache_key] = surface
+        return surface
+
+    def sound(self, key):
+        """
+        Return the decoded Sound for a key, decoding the file on first request.
+
+        Raises:
+            KeyError: If the key is not configured.
+            pygame.error: If the mixer is not initialised or the file is invalid.
+        """
+        sound = self._sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        self.misses += 1
+        sound = self._sounds[key] = pg.mixer.Sound(self.sound_paths[key])
+        return sound
+
+    def sounds(self, keys=None):
+        """Return a dict of Sounds for the given keys (all configured sounds by default)."""
+        return {key: self.sound(key) for key in (keys or self.sound_paths)}
+
+    def silent_sounds(self, keys=None):
+        """Like sounds(), but every sound is a no-op; needs no mixer."""
+        return {key: SILENT for key in (keys or self.sound_paths)}
+
+    def evict(self, key=None):
+        """
+        Drop cached assets.
+
+        Args:
+            key (str): Image or sound key to drop (all cached variants of it).
+                Drops everything when omitted.
+        """
+        if key is None:
+            self._images.clear()
+            self._sounds.clear()
+            return
+        for cache_key in [k for k in self._images if k[0] == key]:
+            del self._images[cache_key]
+        self._sounds.pop(key, None)
+
+    def stats(self):
+        """Return cache hit/miss counts and the number of cached images and sounds."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'images': len(self._images),
+            'sounds': len(self._sounds),
+        }
+
+
+assets = AssetManager()
@@ -0,0 +1,60 @@
+class DirtyRectTracker:
+    """
+    Tracks which screen regions changed since the last frame.
+
+    A screen that draws in dirty-rect mode restores the static background under
+    everything it drew last frame, draws the moving parts again, and hands only
+    the touched rects to pygame.display.update() instead of the whole window.
+
+    Attributes:
+        full_redraw (bool): The next frame must repaint and push the whole screen
+            (first frame, after a state change or a resize).
+        previous (list): Rects covered by moving objects in the last frame.
+        marked (list): Extra regions that changed outside the moving objects,
+            e.g. a destroyed brick.
+    """
+
+    def __init__(self):
+        self.full_redraw = True
+        self.previous = []
+        self.marked = []
+
+    def invalidate(self):
+        """Request a full repaint on the next frame."""
+        self.full_redraw = True
+        self.previous = []
+        self.marked = []
+
+    def mark(self, rect):
+        """
+        Record a changed region that must be restored and pushed next frame.
+
+        Ignored while a full redraw is pending, since that repaints everything.
+        """
+        if not self.full_redraw:
+            self.marked.append(rect.copy())
+
+    def take_erase_list(self):
+        """Return the regions to restore from the background this frame and reset them."""
+        erase = self.previous + self.marked
+        self.previous = []
+        self.marked = []
+        return erase
+
+    def commit(self, drawn, erased=()):
+        """
+        Finish a frame.
+
+        Args:
+            drawn (list): Rects covered by the moving objects drawn this frame.
+            erased (list): Regions restored from the background this frame.
+
+        Returns:
+            list or None: Rects to pass to pygame.display.update(), or None when
+            the whole screen was repainted and must be pushed.
+        """
+        self.previous = drawn
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+        return list(erased) + drawn
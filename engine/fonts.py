@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+import pygame as pg
+
+from config import FONT, FONT_SIZE
+"""
+Process-wide font registry and rendered-text cache.
+
+pygame.font.SysFont has to search the system font list on every call, and
+Font.render rasterises glyphs every time. Screens draw the same labels every
+frame, so both are cached here: fonts for the life of the process, rendered
+text in a size-bounded LRU.
+
+Surfaces returned by render_text() are shared; blit them, never draw on them.
+"""
+
+_fonts = {}
+
+
+def get_font(name=FONT, size=FONT_SIZE, bold=False):
+    """
+    Return the font for (name, size, bold), resolving it on first use only.
+
+    Args:
+        name (str): System font name.
+        size (int): Point size.
+        bold (bool): Bold variant.
+    """
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pg.font.SysFont(name, size, bold=bold)
+    return font
+
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text surfaces.
+
+    Keyed by (font, text, color, antialias). Holds at most maxsize surfaces; the
+    least recently used one is dropped when a new entry does not fit.
+
+    Attributes:
+        maxsize (int): Maximum number of cached surfaces.
+        hits (int): Renders served from the cache.
+        misses (int): Renders that had to rasterise text.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """Return the rendered surface for text, rasterising it only on a miss."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface and reset the statistics."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared cache. See TextCache.render."""
+    return text_cache.render(font, text, color, antialias)
+
+
+def clear_font_cache():
+    """
+    Forget all fonts and rendered text.
+
+    Must be called after pygame.quit() if pygame is initialised again in the
+    same process, since the old Font objects are no longer usable.
+    """
+    _fonts.clear()
+    text_cache.clear()
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+from config import LEVEL_DIR, LEVEL_CACHE_DIR
+"""
+Level files and their compiled binary cache.
+
+Levels are authored as JSON under assets/levels. A level draws its bricks as a
+text grid, one string per row, with a legend giving each character's color and
+hit points; '.' and ' ' leave a cell empty:
+
+    {
+        "top": 100,
+        "legend": {
+            "r": {"color": [120, 30, 30]},
+            "B": {"color": [30, 30, 150], "hp": 2}
+        },
+        "grid": [
+            "r.r.r.r.r",
+            ".B.B.B.B."
+        ]
+    }
+
+The first load of a level compiles it into a small binary file in
+assets/levels/.cache named after a hash of the source: a fixed header followed
+by one packed record per brick. Later loads of an unchanged level map that file
+into memory with numpy.memmap, so nothing is parsed. Editing the JSON changes
+the hash and the level is compiled again.
+"""
+
+MAGIC = b'BKLV'
+FORMAT_VERSION = 1
+
+# magic, format version, rows, columns, top, brick height, brick count
+HEADER = struct.Struct('<4sHHHHHI')
+
+# One packed record per brick, 8 bytes
+BRICK_DTYPE = np.dtype([
+    ('row', '<u2'),
+    ('col', '<u2'),
+    ('r', 'u1'),
+    ('g', 'u1'),
+    ('b', 'u1'),
+    ('hp', 'u1'),
+])
+
+EMPTY_CELLS = '. '
+DEFAULT_TOP = 100
+DEFAULT_BRICK_HEIGHT = 15
+
+
+class Level:
+    """
+    A compiled level.
+
+    Attributes:
+        name (str): Level name (the file name without .json).
+        rows (int): Number of grid rows.
+        columns (int): Number of grid columns, which sets the brick width.
+        top (int): y of the first brick row in pixels.
+        brick_height (int): Brick height in pixels.
+        bricks (numpy.ndarray): One BRICK_DTYPE record per brick, usually a
+            read-only memmap of the cache file.
+    """
+
+    def __init__(self, name, rows, columns, top, brick_height, bricks):
+        self.name = name
+        self.rows = rows
+        self.columns = columns
+        self.top = top
+        self.brick_height = brick_height
+        self.bricks = bricks
+
+    def __len__(self):
+        return len(self.bricks)
+
+    def colors(self):
+        """Return an (n, 3) array of the bricks' RGB colors."""
+        bricks = self.bricks
+        return np.stack([bricks['r'], bricks['g'], bricks['b']], axis=1)
+
+
+U8_MAX = 0xFF
+U16_MAX = 0xFFFF
+
+
+def _check_int(value, low, high, what):
+    """Return value if it is an int in [low, high], else raise ValueError naming it."""
+    if not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high:
+        raise ValueError(f"{what} must be an integer between {low} and {high}, not {value!r}")
+    return value
+
+
+def compile_level(source):
+    """
+    Compile a level's JSON text into its binary form.
+
+    Args:
+        source (str or bytes): The JSON level description.
+
+    Returns:
+        bytes: The header followed by the packed brick records.
+
+    Raises:
+        ValueError: If the level is malformed.
+    """
+    data = json.loads(source)
+    if not isinstance(data, dict):
+        raise ValueError("level must be a JSON object")
+    grid = data.get('grid')
+    if not grid or not isinstance(grid, list) or not all(isinstance(line, str) for line in grid):
+        raise ValueError("level needs a 'grid' of strings")
+    rows = _check_int(len(grid), 1, U16_MAX, "number of grid rows")
+    columns = _check_int(max(len(line) for line in grid), 1, U16_MAX, "number of grid columns")
+    top = _check_int(data.get('top', DEFAULT_TOP), 0, U16_MAX, "'top'")
+    brick_height = _check_int(data.get('brick_height', DEFAULT_BRICK_HEIGHT), 1, U16_MAX, "'brick_height'")
+
+    legend = {}
+    for char, brick in data.get('legend', {}).items():
+        if len(char) != 1 or char in EMPTY_CELLS:
+            raise ValueError(f"invalid legend key {char!r}")
+        if not isinstance(brick, dict):
+            raise ValueError(f"legend {char!r} must be an object")
+        color = brick.get('color', ())
+        if not isinstance(color, list) or len(color) != 3:
+            raise ValueError(f"legend {char!r} needs an RGB color")
+        color = tuple(_check_int(c, 0, U8_MAX, f"legend {char!r} color component") for c in color)
+        hp = _check_int(brick.get('hp', 1), 1, U8_MAX, f"legend {char!r} hp")
+        legend[char] = color + (hp,)
+
+    records = []
+    for row, line in enumerate(grid):
+        for col, char in enumerate(line):
+            if char in EMPTY_CELLS:
+                continue
+            if char not in legend:
+                raise ValueError(f"grid character {char!r} at row {row}, column {col} is not in the legend")
+            records.append((row, col) + legend[char])
+
+    bricks = np.array(records, dtype=BRICK_DTYPE)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, rows, columns, top, brick_height, len(bricks))
+    return header + bricks.tobytes()
+
+
+class LevelLoader:
+    """
+    Loads levels by name through the compiled binary cache.
+
+    Attributes:
+        level_dir (str): Directory of the .json level files.
+        cache_dir (str): Directory of the compiled .lvl files.
+        compiled (int): Levels compiled from JSON by this loader.
+        mapped (int): Levels mapped straight from an up-to-date cache file.
+    """
+
+    def __init__(self, level_dir=LEVEL_DIR, cache_dir=LEVEL_CACHE_DIR):
+        self.level_dir = level_dir
+        self.cache_dir = cache_dir
+        self.compiled = 0
+        self.mapped = 0
+
+    def names(self):
+        """Names of the available levels, sorted."""
+        if not os.path.isdir(self.level_dir):
+            return []
+        return sorted(f[:-5] for f in os.listdir(self.level_dir) if f.endswith('.json'))
+
+    def cache_path(self, name, source):
+        """Path of the compiled file for this version of a level's source."""
+        digest = hashlib.sha1(MAGIC + bytes([FORMAT_VERSION]) + source).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.lvl")
+
+    def load(self, name):
+        """
+        Return a level, compiling it first if its cache file is missing or stale.
+
+        Args:
+            name (str): Level name, the file name in level_dir without .json.
+
+        Raises:
+            FileNotFoundError: If there is no such level.
+            ValueError: If the level is malformed.
+        """
+        with open(os.path.join(self.level_dir, name + '.json'), 'rb') as f:
+            source = f.read()
+        path = self.cache_path(name, source)
+        if os.path.exists(path):
+            self.mapped += 1
+        else:
+            self._write(name, path, compile_level(source))
+            self.compiled += 1
+        return read_level(path, name)
+
+    def compile_all(self):
+        """Compile every level whose cache file is missing or stale. Returns their names."""
+        compiled = []
+        for name in self.names():
+            before = self.compiled
+            self.load(name)
+            if self.compiled > before:
+                compiled.append(name)
+        return compiled
+
+    def _write(self, name, path, data):
+        """Write a compiled level atomically and drop older versions of it."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for old in os.listdir(self.cache_dir):
+            if old.startswith(name + '-') and old.endswith('.lvl') and old[len(name) + 1:-4].isalnum():
+                os.remove(os.path.join(self.cache_dir, old))
+        temp = path + '.tmp'
+        with open(temp, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+
+
+def read_level(path, name=None):
+    """
+    Map a compiled level file into memory.
+
+    Args:
+        path (str): Path of a .lvl file written by LevelLoader.
+        name (str): Level name; defaults to the file name.
+
+    Raises:
+        ValueError: If the file is not a compiled level of this format version.
+    """
+    with open(path, 'rb') as f:
+        magic, version, rows, columns, top, brick_height, count = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} level file")
+    if count:
+        bricks = np.memmap(path, dtype=BRICK_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+    else:
+        bricks = np.zeros(0, dtype=BRICK_DTYPE)
+    return Level(name or os.path.basename(path).rsplit('-', 1)[0], rows, columns, top, brick_height, bricks)
+
+
+levels = LevelLoader()
+
+
+if __name__ == "__main__":
+    for level_name in levels.compile_all():
+        print("compiled", level_name)
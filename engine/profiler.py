@@ -0,0 +1,281 @@
+import json
+from time import perf_counter
+
+import numpy as np
+import pygame as pg
+
+from config import FONT, WHITE, GRAY, GREEN, PINK
+from engine.fonts import get_font
+"""
+Per-phase frame timing and an on-screen overlay to read it.
+
+Control.main_game_loop times its phases (events, update, draw, display) and
+Game.update its major sub-steps, all against the process-wide ``profiler``:
+
+    start = profiler.start()
+    ...
+    profiler.stop('collisions', start)
+
+Each frame's milliseconds per phase go into a fixed-size ring buffer, so the
+last FRAME_HISTORY frames are always at hand and memory never grows. Timing is
+off by default: start() then returns None and stop() ignores it, a couple of
+attribute lookups per phase. The overlay (F3 in game) switches it on while
+shown; profiler.enable() does so without one, e.g. to dump() a headless run.
+"""
+
+# Timed phases. The first four are the main loop's; the rest are parts of update.
+LOOP_PHASES = ('events', 'update', 'draw', 'display')
+UPDATE_PHASES = ('collisions', 'movement', 'sprites', 'effects')
+PHASES = LOOP_PHASES + UPDATE_PHASES
+
+FRAME_HISTORY = 600  # ten seconds at 60 FPS
+OVERLAY_TOP = 60  # below the game's top boundary
+
+
+class FrameProfiler:
+    """
+    Ring buffer of per-phase frame times.
+
+    Attributes:
+        phases (tuple): Names of the timed phases.
+        capacity (int): Number of frames kept.
+        enabled (bool): Whether start() and stop() measure anything.
+        frames (int): Frames recorded since the last clear().
+    """
+
+    def __init__(self, phases=PHASES, capacity=FRAME_HISTORY):
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        self.enabled = False
+        self.frames = 0
+        self._columns = {name: i for i, name in enumerate(self.phases)}
+        # ms per phase, then the whole frame's ms in the last column
+        self._times = np.zeros((capacity, len(self.phases) + 1))
+        self._current = [0.0] * (len(self.phases) + 1)
+        self._frame_start = None
+
+    def enable(self):
+        """Start timing; the first frame is recorded from the next end_frame() on."""
+        self.enabled = True
+        self._frame_start = None
+
+    def disable(self):
+        self.enabled = False
+        self._frame_start = None
+
+    def clear(self):
+        """Drop every recorded frame."""
+        self.frames = 0
+        self._times[:] = 0
+        self._current = [0.0] * len(self._current)
+
+    def start(self):
+        """
+        Begin timing a phase.
+
+        Returns:
+            float or None: The start time to hand to stop(), None when disabled.
+        """
+        return perf_counter() if self.enabled else None
+
+    def stop(self, phase, start):
+        """Add the time since start to this frame's total for phase."""
+        if start is not None:
+            self._current[self._columns[phase]] += (perf_counter() - start) * 1000.0
+
+    def end_frame(self):
+        """
+        Close the current frame and open the next one.
+
+        The frame time is the time between two calls, so call it once per pass
+        of the main loop.
+        """
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self._frame_start is not None:
+            current = self._current
+            current[-1] = (now - self._frame_start) * 1000.0
+            self._times[self.frames % self.capacity] = current
+            self.frames += 1
+        self._current = [0.0] * len(self._current)
+        self._frame_start = now
+
+    def history(self):
+        """
+        Return the recorded frames, oldest first.
+
+        Returns:
+            numpy.ndarray: (frames, len(phases) + 1) milliseconds; the last
+            column is the whole frame.
+        """
+        if self.frames <= self.capacity:
+            return self._times[:self.frames].copy()
+        split = self.frames % self.capacity
+        return np.concatenate((self._times[split:], self._times[:split]))
+
+    def summary(self):
+        """
+        Statistics over the recorded frames.
+
+        Returns:
+            dict: Phase name (and 'frame') -> dict of 'last', 'mean', 'p50',
+            'p99' and 'max' in milliseconds. Empty when nothing was recorded.
+        """
+        times = self.history()
+        if not len(times):
+            return {}
+        p50, p99 = np.percentile(times, (50, 99), axis=0)
+        stats = zip(times[-1], times.mean(axis=0), p50, p99, times.max(axis=0))
+        return {name: dict(zip(('last', 'mean', 'p50', 'p99', 'max'), map(float, values)))
+                for name, values in zip(self.phases + ('frame',), stats)}
+
+    def dump(self, path=None):
+        """
+        Export the recorded frames.
+
+        Args:
+            path (str): Also write the data to this JSON file.
+
+        Returns:
+            dict: 'phases', 'frames' (total recorded), 'summary' as from
+            summary(), and 'history', phase name -> ms per kept frame, oldest first.
+        """
+        times = self.history()
+        data = {
+            'phases': list(self.phases),
+            'frames': self.frames,
+            'summary': self.summary(),
+            'history': {name: times[:, i].tolist() for i, name in enumerate(self.phases + ('frame',))},
+        }
+        if path:
+            with open(path, 'w') as f:
+                json.dump(data, f)
+        return data
+
+
+class ProfilerOverlay:
+    """
+    Panel showing each phase's mean, p50 and p99 ms and a graph of recent frame times.
+
+    Showing the overlay enables its profiler and hiding it disables it again.
+    The text and graph are rebuilt every ``refresh`` frames rather than every
+    frame, so drawing the overlay stays cheap next to what it measures.
+
+    Attributes:
+        profiler (FrameProfiler): Where the numbers come from.
+        visible (bool): Whether the overlay is shown; Control only draws it then.
+        budget (float): Frame budget in ms, drawn as a line across the graph.
+        census (callable): Returns live sprite counts by group name (e.g.
+            Game.sprite_census), listed under the graph; None lists nothing.
+    """
+
+    WIDTH = 300
+    LINE_HEIGHT = 18
+    GRAPH_HEIGHT = 60
+    MARGIN = 10
+    COLUMNS = (170, 230, 290)  # right edges of the mean, p50 and p99 columns
+
+    def __init__(self, profiler, fps=60, refresh=15):
+        self.profiler = profiler
+        self.visible = False
+        self.budget = 1000.0 / fps
+        self.refresh = refresh
+        self.census = None
+        self._panel = None
+        self._built_at = None
+
+    def toggle(self):
+        """Show or hide the overlay, switching timing on or off with it."""
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.clear()
+            self.profiler.enable()
+        else:
+            self.profiler.disable()
+        self._panel = None
+
+    def draw(self, screen, dirty=None):
+        """
+        Draw the overlay in the top right corner of screen.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            dirty (list): Regions the state changed this frame, or None.
+
+        Returns:
+            list or None: dirty plus the overlay's rect, or None if dirty was None.
+        """
+        frames = self.profiler.frames
+        if self._panel is None or frames - self._built_at >= self.refresh:
+            self._panel = self._build()
+            self._built_at = frames
+        rect = screen.blit(self._panel, (screen.get_width() - self.WIDTH - self.MARGIN, OVERLAY_TOP))
+        if dirty is None:
+            return None
+        return list(dirty) + [rect]
+
+    def _build(self):
+        """Render the panel from the current summary and history."""
+        profiler = self.profiler
+        # Parts of update listed under it
+        names = [name for name in profiler.phases if name not in UPDATE_PHASES]
+        if 'update' in names:
+            at = names.index('update') + 1
+            names[at:at] = [name for name in UPDATE_PHASES if name in profiler.phases]
+        names.append('frame')
+        census = self.census() if self.census is not None else {}
+        lines = len(names) + 1 + (len(census) + 1 if census else 0)
+        height = lines * self.LINE_HEIGHT + self.GRAPH_HEIGHT + 2 * self.MARGIN
+        panel = pg.Surface((self.WIDTH, height))
+        panel.fill((20, 20, 20))
+
+        # Numbers change every refresh; render them directly rather than
+        # filling the shared text cache with one-off strings
+        font = get_font(FONT, 16)
+        summary = profiler.summary()
+        rows = [(('phase (ms)', 'mean', 'p50', 'p99'), GRAY)]
+        for name in names:
+            stats = summary.get(name)
+            label = f"  {name}" if name in UPDATE_PHASES else name
+            values = ('-',) * 3 if stats is None else \
+                tuple(f"{stats[key]:.2f}" for key in ('mean', 'p50', 'p99'))
+            rows.append(((label,) + values, WHITE))
+        y = self.MARGIN // 2
+        for cells, color in rows:
+            panel.blit(font.render(cells[0], True, color), (self.MARGIN, y))
+            for right, cell in zip(self.COLUMNS, cells[1:]):
+                text = font.render(cell, True, color)
+                panel.blit(text, text.get_rect(topright=(right, y)))
+            y += self.LINE_HEIGHT
+
+        # Frame time bars, newest on the right; green is the loop's own work
+        graph = pg.Rect(self.MARGIN, y + self.MARGIN // 2, self.WIDTH - 2 * self.MARGIN, self.GRAPH_HEIGHT)
+        pg.draw.rect(panel, (40, 40, 40), graph)
+        times = profiler.history()[-graph.width:]
+        if len(times):
+            scale = graph.height / max(2 * self.budget, times[:, -1].max())
+            work = times[:, :len(LOOP_PHASES)].sum(axis=1)
+            left = graph.right - len(times)
+            for x, (total, busy) in enumerate(zip(times[:, -1].tolist(), work.tolist()), left):
+                pg.draw.line(panel, GRAY, (x, graph.bottom - 1), (x, graph.bottom - 1 - round(total * scale)))
+                pg.draw.line(panel, GREEN, (x, graph.bottom - 1), (x, graph.bottom - 1 - round(busy * scale)))
+            budget_y = graph.bottom - 1 - round(self.budget * scale)
+            pg.draw.line(panel, PINK, (graph.left, budget_y), (graph.right - 1, budget_y))
+
+        # Live sprites per group; pools show in use / created
+        rows = [(('sprites', 'live'), GRAY)] if census else []
+        for name, count in census.items():
+            if isinstance(count, dict):
+                count = f"{count['in_use']}/{count['created']}"
+            rows.append(((f"  {name}", str(count)), WHITE))
+        y = graph.bottom + self.MARGIN // 2
+        for cells, color in rows:
+            panel.blit(font.render(cells[0], True, color), (self.MARGIN, y))
+            text = font.render(cells[1], True, color)
+            panel.blit(text, text.get_rect(topright=(self.COLUMNS[0], y)))
+            y += self.LINE_HEIGHT
+        return panel
+
+
+profiler = FrameProfiler()
@@ -0,0 +1,33 @@
+class StaticLayer:
+    """
+    A surface composed once and reused until its inputs change.
+
+    Screens whose content does not change while they are shown (titles, help
+    text, the final score) build it into one surface and blit that every frame.
+    The layer is rebuilt only when the key passed to get() differs from the one
+    it was built with, e.g. a new score or window size.
+
+    Attributes:
+        build (callable): Function returning the composed surface.
+        key: Inputs the current surface was built from.
+        surface (pygame.Surface): The cached surface, None until first use.
+        builds (int): Number of times the layer has been composed.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.key = None
+        self.surface = None
+        self.builds = 0
+
+    def get(self, key):
+        """Return the cached surface, composing it again if key has changed."""
+        if self.surface is None or key != self.key:
+            self.surface = self.build()
+            self.key = key
+            self.builds += 1
+        return self.surface
+
+    def invalidate(self):
+        """Force a rebuild on the next get()."""
+        self.surface = None
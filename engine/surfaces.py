@@ -0,0 +1,81 @@
+import pygame as pg
+"""
+Flyweight cache for the plain generated surfaces of game objects.
+
+Thousands of bricks share a handful of row colors, every laser is the same red
+bar and every ball the same circle, so instead of each object allocating its
+own Surface they all ask this cache for one keyed by (kind, size, color, flags).
+
+Shared surfaces must be treated as read-only: blit them, never draw on them.
+Objects that change size (the paddle) swap between cached surfaces instead of
+scaling their own.
+"""
+
+
+def _paint_circle(surface, color):
+    width, height = surface.get_size()
+    pg.draw.circle(surface, color, (width // 2, height // 2), min(width, height) // 2)
+
+
+# How each kind of surface is painted; anything not listed is a filled box
+PAINTERS = {
+    'ball': _paint_circle,
+}
+
+
+class SurfaceCache:
+    """
+    Shared, read-only surfaces keyed by (kind, size, color, flags).
+
+    Attributes:
+        hits (int): Requests served from the cache.
+        misses (int): Requests that created a new surface.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = {}
+
+    def get(self, kind, size, color, flags=0):
+        """
+        Return the shared surface for an object kind, size and color.
+
+        Args:
+            kind (str): What the surface is for, e.g. 'brick' or 'laser'. Picks
+                the painter from PAINTERS.
+            size (tuple): (width, height).
+            color (tuple): RGB(A) color.
+            flags (int): pygame.Surface flags, e.g. pygame.SRCALPHA.
+        """
+        key = (kind, (int(size[0]), int(size[1])), tuple(color), flags)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = pg.Surface(key[1], flags)
+        painter = PAINTERS.get(kind)
+        if painter is None:
+            surface.fill(key[2])
+        else:
+            painter(surface, key[2])
+        self._surfaces[key] = surface
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def stats(self):
+        """Return cache counters and the pixel memory held by cached surfaces."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'surfaces': len(self._surfaces),
+            'bytes': sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self._surfaces.values()),
+        }
+
+
+surfaces = SurfaceCache()
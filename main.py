@@ -5,13 +5,17 @@ This module initializes and runs the game using a finite state machine pattern.
 It handles pygame initialization, screen setup, and the main game loop.
 """
 
+import sys
+
 import pygame as pg
 from config import SETTINGS
 from screens import Menu, Game, End, Help  # explicit imports instead of wildcard
 from state_manager.control import Control
+from state_manager.headless import enable_headless
+from state_manager.replay import InputRecorder
 
 
-def main():
+def main(headless=False, level=None, record=None, autopilot=False, ticks=None):
     """
     Main entry point for the game application.
 
@@ -29,32 +33,62 @@ def main():
     - end: The game over/end screen state
     - help: The help screen
 
+    Args:
+        headless (bool): Run with SDL's dummy video/audio drivers, no frame cap
+            and no rendering. There is no input, so the game starts straight
+            away with the autopilot playing, and the program ends with the
+            game instead of showing the End screen. Pass --headless on the
+            command line.
+        level (str): Level under assets/levels to play instead of the default
+            wall. Pass --level NAME on the command line.
+        record (str): File to record each game's input to, for playback with
+            state_manager.replay. Pass --record PATH on the command line.
+        autopilot (bool): Let the autopilot play the game (demo mode), see
+            state_manager.autopilot. Pass --autopilot on the command line.
+        ticks (int): Stop a headless run after this many simulation steps.
+            Pass --ticks N on the command line.
+
     Usage:
         Called automatically when the script is run directly.
     """
-    pg.init()  # Initialize all pygame modules
-    pg.mixer.init()
+    if headless:
+        enable_headless()
+    else:
+        pg.init()  # Initialize all pygame modules
+        pg.mixer.init()
 
     # Create the main game controller with specified settings
-    app = Control(SETTINGS)
+    app = Control(dict(SETTINGS, HEADLESS=headless, MAX_STEPS=ticks))
 
     # Dictionary mapping state names to state instances
+    game = Game(level=level, recorder=InputRecorder(record) if record else None, autopilot=autopilot or headless)
     state_dict = {
         'menu': Menu(),
-        'game': Game(),
+        'game': game,
         'end': End(),
         'help': Help()
     }
+    if headless:
+        game.next = None  # nobody is there to choose from the End menu
 
     # Configure the state machine with available screens and starting point
-    app.setup_states(state_dict, 'menu')
+    app.setup_states(state_dict, 'game' if headless else 'menu')
 
     # Start the main game loop (blocks until game exits)
     app.main_game_loop()
+    if headless:
+        print(f"score {game.game_stats['score']}, lives {game.game_stats['lives']}, won {game.won}, "
+              f"{app.steps} steps")
 
     # Clean up pygame resources
     pg.quit()
 
 
 if __name__ == "__main__":
-    main()
+    args = sys.argv[1:]
+
+    def option(name):
+        return args[args.index(name) + 1] if name in args[:-1] else None
+
+    main(headless="--headless" in args, level=option("--level"), record=option("--record"),
+         autopilot="--autopilot" in args, ticks=int(option("--ticks")) if option("--ticks") else None)
@@ -1,9 +1,12 @@
 from .ball import Ball
+from .ball_set import BallSet
 from .brick import Brick
+from .brick_wall import BrickWall
 from .debris import Debris
 from .paddle import Paddle
+from .particles import ParticleSystem
 from .power_item import PowerItem
 from.power_item import Laser
 
 
-__all__ = ['Ball', 'Brick', 'Debris', 'Paddle', 'PowerItem', 'Laser']
+__all__ = ['Ball', 'BallSet', 'Brick', 'BrickWall', 'Debris', 'Paddle', 'ParticleSystem', 'PowerItem', 'Laser']
@@ -1,43 +1,144 @@
 import random
 
+import numpy as np
 import pygame as pg
 
-from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, BASE_FPS
+from engine.surfaces import surfaces
+from .collision import move_boxes, rect_array
+from .movable import Movable, frames_for
 
 WALL_WIDTH = WINDOW_WIDTH / 50
+TOP_BOUNDARY = 50
+
+# Play-area boundaries as thick boxes just outside the field
+WALLS = [
+    pg.Rect(WALL_WIDTH - 1000, -1000, 1000, WINDOW_HEIGHT + 2000),  # Left
+    pg.Rect(WINDOW_WIDTH - WALL_WIDTH, -1000, 1000, WINDOW_HEIGHT + 2000),  # Right
+    pg.Rect(-1000, TOP_BOUNDARY - 1000, WINDOW_WIDTH + 2000, 1000),  # Top
+]
+WALL_BOXES = rect_array(WALLS)
+
+# Columns of a ball's state row: float position, position at the start of the
+# step, velocity in pixels per frame, and the rect position last written
+X, Y, PREV_X, PREV_Y, DX, DY, SYNC_X, SYNC_Y = range(8)
+STATE_SIZE = 8
+
+
+def _column(index, doc):
+    """Property reading and writing one column of the ball's state row."""
+    def get(self):
+        return float(self.state[index])
+
+    def set(self, value):
+        self.state[index] = value
+
+    return property(get, set, doc=doc)
+
+
+class Ball(Movable, pg.sprite.Sprite):
+    """
+    The ball.
+
+    Unlike other Movable sprites, a ball keeps its position and velocity in a
+    NumPy row (``state``) rather than in Vector2s. On its own a ball owns that
+    row; once added to a BallSet the row becomes a view into the set's array,
+    so the whole set can be moved and collided in a few array operations while
+    ``ball.dx``, ``ball.pos`` and friends keep working on individual balls.
+    """
+
+    dx = _column(DX, "Horizontal velocity in pixels per frame.")
+    dy = _column(DY, "Vertical velocity in pixels per frame.")
 
-class Ball(pg.sprite.Sprite):
     def __init__(self, color, radius, speed, sounds):
         super().__init__()
         self.original_speed = speed
         self.sticky = False
-        self.image = pg.Surface((radius * 2, radius * 2), pg.SRCALPHA)
-        pg.draw.circle(self.image, color, (radius, radius), radius)
+        self.image = surfaces.get('ball', (radius * 2, radius * 2), color, pg.SRCALPHA)
         self.rect = self.image.get_rect()
         self.rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+        self.state = np.zeros(STATE_SIZE)
+        self.init_position()
         self.speed = speed
-        self.dx = 0
-        self.dy = 0
         self.sounds = sounds
 
-    def launch(self):
+    @property
+    def pos(self):
+        """Float position of the top-left corner (a copy)."""
+        return pg.Vector2(self.state[X], self.state[Y])
+
+    @property
+    def prev_pos(self):
+        """Float position at the start of the current step (a copy)."""
+        return pg.Vector2(self.state[PREV_X], self.state[PREV_Y])
+
+    def init_position(self):
+        self.state[[X, PREV_X, SYNC_X]] = self.rect.x
+        self.state[[Y, PREV_Y, SYNC_Y]] = self.rect.y
+
+    def _moved_externally(self):
+        return self.rect.x != self.state[SYNC_X] or self.rect.y != self.state[SYNC_Y]
+
+    def begin_step(self):
+        if self._moved_externally():
+            self.init_position()
+        self.state[[PREV_X, PREV_Y]] = self.state[[X, Y]]
+
+    def sync_rect(self):
+        self.rect.topleft = (round(self.state[X]), round(self.state[Y]))
+        self.state[[SYNC_X, SYNC_Y]] = self.rect.topleft
+
+    def move_by(self, dx, dy):
+        self.state[X] += dx
+        self.state[Y] += dy
+        self.sync_rect()
+
+    def render_pos(self, alpha):
+        if self._moved_externally():
+            return self.rect.topleft
+        x, y, prev_x, prev_y = self.state[[X, Y, PREV_X, PREV_Y]]
+        return (round(prev_x + (x - prev_x) * alpha),
+                round(prev_y + (y - prev_y) * alpha))
+
+    def launch(self, rng=random):
+        """Send the ball upwards at a random angle drawn from rng (a random.Random)."""
         self.dy = -self.speed
-        self.dx = random.uniform(-1.0, 1.0) * self.speed
-
-    def update(self):
-        self.rect.x += self.dx
-        self.rect.y += self.dy
-
-        # Wall collisions
-        if self.rect.left <= WALL_WIDTH or self.rect.right >= WINDOW_WIDTH - WALL_WIDTH:
-            self.dx *= -1
-            if self.sounds:
-                self.sounds['wall'].play()
-
-        if self.rect.top <= 50:  # Top boundary
-            self.dy *= -1
-            if self.sounds:
-                self.sounds['wall'].play()
+        self.dx = rng.uniform(-1.0, 1.0) * self.speed
+
+    def update(self, dt=1 / BASE_FPS, obstacles=()):
+        """
+        Move the ball for one step, bouncing off walls and obstacles on the way.
+
+        Collisions are swept along the whole step: the ball stops at the first
+        contact, reflects on the axis of the face it hit and continues for the
+        rest of the step. Fast balls therefore cannot skip over thin bricks or
+        the paddle, whatever the tick rate.
+
+        Args:
+            dt (float): Step length in seconds.
+            obstacles (iterable): Sprites the ball bounces off (bricks, paddle).
+
+        Returns:
+            list: (sprite, axis) pairs for every obstacle hit during the step,
+            axis being 'x' for a side face and 'y' for a top or bottom face.
+        """
+        self.begin_step()
+        obstacles = list(obstacles)
+        targets = np.concatenate((WALL_BOXES, rect_array(sprite.rect for sprite in obstacles)))
+        row = self.state[None]
+        contacts = move_boxes(row[:, X:Y + 1], row[:, DX:DY + 1], np.array([self.rect.size], dtype=float),
+                              frames_for(dt), targets, solid=len(WALLS))
+        self.sync_rect()
+
+        hits = []
+        for _, target, axis in contacts:
+            if target < len(WALLS):
+                if self.sounds:
+                    self.sounds['wall'].play()
+            else:
+                hits.append((obstacles[target - len(WALLS)], axis))
+        return hits
+
     def reset_speed(self):
         self.dx = self.original_speed * (abs(self.dx)/self.dx if self.dx != 0 else 1)
-        self.dy = self.original_speed * (abs(self.dy)/self.dy if self.dy != 0 else 1)
\ No newline at end of file
+        self.dy = self.original_speed * (abs(self.dy)/self.dy if self.dy != 0 else 1)
@@ -0,0 +1,141 @@
+import numpy as np
+import pygame as pg
+
+from config import BASE_FPS
+from .ball import WALLS, WALL_BOXES, STATE_SIZE, X, Y, PREV_X, PREV_Y, DX, DY, SYNC_X, SYNC_Y
+from .collision import move_boxes, overlapping, rect_array
+from .movable import frames_for
+
+
+class BallSet(pg.sprite.Group):
+    """
+    Sprite group for the balls in play, with their state in one NumPy array.
+
+    Adding a ball moves its state row into ``state`` and rebinds the ball to a
+    view of that row, so ``ball.dx = ...`` writes straight into the shared
+    array. Moving and colliding the whole set is then one vectorized sweep per
+    bounce, however many balls there are (see collision.move_boxes()).
+
+    Removal swaps the last ball into the freed row, so rows stay packed and
+    ball order is not stable; ``primary`` is always the ball in row 0.
+
+    Attributes:
+        state (ndarray): (capacity, STATE_SIZE) state rows, see objects.ball.
+        size (ndarray): (capacity, 2) ball sizes.
+        members (list): Balls in row order.
+    """
+
+    def __init__(self, capacity=16, *sprites):
+        """
+        Args:
+            capacity (int): Initial number of rows; the arrays grow as needed.
+            *sprites: Balls to add straight away.
+        """
+        self.state = np.zeros((capacity, STATE_SIZE))
+        self.size = np.zeros((capacity, 2))
+        self.members = []
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        row = len(self.members)
+        if row == len(self.state):
+            self._grow()
+        self.state[row] = sprite.state
+        self.size[row] = sprite.rect.size
+        sprite.state = self.state[row]
+        self.members.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        row = self.members.index(sprite)
+        sprite.state = sprite.state.copy()
+        last = self.members.pop()
+        if last is not sprite:
+            self.state[row] = self.state[len(self.members)]
+            self.size[row] = self.size[len(self.members)]
+            self.members[row] = last
+            last.state = self.state[row]
+
+    def _grow(self):
+        """Double the arrays and rebind every ball to its new row."""
+        self.state = np.concatenate((self.state, np.zeros_like(self.state)))
+        self.size = np.concatenate((self.size, np.zeros_like(self.size)))
+        for row, ball in enumerate(self.members):
+            ball.state = self.state[row]
+
+    @property
+    def primary(self):
+        """The ball launching and effects act on, or None if no ball is left."""
+        return self.members[0] if self.members else None
+
+    def _pull_rects(self):
+        """Pick up rects moved from outside (resets, the sticky ball), like Ball.begin_step()."""
+        state = self.state[:len(self.members)]
+        rects = np.array([ball.rect.topleft for ball in self.members], dtype=float).reshape(-1, 2)
+        moved = (rects != state[:, SYNC_X:SYNC_Y + 1]).any(axis=1)
+        if moved.any():
+            state[moved, X:Y + 1] = rects[moved]
+            state[moved, PREV_X:PREV_Y + 1] = rects[moved]
+            state[moved, SYNC_X:SYNC_Y + 1] = rects[moved]
+        return state
+
+    def boxes(self):
+        """Return the balls' rects as an (N, 4) array of x, y, w, h."""
+        state = self._pull_rects()
+        return np.hstack((state[:, SYNC_X:SYNC_Y + 1], self.size[:len(self.members)]))
+
+    def overlapping(self, rects):
+        """
+        Test every ball against every rect in one go.
+
+        Returns:
+            ndarray: (balls, rects) bool, True where a ball's rect overlaps a rect.
+        """
+        return overlapping(self.boxes(), rect_array(rects))
+
+    def fallen(self, bottom):
+        """Return the balls whose rect reaches bottom or beyond."""
+        boxes = self.boxes()
+        return [self.members[row] for row in np.flatnonzero(boxes[:, 1] + boxes[:, 3] >= bottom)]
+
+    def move(self, dt=1 / BASE_FPS, obstacles=()):
+        """
+        Move every ball one step, bouncing off the walls and the obstacles.
+
+        Same behaviour as calling Ball.update() on each ball, but all balls are
+        swept against all obstacles together.
+
+        Args:
+            dt (float): Step length in seconds.
+            obstacles (iterable): Sprites the balls bounce off (bricks, paddle).
+
+        Returns:
+            list: (ball, sprite, axis) for every obstacle hit during the step.
+        """
+        n = len(self.members)
+        if not n:
+            return []
+        state = self._pull_rects()
+        state[:, PREV_X:PREV_Y + 1] = state[:, X:Y + 1]
+        obstacles = list(obstacles)
+        targets = np.concatenate((WALL_BOXES, rect_array(sprite.rect for sprite in obstacles)))
+        contacts = move_boxes(state[:, X:Y + 1], state[:, DX:DY + 1], self.size[:n],
+                              frames_for(dt), targets, solid=len(WALLS))
+
+        rounded = np.round(state[:, X:Y + 1])
+        state[:, SYNC_X:SYNC_Y + 1] = rounded
+        for ball, topleft in zip(self.members, rounded.astype(int).tolist()):
+            ball.rect.topleft = topleft
+
+        hits = []
+        wall_hit = False
+        for row, target, axis in contacts:
+            if target < len(WALLS):
+                wall_hit = True
+            else:
+                hits.append((self.members[row], obstacles[target - len(WALLS)], axis))
+        sounds = self.members[0].sounds
+        if wall_hit and sounds:
+            sounds['wall'].play()
+        return hits
@@ -1,10 +1,19 @@
 import pygame as pg
 
+from engine.surfaces import surfaces
+
 
 class Brick(pg.sprite.Sprite):
-    def __init__(self, color, width, height):
+    __slots__ = ('color', 'hp', 'image', 'rect')
+
+    def __init__(self, color, width, height, hp=1):
         super().__init__()
         self.color = color  # Store color for debris
-        self.image = pg.Surface([width, height])
-        self.image.fill(color)
+        self.hp = hp  # Hits left before the brick breaks
+        self.image = surfaces.get('brick', (width, height), color)  # shared by same-colored bricks
         self.rect = self.image.get_rect()
+
+    def hit(self):
+        """Take one hit. Returns True if that broke the brick."""
+        self.hp -= 1
+        return self.hp <= 0
@@ -0,0 +1,67 @@
+import pygame as pg
+
+from .spatial import UniformGrid
+
+
+class BrickWall(pg.sprite.Group):
+    """
+    Sprite group for the bricks, kept indexed in a uniform grid.
+
+    Behaves like a normal Group; every add, remove, kill or empty keeps the grid
+    in step, so collision code can ask for the bricks overlapping a rect with
+    query() in O(cells touched) instead of testing every brick.
+
+    Once bake() has been called the group also keeps a pre-rendered picture of
+    the wall: an added brick is drawn onto it and a removed brick's rect is
+    restored from the background, so drawing the wall is a single blit.
+
+    Attributes:
+        grid (UniformGrid): Spatial index of the bricks in the group.
+        layer (pygame.Surface): The background with the bricks drawn on it, or
+            None until bake() is called.
+    """
+
+    def __init__(self, cell_width=64, cell_height=20, origin=(0, 0), *sprites):
+        """
+        Args:
+            cell_width (float): Grid cell width, ideally the horizontal brick pitch.
+            cell_height (float): Grid cell height, ideally the vertical brick pitch.
+            origin (tuple): Top-left corner of the first brick.
+            *sprites: Bricks to add straight away.
+        """
+        self.grid = UniformGrid(cell_width, cell_height, origin)
+        self.layer = None
+        self.background = None
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite)
+        if self.layer is not None:
+            self.layer.blit(sprite.image, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+        if self.layer is not None:
+            self.layer.blit(self.background, sprite.rect, sprite.rect)
+
+    def bake(self, background):
+        """
+        Render the wall once onto a copy of background and keep it up to date.
+
+        Args:
+            background (pygame.Surface): What lies behind the bricks, used to
+                erase removed bricks.
+
+        Returns:
+            pygame.Surface: The baked layer (also kept as ``layer``).
+        """
+        self.background = background
+        self.layer = background.copy()
+        self.layer.blits([(brick.image, brick.rect) for brick in self], False)
+        return self.layer
+
+    def query(self, rect):
+        """Return the bricks overlapping rect."""
+        return self.grid.query(rect)
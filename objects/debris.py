@@ -1,21 +1,16 @@
-import random
+class Debris:
+    """
+    Spawn request for one debris particle.
 
-import pygame as pg
+    Debris no longer is a sprite: the particles live in a ParticleSystem's
+    arrays. Creating a Debris only records where and in which color a particle
+    should appear; adding it to a ParticleSystem spawns it:
 
-class Debris(pg.sprite.Sprite):
-    def __init__(self, position, color):
-        super().__init__()
-        self.image = pg.Surface((4, 4), pg.SRCALPHA)
-        self.image.fill(color)
-        self.rect = self.image.get_rect(center=position)
-        self.velocity = [random.uniform(-2, 2), random.uniform(-3, -1)]
-        self.gravity = 0.1
-        self.life = 30
+        particles.add(Debris(brick.rect.center, brick.color))
+    """
+
+    __slots__ = ('position', 'color')
 
-    def update(self):
-        self.velocity[1] += self.gravity
-        self.rect.x += self.velocity[0]
-        self.rect.y += self.velocity[1]
-        self.life -= 1
-        if self.life <= 0:
-            self.kill()
+    def __init__(self, position, color):
+        self.position = position
+        self.color = tuple(color)
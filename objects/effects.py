@@ -0,0 +1,283 @@
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+"""
+Power-up effects.
+
+Every effect is a class registered under its name with @register, bundling how
+it is applied, how it is reverted and how long it lasts. PowerItem and the
+game's debug keys look effects up in EFFECTS, so a new power-up is one new
+class here and nothing in Game has to change.
+
+ActiveEffects keeps the effects currently running and reverts them when they
+run out, using a min-heap of expiry times on the simulation clock: each step
+only looks at the effects that actually expired.
+
+BalanceConfig groups the power-up balance knobs a Game is played with, so
+balance sweeps can vary them per game: Game(config=BalanceConfig(...)).
+"""
+
+POWER_UP_CHANCE = 0.3  # chance a destroyed brick drops a power item
+
+EFFECTS = {}
+
+
+@dataclass
+class BalanceConfig:
+    """
+    Power-up balance of a game.
+
+    Attributes:
+        drop_chance (float): Chance a destroyed brick drops a power item.
+        effect_weights (dict): Effect name -> relative chance of being the
+            dropped item; all effects are equally likely when None.
+        effect_durations (dict): Effect name -> duration in ms, overriding
+            each effect's own.
+    """
+
+    drop_chance: float = POWER_UP_CHANCE
+    effect_weights: dict = None
+    effect_durations: dict = None
+
+
+def register(effect_class):
+    """Class decorator adding an effect to EFFECTS under its name."""
+    EFFECTS[effect_class.name] = effect_class()
+    return effect_class
+
+
+class Effect(ABC):
+    """
+    Base class for power-up effects.
+
+    Attributes:
+        name (str): Registry key, also the power item's effect_type.
+        duration (int): How long the effect lasts in ms of game time, or None
+            if it only ends when removed explicitly.
+        positive (bool): Helps the player (green item, power-up sound) or
+            hinders them (red item, power-down sound).
+        needs_game (bool): Can only be applied with a game at hand.
+    """
+
+    name = None
+    duration = 5000
+    positive = True
+    needs_game = False
+
+    @abstractmethod
+    def apply(self, paddle, ball, game=None):
+        """Start the effect."""
+
+    def revert(self, paddle, ball, game=None):
+        """Undo the effect when it ends. Instant effects have nothing to undo."""
+
+
+@register
+class Expand(Effect):
+    name = 'expand'
+    factor = 1.5
+
+    def apply(self, paddle, ball, game=None):
+        paddle.scale(self.factor)
+
+    def revert(self, paddle, ball, game=None):
+        paddle.reset_size()
+
+
+@register
+class Shrink(Expand):
+    name = 'shrink'
+    positive = False
+    factor = 0.6
+
+
+@register
+class ExtraLife(Effect):
+    name = 'extra_life'
+    needs_game = True
+
+    def apply(self, paddle, ball, game=None):
+        game.game_stats['lives'] += 1
+
+
+@register
+class FastBall(Effect):
+    name = 'fast_ball'
+    positive = False
+    factor = 1.8
+
+    def apply(self, paddle, ball, game=None):
+        ball.dx *= self.factor
+        ball.dy *= self.factor
+
+    def revert(self, paddle, ball, game=None):
+        ball.reset_speed()
+
+
+@register
+class LaserMode(Effect):
+    name = 'laser'
+    needs_game = True
+
+    def apply(self, paddle, ball, game=None):
+        game.laser_mode = True
+
+    def revert(self, paddle, ball, game=None):
+        game.laser_mode = False
+
+
+@register
+class Sticky(Effect):
+    """Lasts until the stuck ball is launched again."""
+    name = 'sticky'
+    duration = None
+
+    def apply(self, paddle, ball, game=None):
+        ball.sticky = True
+
+    def revert(self, paddle, ball, game=None):
+        ball.sticky = False
+
+
+@register
+class SlowPaddle(Effect):
+    name = 'slow_paddle'
+    positive = False
+
+    def apply(self, paddle, ball, game=None):
+        paddle.slow = True
+
+    def revert(self, paddle, ball, game=None):
+        paddle.slow = False
+
+
+@register
+class ReverseControls(Effect):
+    name = 'reverse_controls'
+    positive = False
+
+    def apply(self, paddle, ball, game=None):
+        paddle.reverse = True
+
+    def revert(self, paddle, ball, game=None):
+        paddle.reverse = False
+
+
+@register
+class MultiBall(Effect):
+    name = 'multi_ball'
+    needs_game = True
+
+    def apply(self, paddle, ball, game=None):
+        game.add_balls(2)
+
+
+class ActiveEffects:
+    """
+    The effects running in a game, expired from a min-heap of end times.
+
+    Effects are reverted on the game's current paddle and main ball. Removing
+    an effect early leaves its heap entry behind; it is skipped when it
+    surfaces.
+
+    Attributes:
+        game: The game whose paddle, ball and state the effects act on.
+        durations (dict): Effect name -> duration in ms overriding the
+            effect's own, for tuning power-up balance per game.
+    """
+
+    def __init__(self, game, durations=None):
+        self.game = game
+        self.durations = dict(durations or {})
+        self._heap = []
+        self._running = {}  # entry id -> (effect, ends_at), in start order
+        self._ids = itertools.count()
+
+    def __len__(self):
+        return len(self._running)
+
+    def __iter__(self):
+        """Yield (name, ends_at) for each running effect, oldest first."""
+        for effect, ends_at in self._running.values():
+            yield effect.name, ends_at
+
+    def names(self):
+        """Names of the running effects, oldest first."""
+        return [effect.name for effect, _ in self._running.values()]
+
+    def start(self, name, now):
+        """
+        Apply an effect and schedule its end.
+
+        Args:
+            name (str): Effect name from EFFECTS.
+            now (int): Current game time in ms.
+
+        Returns:
+            Effect or None: The effect, or None if there is no such effect.
+        """
+        effect = EFFECTS.get(name)
+        if effect is None:
+            return None
+        game = self.game
+        effect.apply(game.paddle, game.ball, game)
+        self.track(effect, now)
+        return effect
+
+    def track(self, effect, now):
+        """Schedule the end of an effect that has already been applied."""
+        duration = self.durations.get(effect.name, effect.duration)
+        self._schedule(effect, None if duration is None else now + duration)
+
+    def _schedule(self, effect, ends_at):
+        entry = next(self._ids)
+        self._running[entry] = (effect, ends_at)
+        if ends_at is not None:
+            heapq.heappush(self._heap, (ends_at, entry))
+
+    def restore(self, running):
+        """
+        Replace the running effects without applying or reverting anything.
+
+        Used to restore a game snapshot, whose paddle, ball and flags already
+        carry the effects.
+
+        Args:
+            running (iterable): (name, ends_at) pairs as yielded by iteration.
+        """
+        self.clear(revert=False)
+        for name, ends_at in running:
+            self._schedule(EFFECTS[name], ends_at)
+
+    def expire(self, now):
+        """Revert every effect whose end time has passed. Returns how many ended."""
+        ended = 0
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            _, entry = heapq.heappop(heap)
+            running = self._running.pop(entry, None)
+            if running is not None:
+                self._revert(running[0])
+                ended += 1
+        return ended
+
+    def stop(self, name):
+        """End every running effect with this name now."""
+        for entry, (effect, _) in list(self._running.items()):
+            if effect.name == name:
+                del self._running[entry]
+                self._revert(effect)
+
+    def clear(self, revert=True):
+        """End all effects, reverting them unless revert is False."""
+        running = list(self._running.values())
+        self._running.clear()
+        self._heap.clear()
+        if revert:
+            for effect, _ in running:
+                self._revert(effect)
+
+    def _revert(self, effect):
+        game = self.game
+        effect.revert(game.paddle, game.ball, game)
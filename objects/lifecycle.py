@@ -0,0 +1,64 @@
+class SpriteLifecycle:
+    """
+    Keeps track of a screen's sprite groups so nothing outlives its use.
+
+    - cull() kills sprites in the groups registered with cull=True once their
+      rect has left the play area (a power item the paddle missed, a laser past
+      the top), so they stop being updated and drawn.
+    - reset() kills every sprite in every registered group, e.g. when a new
+      game starts. Sprites are killed rather than dropped, so pooled sprites go
+      back to their pools.
+    - census() counts the live sprites per group for debugging.
+
+    Groups can be pygame sprite groups or anything with the same interface
+    (a ParticleSystem provides empty(), len() and its own cull()).
+
+    Attributes:
+        play_area (pygame.Rect): Sprites fully outside this rect are culled.
+    """
+
+    def __init__(self, play_area):
+        self.play_area = play_area
+        self._groups = {}
+        self._culled = []
+
+    def track(self, name, group, cull=False):
+        """
+        Register a group, replacing any group registered under the same name.
+
+        Args:
+            name (str): Label used by census().
+            group: The group to manage.
+            cull (bool): Kill its sprites when they leave the play area.
+        """
+        self._groups[name] = group
+        self._culled = [(n, g) for n, g in self._culled if n != name]
+        if cull:
+            self._culled.append((name, group))
+
+    def cull(self):
+        """Kill sprites that have left the play area. Returns how many were removed."""
+        removed = 0
+        area = self.play_area
+        for _, group in self._culled:
+            if hasattr(group, 'cull'):
+                removed += group.cull(area)
+                continue
+            for sprite in group.sprites():
+                if not area.colliderect(sprite.rect):
+                    sprite.kill()
+                    removed += 1
+        return removed
+
+    def reset(self):
+        """Kill every sprite in every registered group."""
+        for group in self._groups.values():
+            if hasattr(group, 'sprites'):
+                for sprite in group.sprites():
+                    sprite.kill()
+            else:
+                group.empty()
+
+    def census(self):
+        """Return the number of live sprites in each registered group."""
+        return {name: len(group) for name, group in self._groups.items()}
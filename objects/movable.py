@@ -0,0 +1,63 @@
+import pygame as pg
+
+from config import BASE_FPS
+
+
+def frames_for(dt):
+    """Convert a step length in seconds into frames at BASE_FPS."""
+    return dt * BASE_FPS
+
+
+class Movable:
+    """
+    Mixin for sprites that move during the fixed-step simulation.
+
+    The sprite's true position is kept as floats in ``pos`` (top-left corner),
+    while ``rect`` holds the rounded integer position used for collisions and
+    drawing. ``prev_pos`` remembers where the sprite was at the start of the
+    current step so the renderer can interpolate between the last two steps.
+
+    Code that moves a sprite by writing to ``rect`` directly (resets, the sticky
+    ball, tests) keeps working: the change is picked up on the next step and
+    the sprite snaps to the new position without interpolation.
+    """
+
+    def init_position(self):
+        """Start tracking the float position from the current rect."""
+        self.pos = pg.Vector2(self.rect.topleft)
+        self.prev_pos = pg.Vector2(self.pos)
+        self._synced = self.rect.topleft
+
+    def _moved_externally(self):
+        return self.rect.topleft != self._synced
+
+    def begin_step(self):
+        """Remember the current position before the sprite moves this step."""
+        if self._moved_externally():
+            self.pos.update(self.rect.topleft)
+            self._synced = self.rect.topleft
+        self.prev_pos.update(self.pos)
+
+    def sync_rect(self):
+        """Copy the float position into the integer rect."""
+        self.rect.topleft = (round(self.pos.x), round(self.pos.y))
+        self._synced = self.rect.topleft
+
+    def move_by(self, dx, dy):
+        """Move the float position and update the rect."""
+        self.pos.x += dx
+        self.pos.y += dy
+        self.sync_rect()
+
+    def render_pos(self, alpha):
+        """
+        Position to draw the sprite at, blended between the last two steps.
+
+        Args:
+            alpha (float): Fraction of a step elapsed since the last update (0..1).
+        """
+        if self._moved_externally():
+            return self.rect.topleft
+        prev = self.prev_pos
+        return (round(prev.x + (self.pos.x - prev.x) * alpha),
+                round(prev.y + (self.pos.y - prev.y) * alpha))
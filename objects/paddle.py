@@ -1,33 +1,71 @@
 import pygame as pg
 
 from config import WINDOW_WIDTH
+from engine.surfaces import surfaces
+from .movable import Movable
 
 WALL_WIDTH = WINDOW_WIDTH / 50
-class Paddle(pg.sprite.Sprite):
+
+# Paddle widths snap to multiples of WIDTH_STEP within these limits, so every
+# size the paddle can take is one cached skin
+WIDTH_STEP = 8
+MIN_WIDTH = 32
+MAX_WIDTH = WINDOW_WIDTH // 2
+
+
+def snap_width(width):
+    """Round a paddle width to the nearest step and clamp it to the limits."""
+    width = round(width / WIDTH_STEP) * WIDTH_STEP
+    return max(MIN_WIDTH, min(width, MAX_WIDTH))
+
+
+class Paddle(Movable, pg.sprite.Sprite):
     def __init__(self, color, width, height):
         super().__init__()
         self.original_width = width
-        self.image = pg.Surface((width, height))
         self.original_color = color
-        self.image.fill(color)
+        self.image = self._skin(width, height)
         self.rect = self.image.get_rect()
+        self.init_position()
         self.slow = False
         self.reverse = False
 
+    def _skin(self, width, height):
+        """Shared paddle surface for a size, rendered once per size."""
+        return surfaces.get('paddle', (width, height), self.original_color)
+
+    def set_width(self, width):
+        """
+        Resize the paddle around its center.
+
+        The width is snapped and clamped with snap_width(); the new image is a
+        cached skin, so resizing never scales or allocates a surface.
+        """
+        self.image = self._skin(snap_width(width), self.rect.height)
+        self.rect = self.image.get_rect(center=self.rect.center)
+
+    def scale(self, factor):
+        """Resize the paddle by a factor of its current width (see set_width)."""
+        self.set_width(self.rect.width * factor)
+
     def reset_size(self):
-        self.image = pg.Surface((self.original_width, self.rect.height))
+        self.resize(self.original_width)
+
+    def resize(self, width):
+        """Set an exact width around the center, without snapping (see set_width)."""
+        self.image = self._skin(width, self.rect.height)
         self.rect = self.image.get_rect(center=self.rect.center)
-        ## Reset Color
-        self.image.fill(self.original_color)
 
     def move(self, direction, speed):
-        """Move paddle with direction (-1=left, 1=right) and speed"""
+        """Move paddle with direction (-1=left, 0=stay, 1=right) and speed in pixels for this step"""
+        self.begin_step()
         if self.reverse:
             direction *= -1  # Flip direction if reversed
 
-        self.rect.x += direction * speed
+        self.pos.x += direction * speed
         # Boundary checking
-        if self.rect.left < WALL_WIDTH:
-            self.rect.left = WALL_WIDTH
-        if self.rect.right > WINDOW_WIDTH - WALL_WIDTH:
-            self.rect.right = WINDOW_WIDTH - WALL_WIDTH
\ No newline at end of file
+        if self.pos.x < WALL_WIDTH:
+            self.pos.x = WALL_WIDTH
+        if self.pos.x + self.rect.width > WINDOW_WIDTH - WALL_WIDTH:
+            self.pos.x = WINDOW_WIDTH - WALL_WIDTH - self.rect.width
+        self.sync_rect()
@@ -0,0 +1,148 @@
+import numpy as np
+
+from config import BASE_FPS
+from engine.surfaces import surfaces
+from .movable import frames_for
+
+PARTICLE_CAPACITY = 4096
+PARTICLE_SIZE = 4
+
+
+class ParticleSystem:
+    """
+    Fixed-capacity debris particles stored as NumPy arrays (struct of arrays).
+
+    Position, previous position, velocity, remaining life and palette index of
+    every live particle sit in preallocated arrays; the live particles are kept
+    packed at the front. One update() integrates gravity for all of them in a
+    few vectorized operations, and drawing goes through a single Surface.blits
+    call with one shared 4x4 surface per color.
+
+    The group-like interface (add, update, draw, empty, len) lets it replace the
+    old pygame.sprite.Group of Debris sprites. Spawns beyond the capacity are
+    dropped, so the arrays never grow.
+
+    Attributes:
+        capacity (int): Maximum number of live particles.
+        gravity (float): Downward acceleration in pixels per frame squared at BASE_FPS.
+        lifetime (float): Particle lifetime in frames at BASE_FPS.
+        rng (numpy.random.Generator): Source of the random spawn velocities.
+        count (int): Number of live particles.
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, gravity=0.1, lifetime=30, rng=None):
+        self.capacity = capacity
+        self.gravity = gravity
+        self.lifetime = lifetime
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+        self.pos = np.zeros((capacity, 2))
+        self.prev_pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self._palette = {}
+        self._surfaces = []
+
+    def _color_index(self, color):
+        """Palette index for a color, creating its shared particle surface once."""
+        index = self._palette.get(color)
+        if index is None:
+            surface = surfaces.get('particle', (PARTICLE_SIZE, PARTICLE_SIZE), color)
+            index = self._palette[color] = len(self._surfaces)
+            self._surfaces.append(surface)
+        return index
+
+    def add(self, *debris):
+        """Spawn one particle per Debris request, with random upward velocities."""
+        start = self.count
+        n = min(len(debris), self.capacity - start)
+        if n <= 0:
+            return
+        end = start + n
+        half = PARTICLE_SIZE / 2
+        for i, request in enumerate(debris[:n], start):
+            self.pos[i] = request.position
+            self.color[i] = self._color_index(request.color)
+        self.pos[start:end] -= half  # positions are top-left corners
+        self.prev_pos[start:end] = self.pos[start:end]
+        self.vel[start:end, 0] = self.rng.uniform(-2, 2, n)
+        self.vel[start:end, 1] = self.rng.uniform(-3, -1, n)
+        self.life[start:end] = self.lifetime
+        self.count = end
+
+    def update(self, dt=1 / BASE_FPS):
+        """Integrate all particles by one step and drop the expired ones."""
+        n = self.count
+        if not n:
+            return
+        frames = frames_for(dt)
+        pos, vel, life = self.pos[:n], self.vel[:n], self.life[:n]
+        self.prev_pos[:n] = pos
+        vel[:, 1] += self.gravity * frames
+        pos += vel * frames
+        life -= frames
+
+        alive = life > 0
+        if not alive.all():
+            self._compact(alive)
+
+    def _compact(self, keep_mask):
+        """Move the particles selected by keep_mask to the front and drop the rest."""
+        keep = np.flatnonzero(keep_mask)
+        for array in (self.pos, self.prev_pos, self.vel, self.life, self.color):
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+
+    def cull(self, area):
+        """
+        Drop particles that have left area (a Rect). Returns how many were removed.
+        """
+        n = self.count
+        if not n:
+            return 0
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        inside = ((x + PARTICLE_SIZE > area.left) & (x < area.right)
+                  & (y + PARTICLE_SIZE > area.top) & (y < area.bottom))
+        removed = n - int(inside.sum())
+        if removed:
+            self._compact(inside)
+        return removed
+
+    def blits(self, alpha=1.0):
+        """
+        Blit list for every live particle, interpolated between the last two steps.
+
+        Args:
+            alpha (float): Fraction of a step since the last update (0..1).
+        """
+        n = self.count
+        if not n:
+            return []
+        prev = self.prev_pos[:n]
+        xy = np.rint(prev + (self.pos[:n] - prev) * alpha).astype(np.int32)
+        surfaces = self._surfaces
+        return [(surfaces[c], p) for c, p in zip(self.color[:n].tolist(), xy.tolist())]
+
+    def draw(self, screen, alpha=1.0):
+        """Draw every live particle with one Surface.blits call."""
+        screen.blits(self.blits(alpha), False)
+
+    def get_state(self):
+        """Copy of the live particles' arrays, for set_state()."""
+        n = self.count
+        return tuple(array[:n].copy() for array in (self.pos, self.prev_pos, self.vel, self.life, self.color))
+
+    def set_state(self, state):
+        """Replace the live particles with ones saved by get_state() on this system."""
+        n = len(state[0])
+        for array, saved in zip((self.pos, self.prev_pos, self.vel, self.life, self.color), state):
+            array[:n] = saved
+        self.count = n
+
+    def empty(self):
+        """Remove all particles."""
+        self.count = 0
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,69 @@
+class SpritePool:
+    """
+    Recycles sprites of one class.
+
+    acquire() hands out a free sprite re-initialised through its reset() method
+    (same arguments as the constructor) and only constructs a new one when the
+    pool is empty. Pooled sprites return themselves to the pool when killed, so
+    once the pool has grown to the peak number of live sprites, spawning
+    allocates nothing.
+
+    Attributes:
+        sprite_class (type): Class of the pooled sprites. It must provide reset()
+            and call SpritePool.release() from kill() (see Poolable).
+        on_acquire (callable): Optional hook called with each acquired sprite.
+        on_release (callable): Optional hook called with each released sprite.
+        created (int): Number of sprites constructed by the pool.
+    """
+
+    def __init__(self, sprite_class, on_acquire=None, on_release=None):
+        self.sprite_class = sprite_class
+        self.on_acquire = on_acquire
+        self.on_release = on_release
+        self.created = 0
+        self._free = []
+
+    def acquire(self, *args, **kwargs):
+        """Return a sprite initialised with the given constructor arguments."""
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args, **kwargs)
+        else:
+            sprite = self.sprite_class(*args, **kwargs)
+            self.created += 1
+        sprite.pool = self
+        sprite.pooled_free = False
+        if self.on_acquire:
+            self.on_acquire(sprite)
+        return sprite
+
+    def release(self, sprite):
+        """Take a sprite back. Releasing a sprite that is already free does nothing."""
+        if sprite.pooled_free:
+            return
+        sprite.pooled_free = True
+        self._free.append(sprite)
+        if self.on_release:
+            self.on_release(sprite)
+
+    def stats(self):
+        """Return pool occupancy: sprites in use, free and ever created."""
+        free = len(self._free)
+        return {'in_use': self.created - free, 'free': free, 'created': self.created}
+
+
+class Poolable:
+    """
+    Mixin for sprites that can live in a SpritePool.
+
+    Sprites created directly (not through a pool) behave exactly like plain
+    sprites; sprites handed out by a pool go back to it when killed.
+    """
+
+    pool = None
+    pooled_free = False
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
@@ -1,74 +1,68 @@
 import pygame
 
+from config import BASE_FPS
+from engine.surfaces import surfaces
+from .effects import EFFECTS
+from .movable import Movable, frames_for
+from .pool import Poolable
+
+
+class PowerItem(Poolable, Movable, pygame.sprite.Sprite):
+    __slots__ = ('effect_type', 'image', 'rect', 'speed', 'pos', 'prev_pos', '_synced')
 
-class PowerItem(pygame.sprite.Sprite):
     def __init__(self, x, y, effect_type, speed=3):
         super().__init__()
+        self.reset(x, y, effect_type, speed)
+
+    def reset(self, x, y, effect_type, speed=3):
+        """Re-initialise a recycled item."""
         self.effect_type = effect_type
-        self.image = pygame.Surface((20, 20))
-        if effect_type in ['laser', 'expand', 'sticky', 'extra_life']:
-            self.image.fill((0, 255, 0))
+        effect = EFFECTS.get(effect_type)
+        if effect is not None and effect.positive:
+            self.image = surfaces.get('power_item', (20, 20), (0, 255, 0))
         else:
-            self.image.fill((255, 0, 0))
+            self.image = surfaces.get('power_item', (20, 20), (255, 0, 0))
         self.rect = self.image.get_rect(center=(x, y))
+        self.init_position()
         self.speed = speed
 
-    def update(self):
+    def update(self, dt=1 / BASE_FPS):
         """Standard sprite update method that makes the item fall"""
-        self.rect.y += self.speed
+        self.begin_step()
+        self.move_by(0, self.speed * frames_for(dt))
 
     def apply_effect(self, paddle, ball, game=None):
-        if self.effect_type == 'expand':
-            if not hasattr(paddle, "original_width"):
-                paddle.original_width = paddle.rect.width
-            paddle.image = pygame.transform.scale(paddle.image, (int(paddle.rect.width * 1.5), paddle.rect.height))
-            paddle.rect = paddle.image.get_rect(center=paddle.rect.center)
-            return 'expand'
-
-        elif self.effect_type == 'shrink':
-            if not hasattr(paddle, "original_width"):
-                paddle.original_width = paddle.rect.width
-            paddle.image = pygame.transform.scale(paddle.image, (int(paddle.rect.width * 0.6), paddle.rect.height))
-            paddle.rect = paddle.image.get_rect(center=paddle.rect.center)
-            return 'shrink'
-
-        elif self.effect_type == 'extra_life' and game:
-            game.game_stats['lives'] += 1
-            return 'extra_life'
+        """
+        Apply this item's effect (see objects.effects).
 
-        elif self.effect_type == 'fast_ball':
-            ball.dx *= 1.8
-            ball.dy *= 1.8
-            return 'fast_ball'
+        Returns:
+            str or None: The effect name, or None if it could not be applied
+            (unknown effect, or one that needs a game when none was given).
+        """
+        effect = EFFECTS.get(self.effect_type)
+        if effect is None or (effect.needs_game and game is None):
+            return None
+        effect.apply(paddle, ball, game)
+        return effect.name
 
-        elif self.effect_type == 'laser' and game:
-            game.laser_mode = True
-            return 'laser'
 
-        elif self.effect_type == 'sticky':
-            ball.sticky = True
-            return 'sticky'
+class Laser(Poolable, Movable, pygame.sprite.Sprite):
+    __slots__ = ('color', 'image', 'rect', 'speed', 'pos', 'prev_pos', '_synced')
 
-        elif self.effect_type == 'slow_paddle':
-            paddle.slow = True
-            return 'slow_paddle'
-
-        elif self.effect_type == 'reverse_controls':
-            paddle.reverse = True
-            return 'reverse_controls'
-
-        return None
-
-
-class Laser(pygame.sprite.Sprite):
     def __init__(self, x, y, color=(255, 0, 0), speed=10):
         super().__init__()
-        self.image = pygame.Surface((4, 12))
-        self.image.fill(color)
+        self.reset(x, y, color, speed)
+
+    def reset(self, x, y, color=(255, 0, 0), speed=10):
+        """Re-initialise a recycled laser."""
+        self.color = color
+        self.image = surfaces.get('laser', (4, 12), color)
         self.rect = self.image.get_rect(center=(x, y))
+        self.init_position()
         self.speed = speed
 
-    def update(self):
-        self.rect.y -= self.speed
+    def update(self, dt=1 / BASE_FPS):
+        self.begin_step()
+        self.move_by(0, -self.speed * frames_for(dt))
         if self.rect.bottom < 0:
             self.kill()
@@ -0,0 +1,77 @@
+from math import floor
+"""
+Uniform grid spatial index.
+
+The brick wall is laid out on a regular grid, so a grid whose cells match the
+brick pitch answers "which bricks overlap this rect" by looking only at the few
+cells the rect touches instead of testing every brick.
+"""
+
+
+class UniformGrid:
+    """
+    Spatial hash of sprites on a grid of equal cells.
+
+    A sprite is stored in every cell its rect overlaps, so sprites of any size
+    and position can be indexed; sprites that match the cell layout land in
+    exactly one cell. Sprites are assumed not to move while indexed.
+
+    Attributes:
+        cell_width (float): Width of a cell in pixels.
+        cell_height (float): Height of a cell in pixels.
+        origin (tuple): Pixel position of the corner of cell (0, 0).
+    """
+
+    def __init__(self, cell_width, cell_height, origin=(0, 0)):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.origin = origin
+        self._cells = {}
+        self._sprite_cells = {}
+
+    def _cell_keys(self, rect):
+        """Keys of all cells overlapped by rect (right and bottom edges exclusive)."""
+        ox, oy = self.origin
+        left = floor((rect.left - ox) / self.cell_width)
+        right = floor((rect.right - 1 - ox) / self.cell_width)
+        top = floor((rect.top - oy) / self.cell_height)
+        bottom = floor((rect.bottom - 1 - oy) / self.cell_height)
+        return [(cx, cy) for cy in range(top, bottom + 1) for cx in range(left, right + 1)]
+
+    def insert(self, sprite):
+        """Index a sprite under every cell its rect overlaps."""
+        keys = self._cell_keys(sprite.rect)
+        self._sprite_cells[sprite] = keys
+        for key in keys:
+            self._cells.setdefault(key, {})[sprite] = None
+
+    def remove(self, sprite):
+        """Drop a sprite from the index. Unknown sprites are ignored."""
+        for key in self._sprite_cells.pop(sprite, ()):
+            cell = self._cells[key]
+            del cell[sprite]
+            if not cell:
+                del self._cells[key]
+
+    def clear(self):
+        """Drop every sprite from the index."""
+        self._cells.clear()
+        self._sprite_cells.clear()
+
+    def query(self, rect):
+        """
+        Return the indexed sprites whose rects overlap rect.
+
+        Cost is proportional to the number of cells rect touches. Sprites are
+        returned in insertion order within each cell, without duplicates.
+        """
+        found = {}
+        cells = self._cells
+        for key in self._cell_keys(rect):
+            cell = cells.get(key)
+            if cell:
+                found.update(cell)
+        return [sprite for sprite in found if rect.colliderect(sprite.rect)]
+
+    def __len__(self):
+        return len(self._sprite_cells)
@@ -1,7 +1,9 @@
-import os
 import pygame as pg
 
-from config import WHITE, DARKGREEN, GREEN, LINE_SPACING, STARTING_LIVES, WINDOW_WIDTH,WINDOW_HEIGHT, FONT, FONT_SIZE, IMAGE_PATHS
+from config import WHITE, DARKGREEN, GREEN, LINE_SPACING, STARTING_LIVES, WINDOW_WIDTH,WINDOW_HEIGHT, FONT, FONT_SIZE
+from engine.assets import assets
+from engine.fonts import get_font, render_text
+from engine.static_layer import StaticLayer
 from state_manager.menu_manager import MenuManager
 from state_manager.states import States
 
@@ -50,14 +52,22 @@ class End(States, MenuManager):
 
         # Load background using centralized path from settings.json
         try:
-            image_path = IMAGE_PATHS["blurred_bg"]
-            self.background = pg.image.load(image_path).convert()
-            self.background = pg.transform.scale(self.background, (WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.background = assets.image("blurred_bg", (WINDOW_WIDTH, WINDOW_HEIGHT))
         except Exception as e:
             print("Failed to load background image:", e)
             self.background = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
             self.background.fill(WHITE)
 
+        # Heart image for the win screen, loaded once instead of every frame
+        try:
+            self.heart_img = assets.image("heart", (50, 50), alpha=True, colorkey=(255, 255, 255))
+        except Exception as e:
+            print(f"Could not load heart image: {e}")
+            self.heart_img = None
+
+        # Composed once per result instead of every frame
+        self.static_layer = StaticLayer(self._compose_static)
+
     def cleanup(self):
         """
         Reset game statistics when leaving the End state.
@@ -78,7 +88,7 @@ class End(States, MenuManager):
         - Show animations
         - Load high scores
         """
-        print('Starting End Screen')
+        self.announce('Starting End Screen')
         self.persist = persist
         self.score = self.persist.get('score', 0)
         self.won = self.persist.get('won', False)  # Get win status from Game
@@ -106,77 +116,68 @@ class End(States, MenuManager):
             self.quit = True
         self.get_event_menu(event)
 
-    def update(self, screen, dt):
+    def update(self, dt):
         """
-        Update the End state each frame.
+        Update the End state each simulation step.
 
         Args:
-            screen (pygame.Surface): The display surface to draw on.
-            dt (float): Delta time since last frame (unused in current implementation).
+            dt (float): Length of the simulation step (unused in current implementation).
 
         Performs:
         - Menu updates (through MenuManager)
-        - Screen drawing
         """
         self.update_menu()
-        self.draw(screen)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Render all End state elements to the screen.
+
+        The title, reward, hearts, final score and buttons are composed into the
+        static layer, rebuilt only when the score, win state or lives change.
         """
+        key = (self.screen_rect.size, self.score, self.won, self.integer)
+        screen.blit(self.static_layer.get(key), (0, 0))
+        self.draw_menu_highlight(screen)
+
+    def _compose_static(self):
+        """Compose everything on the End screen except the highlighted button."""
+        screen = pg.Surface(self.screen_rect.size)  # the layer being composed
         screen.blit(self.background, (0, 0)) #This loads the background image please dont make the screen fill as white
-        font = pg.font.SysFont(FONT, FONT_SIZE)
+        font = get_font(FONT, FONT_SIZE)
 
         # Show "YOU WIN!" or "Game Over"
         title = "YOU WIN!" if self.won else "Game Over"
         title_color = (DARKGREEN) if self.won else (0, 0, 0)
-        title_text = font.render(title, True, title_color)
+        title_text = render_text(font, title, title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 60))
         screen.blit(title_text, title_rect)
 
         # Calculate Final Score
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        heart_path = os.path.join(base_path, "..", "assets", "images", "heart.gif")
-
         if self.won:
-            try:
-                # Load and scale heart image
-                heart_img = pg.image.load(heart_path).convert_alpha()
-                heart_img = pg.transform.scale(heart_img, (50, 50))  # Scale to reasonable size
-                heart_img.set_colorkey((255, 255, 255)) # Give White Background
-
-                if self.integer >= 3:
-                    screen.blit(heart_img, (WINDOW_WIDTH // 4 - 25, 700))
-                    screen.blit(heart_img, (WINDOW_WIDTH // 2 - 25, 700))
-                    screen.blit(heart_img, (WINDOW_WIDTH * 3 // 4 - 25, 700))
-                    reward_text = font.render("Perfect! 4500 + 2000", True, (GREEN))
-                elif self.integer == 2:
-                    screen.blit(heart_img, (WINDOW_WIDTH // 4 - 25, 700))
-                    screen.blit(heart_img, (WINDOW_WIDTH // 2 - 25, 700))
-                    reward_text = font.render("Not Bad! 4500 + 1000", True, (GREEN))
-                elif self.integer == 1:
-                    screen.blit(heart_img, (WINDOW_WIDTH // 4 - 25, 700))
-                    reward_text = font.render("You Did it! 4500 + 500", True, (GREEN))
-
-                reward_rect = reward_text.get_rect(center=(WINDOW_WIDTH // 2, 600))
-                screen.blit(reward_text, reward_rect)
-
-            except Exception as e:
-                print(f"Could not load heart image: {e}")
-                # Fallback: Draw red circles if image fails to load
-                if self.integer == 3:
-                    pg.draw.circle(screen, (255, 0, 0), (WINDOW_WIDTH // 4, 725), 25)
-                    pg.draw.circle(screen, (255, 0, 0), (WINDOW_WIDTH // 2, 725), 25)
-                    pg.draw.circle(screen, (255, 0, 0), (WINDOW_WIDTH * 3 // 4, 725), 25)
-                elif self.integer == 2:
-                    pg.draw.circle(screen, (255, 0, 0), (WINDOW_WIDTH // 4, 725), 25)
-                    pg.draw.circle(screen, (255, 0, 0), (WINDOW_WIDTH // 2, 725), 25)
-                elif self.integer == 1:
-                    pg.draw.circle(screen, (255, 0, 0), (WINDOW_WIDTH // 4, 725), 25)
+            if self.integer >= 3:
+                hearts = [WINDOW_WIDTH // 4, WINDOW_WIDTH // 2, WINDOW_WIDTH * 3 // 4]
+                reward_text = render_text(font, "Perfect! 4500 + 2000", (GREEN))
+            elif self.integer == 2:
+                hearts = [WINDOW_WIDTH // 4, WINDOW_WIDTH // 2]
+                reward_text = render_text(font, "Not Bad! 4500 + 1000", (GREEN))
+            else:
+                hearts = [WINDOW_WIDTH // 4]
+                reward_text = render_text(font, "You Did it! 4500 + 500", (GREEN))
+
+            for x in hearts:
+                if self.heart_img is not None:
+                    screen.blit(self.heart_img, (x - 25, 700))
+                else:
+                    # Fallback: Draw red circles if the image failed to load
+                    pg.draw.circle(screen, (255, 0, 0), (x, 725), 25)
+
+            reward_rect = reward_text.get_rect(center=(WINDOW_WIDTH // 2, 600))
+            screen.blit(reward_text, reward_rect)
 
         # Show Final Score
-        score_text = font.render(f"Final Score: {self.score}", True, (0, 0, 0))
+        score_text = render_text(font, f"Final Score: {self.score}", (0, 0, 0))
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
         screen.blit(score_text, score_rect)
-        self.draw_menu(screen)
+        for i in range(len(self.buttons)):
+            self.draw_button(screen, i, False)
+        return screen
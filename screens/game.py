@@ -1,10 +1,24 @@
-import os
 import random
+from collections import Counter
+import numpy as np
 import pygame as pg
 from config import (GRAY, CYAN, WHITE, WINDOW_WIDTH, WINDOW_HEIGHT,
-                    FONT, STARTING_LIVES, IMAGE_PATHS)
+                    FONT, STARTING_LIVES, BASE_FPS, DIRTY_RECTS)
+from engine import DirtyRectTracker
+from engine.assets import assets
+from engine.fonts import get_font, render_text
+from engine.levels import levels
+from engine.profiler import profiler
 from objects import *
+from objects.effects import EFFECTS, ActiveEffects, BalanceConfig
+from objects.lifecycle import SpriteLifecycle
+from objects.movable import Movable, frames_for
+from objects.pool import SpritePool
+from state_manager.autopilot import Autopilot
 from state_manager.menu_manager import MenuManager
+from state_manager.rng import SessionRng
+from state_manager.sim_clock import SimClock
+from state_manager.snapshot import RewindBuffer, capture, restore
 from state_manager.states import States
 from objects.power_item import PowerItem, Laser
 
@@ -16,18 +30,46 @@ BRICK_HEIGHT = 15
 X_GAP = 10
 Y_GAP = 5
 WALL_WIDTH = WINDOW_WIDTH / 50
-
-
-def create_bricks(rows, columns):
-    """Create a brick wall with the specified rows and columns."""
+MAX_DEBUG_EFFECTS = 3
+
+# Debug keys that apply an effect straight away
+DEBUG_EFFECT_KEYS = {
+    pg.K_1: 'expand',
+    pg.K_2: 'shrink',
+    pg.K_3: 'extra_life',
+    pg.K_4: 'fast_ball',
+    pg.K_5: 'laser',
+    pg.K_6: 'sticky',
+    pg.K_7: 'slow_paddle',
+    pg.K_8: 'reverse_controls',
+    pg.K_9: 'multi_ball',
+}
+
+
+def _wall_layout(columns):
+    """Brick width and x of the first column for a wall of this many columns."""
     total_inter_brick_gap = (columns - 1) * X_GAP
     available_brick_width = WINDOW_WIDTH - (2 * WALL_WIDTH) - total_inter_brick_gap
     brick_width = available_brick_width // columns
     total_brick_group_width = (columns * brick_width) + total_inter_brick_gap
     side_gap = (WINDOW_WIDTH - (2 * WALL_WIDTH) - total_brick_group_width) // 2
+    return brick_width, WALL_WIDTH + side_gap
+
+
+def create_bricks(rows, columns, background=None, rng=random):
+    """
+    Create a brick wall with the specified rows and columns.
+
+    The color gradient is picked with rng, a random.Random or the random module.
+
+    If a background is given the wall is also baked onto a copy of it, see
+    BrickWall.bake().
+    """
+    brick_width, left = _wall_layout(columns)
 
-    brick_group = pg.sprite.Group()
     start_y = 100
+    # Index the wall on the same grid the bricks are laid out on
+    brick_group = BrickWall(brick_width + X_GAP, BRICK_HEIGHT + Y_GAP, (left, start_y))
 
     # Predefined contrasting dark color pairs
     color_pairs = [
@@ -38,7 +80,7 @@ def create_bricks(rows, columns):
     ]
 
     # Pick one contrasting pair
-    start_rgb, end_rgb = random.choice(color_pairs)
+    start_rgb, end_rgb = rng.choice(color_pairs)
     start_color = pg.Color(*start_rgb)
     end_color = pg.Color(*end_rgb)
 
@@ -51,17 +93,71 @@ def create_bricks(rows, columns):
 
         for col in range(columns):
             brick = Brick(row_color, brick_width, BRICK_HEIGHT)
-            brick.rect.x = WALL_WIDTH + side_gap + col * (brick_width + X_GAP)
+            brick.rect.x = left + col * (brick_width + X_GAP)
             brick.rect.y = start_y + row * (BRICK_HEIGHT + Y_GAP)
             brick_group.add(brick)
 
+    if background is not None:
+        brick_group.bake(background)
+    return brick_group
+
+
+def create_level_bricks(level, background=None):
+    """
+    Create the brick wall of a compiled level (see engine.levels).
+
+    Bricks are laid out like create_bricks() with the level's number of columns,
+    so a level's grid fills the same width whatever its size.
+    """
+    brick_width, left = _wall_layout(level.columns)
+    pitch_x = brick_width + X_GAP
+    pitch_y = level.brick_height + Y_GAP
+    brick_group = BrickWall(pitch_x, pitch_y, (left, level.top))
+
+    records = level.bricks
+    xs = (left + records['col'] * pitch_x).tolist()
+    ys = (level.top + records['row'].astype(np.int64) * pitch_y).tolist()
+    colors = [tuple(color) for color in level.colors().tolist()]
+    bricks = []
+    for x, y, color, hp in zip(xs, ys, colors, records['hp'].tolist()):
+        brick = Brick(color, brick_width, level.brick_height, hp)
+        brick.rect.topleft = (x, y)
+        bricks.append(brick)
+    brick_group.add(*bricks)
+
+    if background is not None:
+        brick_group.bake(background)
     return brick_group
 
 
 class Game(States, MenuManager):
     """Main game state that handles the breakout gameplay with power-ups."""
 
-    def __init__(self):
+    def __init__(self, sim_clock=None, level=None, seed=None, recorder=None, rewind_seconds=0, render=True,
+                 config=None, autopilot=False):
+        """
+        Args:
+            sim_clock (SimClock): Clock used for timed effects and cooldowns. A new
+                clock is created when omitted; pass one in to control game time
+                from outside (headless runs, tests).
+            level (str): Name of the level under assets/levels to play. The
+                default 5 x 9 wall is used when omitted.
+            seed (int): Seed of every session's random streams, so each game
+                with the same input plays out the same. Each session gets a
+                fresh seed when omitted.
+            recorder (InputRecorder): Records each session's key events for
+                replay (see state_manager.replay).
+            rewind_seconds (float): Keep this many seconds of snapshots so play
+                can be rewound with the R key (see state_manager.snapshot).
+            render (bool): Load the background and sounds and keep a baked
+                wall for drawing. Simulation-only games (batch environments)
+                pass False: they need no display or mixer, play no sound and
+                cannot be drawn.
+            config (BalanceConfig): Power-up drop chance, effect weights and
+                effect durations; the defaults in objects.effects when omitted.
+            autopilot (bool): Let state_manager.autopilot play: it sends its
+                key presses through get_event() before every step.
+        """
         States.__init__(self)
         MenuManager.__init__(self)
         self.next = 'end'
@@ -71,58 +167,113 @@ class Game(States, MenuManager):
         self.ball_launched = False
         self.won = False
         self.persist = {}
+        self.level = level
+        self.seed = seed
+        self.rng = SessionRng(seed)
+        self.recorder = recorder
+        self.tick = 0  # simulation steps run this session
+        self.session = 0  # number of games started, snapshots belong to one
+        self.rewind = RewindBuffer(self, rewind_seconds) if rewind_seconds else None
+        self.sim_clock = sim_clock if sim_clock is not None else SimClock()
+        self.autopilot = Autopilot(self) if autopilot else None
 
         # Power-up related attributes
         self.lasers = pg.sprite.Group()
         self.laser_mode = False
-        self.last_laser_time = 0
         self.laser_cooldown = 500  # ms between laser shots
-        self.active_effects = []
+        self.last_laser_time = -self.laser_cooldown
+        self.config = config if config is not None else BalanceConfig()
+        self.active_effects = ActiveEffects(self, self.config.effect_durations)
         self.power_items = pg.sprite.Group()
+        self.effects_collected = Counter()  # power items caught this session, by effect
+
+        # Recycled sprites, so spawning during play allocates no new surfaces
+        self.laser_pool = SpritePool(Laser)
+        self.power_item_pool = SpritePool(PowerItem)
+
+        # Culls sprites that leave the screen and clears every group between games
+        self.lifecycle = SpriteLifecycle(pg.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.lifecycle.track('power_items', self.power_items, cull=True)
+        self.lifecycle.track('lasers', self.lasers, cull=True)
+
+        # Every ball in play; self.ball is the first of them
+        self.balls = BallSet()
+        self.lifecycle.track('balls', self.balls)
 
         # Load background
-        try:
-            image_path = IMAGE_PATHS["game_bg"]
-            self.background = pg.image.load(image_path).convert()
-            self.background = pg.transform.scale(self.background, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        except Exception as e:
-            print("Failed to load background image:", e)
-            self.background = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            self.background.fill((WHITE))
+        self.render = render
+        if not render:
+            self.background = None
+            self.static_layer = None
+        else:
+            self._load_background()
+
+        # Dirty-rect rendering: only push changed regions to the display
+        self.dirty_rects = DIRTY_RECTS
+        self.dirty_tracker = DirtyRectTracker()
 
         # Initialize sounds and sprites in startup()
         self.sounds = None
         self.all_sprites = None
         self.particles = None
         self.brick_wall = None
-        self.ball = None
+        self.bricks = []
         self.paddle = None
 
+    @property
+    def ball(self):
+        """The ball launching, sticky and the other ball effects act on."""
+        return self.balls.primary
+
     def cleanup(self):
         """Prepare data to persist between screens."""
-        print("Cleaning up Game state")
+        self.announce("Cleaning up Game state")
         self.persist['score'] = self.game_stats['score']
         self.persist['won'] = self.won
+        if self.recorder is not None:
+            self.recorder.stop(self.tick)
         return self.persist
 
     def startup(self, persist):
         """Initialize game objects and sounds."""
-        print("Starting Game state")
+        self.announce("Starting Game state")
         self.persist = persist if persist is not None else {}
 
         # Load sounds
         self._load_sounds()
 
+        # Restart the random streams and the input recording for this session
+        self.rng.reseed(self.seed)
+        self.tick = 0
+        self.session += 1
+        if self.rewind is not None:
+            self.rewind.clear()
+        if self.recorder is not None:
+            self.recorder.start(self.rng.seed, self.level, self.sim_clock.time)
+
+        # Clear out whatever the previous game left behind; pooled sprites
+        # go back to their pools
+        self.lifecycle.reset()
+        self.laser_mode = False
+        self.last_laser_time = -self.laser_cooldown
+        self.active_effects.clear(revert=False)
+        self.effects_collected.clear()
+        self.won = False
+
         # Initialize sprite groups
         self.all_sprites = pg.sprite.Group()
-        self.particles = pg.sprite.Group()
+        self.particles = ParticleSystem(rng=self.rng.particles)
 
         # Create game objects
-        self.brick_wall = create_bricks(5, 9)
-        self.all_sprites.add(self.brick_wall)
+        self.brick_wall = self._create_wall()
+        self.bricks = self.brick_wall.sprites()  # the session's wall, indexed by snapshots
+        self.lifecycle.track('all_sprites', self.all_sprites)
+        self.lifecycle.track('brick_wall', self.brick_wall)
+        self.lifecycle.track('particles', self.particles, cull=True)
 
-        self.ball = Ball((255, 0, 0), radius=10, speed=5, sounds=self.sounds)
-        self.all_sprites.add(self.ball)
+        ball = Ball((255, 0, 0), radius=10, speed=5, sounds=self.sounds)
+        self.balls.add(ball)
+        self.all_sprites.add(ball)
 
         self.paddle = Paddle(CYAN, PADDLE_WIDTH, PADDLE_HEIGHT)
         self.paddle.rect.x = (WINDOW_WIDTH - PADDLE_WIDTH) // 2
@@ -131,39 +282,57 @@ class Game(States, MenuManager):
 
         self.ball_launched = False
         self.last_direction = None
+        self.dirty_tracker.invalidate()
+
+    def _create_wall(self):
+        """Build the brick wall for this game's level, or the default wall."""
+        if self.level is None:
+            return create_bricks(5, 9, self.static_layer, self.rng.bricks)
+        return create_level_bricks(levels.load(self.level), self.static_layer)
+
+    def snapshot(self):
+        """Capture the game's current state, see state_manager.snapshot."""
+        return capture(self)
+
+    def restore(self, snapshot):
+        """Return to a snapshot taken earlier in this game."""
+        restore(self, snapshot)
+
+    def sprite_census(self):
+        """
+        Count the live sprites in each of the game's groups (for debugging leaks).
+
+        Shown live in the frame timing overlay (F3), see engine.profiler.
+
+        Returns:
+            dict: Group name to sprite count, plus the in-use/free counts of the
+            laser and power item pools.
+        """
+        census = self.lifecycle.census()
+        census['laser_pool'] = self.laser_pool.stats()
+        census['power_item_pool'] = self.power_item_pool.stats()
+        return census
 
     def _load_sounds(self):
-        """Load all game sounds."""
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        sound_path = os.path.join(base_path, "..", "assets", "sounds")
-
-        self.sounds = {
-            'brick': pg.mixer.Sound(os.path.join(sound_path, "hit_brick.wav")),
-            'paddle': pg.mixer.Sound(os.path.join(sound_path, "hit_paddle.wav")),
-            'life_lost': pg.mixer.Sound(os.path.join(sound_path, "lose_life.wav")),
-            'game_over': pg.mixer.Sound(os.path.join(sound_path, "game_over.wav")),
-            'win': pg.mixer.Sound(os.path.join(sound_path, "win.wav")),
-            'wall': pg.mixer.Sound(os.path.join(sound_path, "wall.wav")),
-            'power_up': pg.mixer.Sound(os.path.join(sound_path, "power_up.wav")),
-            'power_down': pg.mixer.Sound(os.path.join(sound_path, "power_down.wav")),
-            'laser_fire': pg.mixer.Sound(os.path.join(sound_path, "laser_fire.wav")),
-            'sticky': pg.mixer.Sound(os.path.join(sound_path, "sticky.wav")),
-        }
+        """Fetch all game sounds from the shared asset cache (silent ones when not rendering)."""
+        self.sounds = assets.sounds() if self.render else assets.silent_sounds()
 
     def get_event(self, event):
         """Handle input events."""
+        if self.recorder is not None:
+            self.recorder.record(self.tick, event)
         if event.type == pg.QUIT:
             self.quit = True
         elif event.type == pg.KEYDOWN:
             if event.key == pg.K_LEFT:
                 self.last_direction = 'left'
                 if not self.ball_launched and not getattr(self.ball, "sticky", False):
-                    self.ball.launch()
+                    self.ball.launch(self.rng.ball)
                     self.ball_launched = True
             elif event.key == pg.K_RIGHT:
                 self.last_direction = 'right'
                 if not self.ball_launched and not getattr(self.ball, "sticky", False):
-                    self.ball.launch()
+                    self.ball.launch(self.rng.ball)
                     self.ball_launched = True
             elif event.key == pg.K_ESCAPE:
                 self.game_stats['lives'] = 0
@@ -176,81 +345,47 @@ class Game(States, MenuManager):
                 self.won = True
                 self.done = True
                 self.sounds['win'].play()
+            elif event.key == pg.K_r and self.rewind is not None:  # Debug: rewind a second
+                self.rewind.rewind(1.0)
             elif event.key == pg.K_SPACE:
                 if not self.ball_launched and getattr(self.ball, "sticky", False):
                     self.ball.dx = 0
                     self.ball.dy = -self.ball.speed
                     self.ball_launched = True
-                    self.ball.sticky = False
-                    self.active_effects = [ef for ef in self.active_effects if ef[0] != 'sticky']
+                    self.active_effects.stop('sticky')
                 elif self.laser_mode:  # Only fire lasers if in laser mode
                     self._fire_lasers()  # New method to handle laser firing
-            elif event.key == pg.K_1:
-                self._apply_effect_directly('expand')
-            elif event.key == pg.K_2:
-                self._apply_effect_directly('shrink')
-            elif event.key == pg.K_3:
-                self._apply_effect_directly('extra_life')
-            elif event.key == pg.K_4:
-                self._apply_effect_directly('fast_ball')
-            elif event.key == pg.K_5:
-                self._apply_effect_directly('laser')
-            elif event.key == pg.K_6:
-                self._apply_effect_directly('sticky')
-            elif event.key == pg.K_7:
-                self._apply_effect_directly('slow_paddle')
-            elif event.key == pg.K_8:
-                self._apply_effect_directly('reverse_controls')
+            elif event.key in DEBUG_EFFECT_KEYS:
+                self._apply_effect_directly(DEBUG_EFFECT_KEYS[event.key])
         elif event.type == pg.KEYUP:
             if (event.key == pg.K_LEFT and self.last_direction == 'left') or \
                     (event.key == pg.K_RIGHT and self.last_direction == 'right'):
                 self.last_direction = None
 
-    def _apply_effect_directly(self, effect):
+    def _apply_effect_directly(self, name):
         """Debug method to apply effects directly with keys."""
-        now = pg.time.get_ticks()
-        MAX_ACTIVE_EFFECTS = 3
-
-        if len(self.active_effects) >= MAX_ACTIVE_EFFECTS:
-            print(f"Cannot apply '{effect}' - maximum number of effects reached")
+        if len(self.active_effects) >= MAX_DEBUG_EFFECTS:
+            print(f"Cannot apply '{name}' - maximum number of effects reached")
             return
 
-        if effect == 'expand':
-            self.paddle.image = pg.transform.scale(
-                self.paddle.image,
-                (int(self.paddle.rect.width * 1.5), self.paddle.rect.height)
-            )
-            self.paddle.rect = self.paddle.image.get_rect(center=self.paddle.rect.center)
-        elif effect == 'shrink':
-            self.paddle.image = pg.transform.scale(
-                self.paddle.image,
-                (int(self.paddle.rect.width * 0.5), self.paddle.rect.height)
-            )
-            self.paddle.rect = self.paddle.image.get_rect(center=self.paddle.rect.center)
-        elif effect == 'extra_life':
-            self.game_stats['lives'] += 1
-        elif effect == 'fast_ball':
-            self.ball.dx *= 1.5
-            self.ball.dy *= 1.5
-        elif effect == 'laser':
-            self.laser_mode = True
-        elif effect == 'sticky':
-            self.ball.sticky = True
-        elif effect == 'szlow_paddle':
-            self.paddle.slow = True
-        elif effect == 'reverse_controls':
-            self.paddle.reverse = True
-
-        self.active_effects.append((effect, now + 5000))  # 5 second duration
-        sound = 'power_up' if effect in ['expand', 'extra_life', 'laser', 'sticky'] else 'power_down'
-        self.sounds[sound].play()
-
-    def update(self, screen, dt):
-        """Update game state."""
+        effect = self.active_effects.start(name, self.sim_clock.get_ticks())
+        if effect is not None:
+            self.sounds['power_up' if effect.positive else 'power_down'].play()
+
+    def update(self, dt=1 / BASE_FPS):
+        """Advance the game by one fixed simulation step of dt seconds."""
+        if self.autopilot is not None:
+            self.autopilot.step()
+        self.sim_clock.advance(dt)
+        self.tick += 1
+
         # Handle collisions
+        start = profiler.start()
         self._handle_collisions()
+        profiler.stop('collisions', start)
 
         # Update paddle movement with possible reverse controls
+        start = profiler.start()
         move_speed = 5 if getattr(self.paddle, 'slow', False) else 8
         if self.last_direction == 'left':
             direction = -1  # Left
@@ -259,28 +394,34 @@ class Game(States, MenuManager):
         else:
             direction = 0
 
-        if direction != 0:
-            self.paddle.move(direction, move_speed)
+        self.paddle.move(direction, move_speed * frames_for(dt))
+        profiler.stop('movement', start)
 
         # Update game objects if game is still running
         if not self.done:
-            self.ball.update()
-            self.particles.update()
-            self.power_items.update()
-            self._update_lasers()
+            start = profiler.start()
+            self._move_balls(dt)
+            profiler.stop('movement', start)
+            start = profiler.start()
+            self.particles.update(dt)
+            self.power_items.update(dt)
+            self._update_lasers(dt)
+            self.lifecycle.cull()
 
             # Check for ball loss
-            if self.ball.rect.bottom >= WINDOW_HEIGHT:
-                self._handle_ball_loss()
+            self._drop_fallen_balls()
 
             # Check for win condition
             if len(self.brick_wall) == 0 and not self.done:
                 self.won = True
                 self.done = True
                 self.sounds['win'].play()
+            profiler.stop('sprites', start)
 
-            # Update active effects
-            self._update_active_effects()
+            # End effects that ran out
+            start = profiler.start()
+            self.active_effects.expire(self.sim_clock.get_ticks())
+            profiler.stop('effects', start)
           
             # Keep sticky ball attached to paddle before launch
             if getattr(self.ball, 'sticky', False) and not self.ball_launched:
@@ -291,125 +432,193 @@ class Game(States, MenuManager):
                     self.ball.rect.centerx = self.paddle.rect.centerx
                 self.ball.rect.bottom = self.paddle.rect.top
 
-        # Draw everything
-        self.draw(screen)
+        if self.rewind is not None:
+            self.rewind.record()
 
     def _fire_lasers(self):
         """Fire lasers from paddle when space is pressed in laser mode."""
-        now = pg.time.get_ticks()
+        now = self.sim_clock.get_ticks()
         if now - self.last_laser_time >= self.laser_cooldown:
-            left_laser = Laser(self.paddle.rect.left + 5, self.paddle.rect.top)
-            right_laser = Laser(self.paddle.rect.right - 5, self.paddle.rect.top)
+            left_laser = self.laser_pool.acquire(self.paddle.rect.left + 5, self.paddle.rect.top)
+            right_laser = self.laser_pool.acquire(self.paddle.rect.right - 5, self.paddle.rect.top)
             self.lasers.add(left_laser, right_laser)
             self.all_sprites.add(left_laser, right_laser)
             self.last_laser_time = now
             self.sounds['laser_fire'].play()
             
-    def _update_lasers(self):
+    def _update_lasers(self, dt=1 / BASE_FPS):
         """Update laser positions and handle collisions."""
         # Update all lasers (this makes them move upward)
-        self.lasers.update()
-
-        # Check for laser-brick collisions
-        hits = pg.sprite.groupcollide(
-            self.lasers,
-            self.brick_wall,
-            True,  # Remove laser on collision
-            True  # Remove brick on collision
-        )
+        self.lasers.update(dt)
 
-        # Handle collisions
-        for laser, hit_bricks in hits.items():
-            self.game_stats['score'] += 100 * len(hit_bricks)
+        # Check for laser-brick collisions through the wall's grid index
+        for laser in self.lasers.sprites():
+            hit_bricks = self.brick_wall.query(laser.rect)
+            if not hit_bricks:
+                continue
+            laser.kill()  # Remove laser on collision
             for brick in hit_bricks:
-                for _ in range(8):
-                    self.particles.add(Debris(brick.rect.center, brick.color))
+                if not brick.hit():
+                    continue
+                self.game_stats['score'] += 100
+                self.dirty_tracker.mark(brick.rect)
+                brick.kill()  # Remove brick on collision
+                self.particles.add(*[Debris(brick.rect.center, brick.color) for _ in range(8)])
             self.sounds['brick'].play()
 
-    def _update_active_effects(self):
-        """Check and remove expired effects."""
-        ## Lasers Fire
-        current_time = pg.time.get_ticks()
-        for effect, end_time in self.active_effects[:]:
-            if effect == "sticky":
-                continue
-            if current_time > end_time:
-                self._remove_effect(effect)
-                self.active_effects.remove((effect, end_time))
-
-    def _remove_effect(self, effect):
-        """Revert an effect when it expires."""
-        if effect == 'expand':
-            self.paddle.reset_size()
-        elif effect == 'shrink':
-            self.paddle.reset_size()
-        elif effect == 'fast_ball':
-            self.ball.reset_speed()
-        elif effect == 'laser':
-            self.laser_mode = False
-        elif effect == 'sticky':
-            self.ball.sticky = False
-        elif effect == 'slow_paddle':
-            self.paddle.slow = False
-        elif effect == 'reverse_controls':
-            self.paddle.reverse = False
-
     def _handle_collisions(self):
-        """Handle all collision detection and response."""
+        """
+        Handle collisions that are already overlapping at the start of a step.
+
+        The balls' own movement is swept (see _move_balls), so this only catches
+        overlaps created by something else, e.g. the paddle moving into a ball
+        or a ball placed on a brick. It also collects power items.
+        """
+        # One overlap test of every ball against the nearby bricks and the paddle
+        bricks = self._bricks_near(0)
+        overlap = self.balls.overlapping([brick.rect for brick in bricks] + [self.paddle.rect])
+        balls = list(self.balls.members)
+
         # Brick collisions
-        hit_bricks = pg.sprite.spritecollide(self.ball, self.brick_wall, False)
+        brick_overlap = overlap[:, :-1]
+        hit_bricks = [bricks[i] for i in np.flatnonzero(brick_overlap.any(axis=0))]
         if hit_bricks:
-            self.ball.dy *= -1  # Bounce
+            for row in np.flatnonzero(brick_overlap.any(axis=1)):
+                balls[row].dy *= -1  # Bounce
             for brick in hit_bricks:
-                # Create particles
-                for _ in range(8):
-                    particle = Debris(brick.rect.center, brick.color)
-                    self.particles.add(particle)
-
-                # 30% chance to spawn power item
-                if random.random() < 0.3:
-                    item_type = random.choice([
-                        'expand', 'shrink', 'extra_life', 'fast_ball',
-                        'laser', 'sticky', 'slow_paddle', 'reverse_controls'
-                    ])
-                    item = PowerItem(brick.rect.centerx, brick.rect.centery, item_type)
-                    self.power_items.add(item)
-                    self.all_sprites.add(item)
-
-                # Remove brick and update score
-                self.brick_wall.remove(brick)
-                self.all_sprites.remove(brick)
-                self.game_stats['score'] += 100
+                self._hit_brick(brick)
             self.sounds['brick'].play()
 
         # Power item collection
-        for item in pg.sprite.spritecollide(self.paddle, self.power_items, True):
-            effect = item.apply_effect(self.paddle, self.ball, self)
-            if effect:
-                self.active_effects.append((effect, pg.time.get_ticks() + 5000))
-                sound = 'power_up' if effect in ['expand', 'extra_life', 'laser', 'sticky'] else 'power_down'
-                self.sounds[sound].play()
-
-        # Paddle collision
-        if pg.sprite.collide_rect(self.ball, self.paddle):
-            # Handle sticky ball
-            if getattr(self.ball, 'sticky', False):
-                self.ball.dx = 0
-                self.ball.dy = 0
-                offset = self.ball.rect.centerx - self.paddle.rect.x
-                self.ball.offset_x = max(0, min(offset, self.paddle.rect.width))
-                self.ball.rect.bottom = self.paddle.rect.top
-                self.ball_launched = False
-                self.sounds['sticky'].play()
+        for item in pg.sprite.spritecollide(self.paddle, self.power_items, False):
+            name = item.apply_effect(self.paddle, self.ball, self)
+            item.kill()  # back to its pool once the effect has been read
+            if name:
+                effect = EFFECTS[name]
+                self.effects_collected[name] += 1
+                self.active_effects.track(effect, self.sim_clock.get_ticks())
+                self.sounds['power_up' if effect.positive else 'power_down'].play()
+
+        # Paddle collision, only while a ball is coming down onto it
+        for row in np.flatnonzero(overlap[:, -1]):
+            ball = balls[row]
+            if getattr(ball, 'sticky', False):
+                self._ball_hit_paddle(ball)
+            elif ball.dy > 0:
+                ball.dy *= -1
+                self._ball_hit_paddle(ball)
+
+    def _bricks_near(self, frames):
+        """Bricks any ball can reach within a step of the given length in frames."""
+        bricks = {}
+        for ball in self.balls.members:
+            reach = round((abs(ball.dx) + abs(ball.dy)) * frames) + 2
+            bricks.update(dict.fromkeys(self.brick_wall.query(ball.rect.inflate(2 * reach, 2 * reach))))
+        return list(bricks)
+
+    def _move_balls(self, dt):
+        """Move all balls with swept collision against bricks and paddle, then apply the hits."""
+        obstacles = self._bricks_near(frames_for(dt))
+        obstacles.append(self.paddle)
+        hit_bricks = {}
+        for ball, sprite, axis in self.balls.move(dt, obstacles):
+            if sprite is self.paddle:
+                # The sweep already reflected the ball; only a hit on the top face counts
+                if axis == 'y' and ball.dy <= 0:
+                    self._ball_hit_paddle(ball)
             else:
-                self.ball.dy *= -1
-                self.sounds['paddle'].play()
-                # Add directional influence based on where ball hits paddle
-                offset = (self.ball.rect.centerx - self.paddle.rect.centerx) / (self.paddle.rect.width / 2)
-                self.ball.dx += offset * 2
-                # Cap speed
-                max_speed = self.ball.speed
-                self.ball.dx = max(-max_speed, min(self.ball.dx, max_speed))
+                hit_bricks[sprite] = None  # two balls can hit the same brick
+        for brick in hit_bricks:
+            self._hit_brick(brick)
+        if hit_bricks:
+            self.sounds['brick'].play()
+
+    def _drop_fallen_balls(self):
+        """Remove balls that fell off the bottom; a life is lost with the last one."""
+        fallen = self.balls.fallen(WINDOW_HEIGHT)
+        if not fallen:
+            return
+        if len(fallen) < len(self.balls):
+            for ball in fallen:
+                ball.kill()
+            return
+        # Keep the first ball to serve again
+        for ball in fallen:
+            if ball is not self.ball:
+                ball.kill()
+        self._handle_ball_loss()
+
+    def add_balls(self, count):
+        """
+        Split extra balls off the main ball, fanned out around its direction.
+
+        Args:
+            count (int): Number of balls to add.
+        """
+        source = self.ball
+        direction = pg.Vector2(source.dx, source.dy)
+        if direction.length() == 0:
+            direction = pg.Vector2(0, -source.speed)
+        for i in range(count):
+            ball = Ball((255, 0, 0), radius=10, speed=source.speed, sounds=self.sounds)
+            ball.rect.center = source.rect.center
+            ball.init_position()
+            angle = 25 * (i // 2 + 1) * (1 if i % 2 == 0 else -1)
+            ball.dx, ball.dy = direction.rotate(angle)
+            self.balls.add(ball)
+            self.all_sprites.add(ball)
+
+    def _hit_brick(self, brick):
+        """A ball hit a brick: take one of its hit points and destroy it at zero."""
+        if brick.hit():
+            self._destroy_brick(brick)
+
+    def _destroy_brick(self, brick):
+        """Remove a brick hit by the ball: debris, power-up roll and score."""
+        # Create particles
+        self.particles.add(*[Debris(brick.rect.center, brick.color) for _ in range(8)])
+
+        # Chance to spawn a power item
+        if self.rng.powerups.random() < self.config.drop_chance:
+            item_type = self._roll_effect()
+            item = self.power_item_pool.acquire(brick.rect.centerx, brick.rect.centery, item_type)
+            self.power_items.add(item)
+            self.all_sprites.add(item)
+
+        # Remove brick and update score
+        self.dirty_tracker.mark(brick.rect)
+        brick.kill()
+        self.game_stats['score'] += 100
+
+    def _roll_effect(self):
+        """Pick the effect of a dropped power item, weighted by the config's effect_weights."""
+        names = list(EFFECTS)
+        effect_weights = self.config.effect_weights
+        if effect_weights is None:
+            return self.rng.powerups.choice(names)
+        weights = [effect_weights.get(name, 0) for name in names]
+        return self.rng.powerups.choices(names, weights)[0]
+
+    def _ball_hit_paddle(self, ball=None):
+        """Response to a ball (the main ball by default) landing on the paddle, after its vertical bounce."""
+        ball = ball if ball is not None else self.ball
+        # Handle sticky ball
+        if getattr(ball, 'sticky', False):
+            ball.dx = 0
+            ball.dy = 0
+            offset = ball.rect.centerx - self.paddle.rect.x
+            ball.offset_x = max(0, min(offset, self.paddle.rect.width))
+            ball.rect.bottom = self.paddle.rect.top
+            self.ball_launched = False
+            self.sounds['sticky'].play()
+        else:
+            self.sounds['paddle'].play()
+            # Add directional influence based on where ball hits paddle
+            offset = (ball.rect.centerx - self.paddle.rect.centerx) / (self.paddle.rect.width / 2)
+            ball.dx += offset * 2
+            # Cap speed
+            max_speed = ball.speed
+            ball.dx = max(-max_speed, min(ball.dx, max_speed))
 
     def _handle_ball_loss(self):
         """Handle logic when ball is lost."""
@@ -424,6 +633,7 @@ class Game(States, MenuManager):
 
     def _reset_ball_and_paddle(self):
         """Reset ball and paddle to starting positions."""
+        self.active_effects.clear()
         self.paddle.reset_size()
         self.paddle.rect.x = (WINDOW_WIDTH - PADDLE_WIDTH) // 2
         self.paddle.rect.y = WINDOW_HEIGHT - 80
@@ -433,40 +643,56 @@ class Game(States, MenuManager):
         self.ball_launched = False
         self.last_direction = None
         self.laser_mode = False
-        self.active_effects = []
-
-    def draw(self, screen):
-        """Draw all game elements."""
-        # Draw background and walls
-        screen.blit(self.background, (0, 0))
-        pg.draw.rect(screen, GRAY, (0, 0, WINDOW_WIDTH, 50))  # Top
-        pg.draw.rect(screen, GRAY, (0, 0, WALL_WIDTH, WINDOW_HEIGHT))  # Left
-        pg.draw.rect(screen, GRAY, (WINDOW_WIDTH - WALL_WIDTH, 0, WALL_WIDTH, WINDOW_HEIGHT))  # Right
-
-        # Draw all sprites
-        self.all_sprites.draw(screen)
-        self.particles.draw(screen)
-
-        # Draw HUD
-        font = pg.font.SysFont(FONT, 30)
-        lives_text = font.render(f"Lives: {self.game_stats['lives']}", True, (0, 0, 0))
-        screen.blit(lives_text, (20, 10))
-
-        score_text = font.render(f"Score: {self.game_stats['score']}", True, (0, 0, 0))
+
+    def _load_background(self):
+        """Load the background and composite the static layer."""
+        try:
+            self.background = assets.image("game_bg", (WINDOW_WIDTH, WINDOW_HEIGHT))
+        except Exception as e:
+            print("Failed to load background image:", e)
+            self.background = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.background.fill((WHITE))
+        self.static_layer = self._build_static_layer()
+
+    def _build_static_layer(self):
+        """Composite the background and the three walls into one surface."""
+        layer = self.background.copy()
+        pg.draw.rect(layer, GRAY, (0, 0, WINDOW_WIDTH, 50))  # Top
+        pg.draw.rect(layer, GRAY, (0, 0, WALL_WIDTH, WINDOW_HEIGHT))  # Left
+        pg.draw.rect(layer, GRAY, (WINDOW_WIDTH - WALL_WIDTH, 0, WALL_WIDTH, WINDOW_HEIGHT))  # Right
+        return layer
+
+    def _moving_blits(self, alpha):
+        """Blit list for everything that can move or change between frames."""
+        blits = [
+            (sprite.image, sprite.render_pos(alpha) if isinstance(sprite, Movable) else sprite.rect)
+            for sprite in self.all_sprites
+        ]
+        blits.extend(self.particles.blits(alpha))
+        blits.extend(self._hud_blits())
+        return blits
+
+    def _hud_blits(self):
+        """Blit list for the lives, score and active effect texts."""
+        font = get_font(FONT, 30)
+        lives_text = render_text(font, f"Lives: {self.game_stats['lives']}", (0, 0, 0))
+        blits = [(lives_text, (20, 10))]
+
+        score_text = render_text(font, f"Score: {self.game_stats['score']}", (0, 0, 0))
         score_rect = score_text.get_rect(topright=(WINDOW_WIDTH - 20, 10))
-        screen.blit(score_text, score_rect)
+        blits.append((score_text, score_rect))
 
-        # Draw active effects
+        # Active effects
         if self.active_effects:
-            effect_font = pg.font.SysFont(FONT, 24)
+            effect_font = get_font(FONT, 24)
             y = 18
             spacing = 20
 
             effect_surfaces = []
             for effect, _ in self.active_effects:
-                color = (0, 200, 0) if effect in ['expand', 'extra_life', 'laser', 'sticky'] else (200, 0, 0)
+                color = (0, 200, 0) if EFFECTS[effect].positive else (200, 0, 0)
                 text = effect.replace('_', ' ').title()
-                surface = effect_font.render(text, True, color)
+                surface = render_text(effect_font, text, color)
                 effect_surfaces.append(surface)
 
             total_width = sum(s.get_width() for s in effect_surfaces) + spacing * (len(effect_surfaces) - 1)
@@ -475,5 +701,46 @@ class Game(States, MenuManager):
             x = start_x
             for surface in effect_surfaces:
                 rect = surface.get_rect(midtop=(x + surface.get_width() // 2, y))
-                screen.blit(surface, rect)
+                blits.append((surface, rect))
                 x += surface.get_width() + spacing
+        return blits
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw all game elements.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            alpha (float): Fraction of a step since the last update, used to
+                interpolate moving sprites between their last two positions.
+
+        Returns:
+            list or None: In dirty-rect mode, the screen regions that changed
+            this frame; None when the whole screen must be pushed.
+        """
+        if self.dirty_rects and not self.dirty_tracker.full_redraw:
+            return self._draw_dirty(screen, alpha)
+
+        # Draw background, walls and bricks
+        screen.blit(self.brick_wall.layer, (0, 0))
+
+        # Draw moving sprites and HUD
+        drawn = screen.blits(self._moving_blits(alpha))
+        if self.dirty_rects:
+            return self.dirty_tracker.commit(drawn)
+        return None
+
+    def _draw_dirty(self, screen, alpha):
+        """
+        Redraw only what changed since the last frame.
+
+        Restores the baked wall layer under last frame's moving sprites, HUD
+        and destroyed bricks, then draws the moving sprites and HUD at their
+        new positions.
+        """
+        erased = self.dirty_tracker.take_erase_list()
+        for rect in erased:
+            screen.blit(self.brick_wall.layer, rect, rect)
+
+        drawn = screen.blits(self._moving_blits(alpha))
+        return self.dirty_tracker.commit(drawn, erased)
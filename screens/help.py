@@ -2,7 +2,10 @@ import os
 
 import pygame as pg
 
-from config import LINE_SPACING, WINDOW_WIDTH, WINDOW_HEIGHT, FONT, FONT_SIZE, BLACK, WHITE, IMAGE_PATHS
+from config import LINE_SPACING, WINDOW_WIDTH, WINDOW_HEIGHT, FONT, FONT_SIZE, BLACK, WHITE
+from engine.assets import assets
+from engine.fonts import get_font, render_text
+from engine.static_layer import StaticLayer
 from state_manager.menu_manager import MenuManager
 from state_manager.states import States
 
@@ -26,16 +29,17 @@ class Help(States, MenuManager):
 
         # Load background using centralized path from settings.json
         try:
-            image_path = IMAGE_PATHS["blurred_bg"]
-            self.background = pg.image.load(image_path).convert()
-            self.background = pg.transform.scale(self.background, (WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.background = assets.image("blurred_bg", (WINDOW_WIDTH, WINDOW_HEIGHT))
         except Exception as e:
             print("Failed to load background image:", e)
             self.background = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
             self.background.fill((WHITE))
 
+        # Instructions and illustrations never change, compose them once
+        self.static_layer = StaticLayer(self._compose_static)
+
     def startup(self, persist=None):
-        print("Starting Help Screen")
+        self.announce("Starting Help Screen")
         self.persist = persist
 
     def get_event(self, event):
@@ -43,17 +47,22 @@ class Help(States, MenuManager):
             self.quit = True
         self.get_event_menu(event)
 
-    def update(self, screen, dt):
+    def update(self, dt):
         self.update_menu()
-        self.draw(screen)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        screen.blit(self.static_layer.get(self.screen_rect.size), (0, 0))
+        self.draw_menu_highlight(screen)
+
+    def _compose_static(self):
+        """Compose the background, instructions, illustrations and Back button once."""
+        screen = pg.Surface(self.screen_rect.size)  # the layer being composed
         screen.blit(self.background, (0, 0))
-        font = pg.font.SysFont(FONT, FONT_SIZE)
-        small_font = pg.font.SysFont(FONT, 28)
+        font = get_font(FONT, FONT_SIZE)
+        small_font = get_font(FONT, 28)
 
         # Title at Top
-        title_text = font.render("Help", True, BLACK)
+        title_text = render_text(font, "Help", BLACK)
         screen.blit(title_text, title_text.get_rect(center=(WINDOW_WIDTH // 2, 80)))
 
         # Help instructions
@@ -117,11 +126,13 @@ class Help(States, MenuManager):
             draw_func = line_drawers.get(i, default_draw)
             text_x = draw_func(y)
 
-            text = small_font.render(line, True, BLACK)
+            text = render_text(small_font, line, BLACK)
             screen.blit(text, (text_x, y))
 
         # Draw the Back Button 
-        self.draw_menu(screen)
+        for i in range(len(self.buttons)):
+            self.draw_button(screen, i, False)
+        return screen
 
     def cleanup(self):
         """
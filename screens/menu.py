@@ -2,7 +2,10 @@ import os
 
 import pygame as pg
 
-from config import WHITE, PINK, LINE_SPACING, FONT, FONT_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, IMAGE_PATHS
+from config import WHITE, PINK, LINE_SPACING, FONT, FONT_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
+from engine.assets import assets
+from engine.fonts import get_font, render_text
+from engine.static_layer import StaticLayer
 from state_manager.menu_manager import MenuManager
 from state_manager.states import States
 
@@ -50,14 +53,15 @@ class Menu(States, MenuManager):
 
         # Background Image on Start Screen
         try:
-            image_path = IMAGE_PATHS["main_bg"]
-            self.background = pg.image.load(image_path).convert()
-            self.background = pg.transform.scale(self.background, (WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.background = assets.image("main_bg", (WINDOW_WIDTH, WINDOW_HEIGHT))
         except Exception as e:
             print("Failed to load background image:", e)
             self.background = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
             self.background.fill((WHITE)) 
 
+        # Everything but the highlighted button, composed once
+        self.static_layer = StaticLayer(self._compose_static)
+
     def cleanup(self):
         """
         Perform cleanup operations when leaving the Main Menu state.
@@ -67,7 +71,7 @@ class Menu(States, MenuManager):
         - Save menu configuration
         - Stop menu-specific audio
         """
-        print('Cleaning Up Main Menu')
+        self.announce('Cleaning Up Main Menu')
 
     def startup(self, persist):
         """
@@ -78,7 +82,7 @@ class Menu(States, MenuManager):
         - Initialize menu animations
         - Load menu assets
         """
-        print('Starting Up Main Menu')
+        self.announce('Starting Up Main Menu')
         self.persist = persist
 
     def get_event(self, event):
@@ -96,41 +100,47 @@ class Menu(States, MenuManager):
             self.quit = True
         self.get_event_menu(event)
 
-    def update(self, screen, dt):
+    def update(self, dt):
         """
-        Update the menu state each frame.
+        Update the menu state each simulation step.
 
         Args:
-            screen (pygame.Surface): The display surface to render to
-            dt (float): Time elapsed since last frame (delta time)
+            dt (float): Length of the simulation step in seconds
 
         Responsibilities:
         - Updates menu state through MenuManager
-        - Triggers screen redraw
         """
         self.update_menu()
-        self.draw(screen)
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Render all menu elements to the display surface.
 
         Args:
             screen (pygame.Surface): The target surface for rendering
+            alpha (float): Interpolation factor between steps (unused, nothing moves)
 
         Draws:
-        - Solid white background
-        - Menu options through MenuManager's draw functionality
+        - The cached static layer (background, title and buttons)
+        - The highlighted button through MenuManager
         """
-        screen.blit(self.background, (0, 0))
-        title_font = pg.font.SysFont(FONT, FONT_SIZE + 40, bold=True)
+        screen.blit(self.static_layer.get(self.screen_rect.size), (0, 0))
+        self.draw_menu_highlight(screen)
+
+    def _compose_static(self):
+        """Compose the background, the title with its drop shadow and the buttons."""
+        layer = pg.Surface(self.screen_rect.size)
+        layer.blit(self.background, (0, 0))
+        title_font = get_font(FONT, FONT_SIZE + 40, bold=True)
 
         # Text Drop Shadow 
-        shadow = title_font.render("BREAKOUT", True, (100, 100, 100))
-        screen.blit(shadow, shadow.get_rect(center=(WINDOW_WIDTH // 2 + 3, 103)))
+        shadow = render_text(title_font, "BREAKOUT", (100, 100, 100))
+        layer.blit(shadow, shadow.get_rect(center=(WINDOW_WIDTH // 2 + 3, 103)))
 
         # Title Text Color and Position
-        title_text = title_font.render("BREAKOUT", True, (PINK))
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 100))
-        screen.blit(title_text, title_text.get_rect(center=(WINDOW_WIDTH // 2, 100)))
-        self.draw_menu(screen)
+        title_text = render_text(title_font, "BREAKOUT", (PINK))
+        layer.blit(title_text, title_text.get_rect(center=(WINDOW_WIDTH // 2, 100)))
+
+        for i in range(len(self.buttons)):
+            self.draw_button(layer, i, False)
+        return layer
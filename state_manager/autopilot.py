@@ -0,0 +1,149 @@
+import pygame as pg
+
+from config import WINDOW_WIDTH, TICK_RATE
+from objects.ball import WALL_WIDTH, TOP_BOUNDARY
+from objects.movable import frames_for
+"""
+A scripted player that never misses, for soak tests, benchmarks and demo loops.
+
+Instead of simulating the ball forward frame by frame, landing() works out
+where a ball will reach the paddle's height in closed form: the ball moves in
+a straight line, and bouncing between the side walls is the same as moving on
+through mirrored copies of the field, so the landing x is the straight-line x
+folded back into the field. A bounce off the top boundary only lengthens the
+trip. That is a handful of float operations per ball, so the Autopilot can
+re-aim every step for next to nothing.
+
+Bricks are not part of the prediction; the path changes when the ball hits one
+and the next step's prediction picks the new path up. The Autopilot plays by
+pressing keys: its events go through Game.get_event() like a player's, so a
+recorded autopilot session replays like any other.
+
+    game = Game(seed=1, autopilot=True)  # or drive one yourself:
+    pilot = Autopilot(game)
+    runner.step(pilot.events())
+"""
+
+# Paddle speed in pixels per frame, as in Game.update()
+PADDLE_SPEED = 8
+SLOW_PADDLE_SPEED = 5
+
+
+def landing(rect, dx, dy, floor, left=WALL_WIDTH, right=WINDOW_WIDTH - WALL_WIDTH, top=TOP_BOUNDARY):
+    """
+    Predict where a ball's bottom edge will reach the height floor.
+
+    Args:
+        rect (pygame.Rect): The ball's rect.
+        dx (float): Horizontal velocity in pixels per frame.
+        dy (float): Vertical velocity in pixels per frame.
+        floor (float): Height to predict the landing at (the paddle's top).
+        left (float): Left wall; the ball's left edge stays right of it.
+        right (float): Right wall; the ball's right edge stays left of it.
+        top (float): Top boundary the ball bounces down from.
+
+    Returns:
+        tuple: (center x at landing, frames until then), or None if the ball
+        is not moving vertically or is already below floor on its way down.
+    """
+    if dy > 0:
+        frames = (floor - rect.bottom) / dy
+        if frames < 0:
+            return None
+    elif dy < 0:
+        frames = (rect.top - top + floor - rect.height - top) / -dy
+    else:
+        return None
+
+    # Fold the straight-line position back between the walls
+    span = right - left - rect.width
+    if span <= 0:
+        return rect.centerx, frames
+    x = (rect.left - left + dx * frames) % (2 * span)
+    if x > span:
+        x = 2 * span - x
+    return left + x + rect.width / 2, frames
+
+
+class Autopilot:
+    """
+    Plays a Game by sending it the key events a player would.
+
+    Each step it picks the ball that will come down first, moves the paddle
+    under where that ball will land and stops once it is closer than half a
+    step's movement. It launches waiting balls, releases sticky ones and fires
+    lasers whenever they are ready. Reversed controls are accounted for.
+
+    Attributes:
+        game (Game): The game being played.
+        aim (float): Where on the paddle to catch the ball, as a fraction of
+            its half width from the center (negative is left). Off-center
+            catches steer the ball, see Game._ball_hit_paddle().
+        step_time (float): Length of one simulation step in seconds.
+        target (float): Paddle center x the autopilot last aimed for, or None.
+    """
+
+    def __init__(self, game, aim=0.0, tick_rate=TICK_RATE):
+        """
+        Args:
+            game (Game): The game to play.
+            aim (float): Catch point on the paddle, -1 (left end) to 1 (right end).
+            tick_rate (int): Simulation steps per second the game runs at.
+        """
+        self.game = game
+        self.aim = aim
+        self.step_time = 1.0 / tick_rate
+        self.target = None
+
+    def events(self):
+        """
+        Decide this step's input.
+
+        Returns:
+            list: pygame KEYDOWN/KEYUP events to deliver before the next step.
+        """
+        game = self.game
+        paddle = game.paddle
+        ball = game.ball
+        events = []
+
+        if not game.ball_launched:
+            if ball.sticky:
+                events.append(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+            else:
+                events.append(pg.event.Event(pg.KEYDOWN, key=pg.K_LEFT))  # any direction launches
+                events.append(pg.event.Event(pg.KEYUP, key=pg.K_LEFT))
+            self.target = None
+            return events
+
+        if game.laser_mode and game.sim_clock.get_ticks() - game.last_laser_time >= game.laser_cooldown:
+            events.append(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+
+        # Aim for the ball that comes down first
+        floor = paddle.rect.top
+        best = None
+        for member in game.balls.members:
+            landed = landing(member.rect, member.dx, member.dy, floor)
+            if landed is not None and (best is None or landed[1] < best[1]):
+                best = landed
+        self.target = target = best[0] - self.aim * paddle.rect.width / 2 if best is not None else None
+
+        wanted = None
+        if target is not None:
+            speed = (SLOW_PADDLE_SPEED if paddle.slow else PADDLE_SPEED) * frames_for(self.step_time)
+            offset = target - paddle.rect.centerx
+            if abs(offset) > speed / 2:
+                wanted = 'right' if (offset > 0) != paddle.reverse else 'left'
+
+        held = game.last_direction
+        if wanted != held:
+            if held is not None:
+                events.append(pg.event.Event(pg.KEYUP, key=pg.K_LEFT if held == 'left' else pg.K_RIGHT))
+            if wanted is not None:
+                events.append(pg.event.Event(pg.KEYDOWN, key=pg.K_LEFT if wanted == 'left' else pg.K_RIGHT))
+        return events
+
+    def step(self):
+        """Deliver this step's input to the game."""
+        for event in self.events():
+            self.game.get_event(event)
@@ -0,0 +1,316 @@
+import contextlib
+import multiprocessing
+import os
+
+import numpy as np
+import pygame as pg
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, TICK_RATE
+from state_manager.states import new_game_stats
+"""
+Batch environment for training paddle-control agents.
+
+BatchEnv runs N independent game sessions in one process, one seed each, and
+steps them all with one action array per call. Each session is a plain
+screens.game.Game created with render=False, so the rules are exactly the
+game's (100 points a brick, power-ups and effects, life loss) while nothing is
+drawn, no sound is played and no display or mixer is needed. Observations,
+rewards and done flags come back as NumPy arrays:
+
+    env = BatchEnv(seeds=range(64))
+    obs = env.reset()
+    while training:
+        obs, rewards, dones, info = env.step(policy(obs))
+
+A session that ends is started again straight away with the next seed of its
+own sequence; its done flag is set for that step and info holds its final
+score, lives and result. With auto_reset=False a finished session is left
+alone instead, so each seed is played exactly once (batch simulation runs).
+
+Every session runs its own physics, so one BatchEnv does a fixed number of
+session steps per second on its core whatever N is. ParallelBatchEnv has the
+same interface and splits the sessions over worker processes, each stepping a
+BatchEnv of its own, so throughput grows with the number of cores:
+
+    env = ParallelBatchEnv(seeds=range(256), workers=8)
+"""
+
+# Actions
+NOOP, LEFT, RIGHT, FIRE = range(4)
+
+# Observation columns, positions and sizes scaled to 0..1 by the window size
+OBS_FIELDS = ('paddle_x', 'paddle_width', 'ball_x', 'ball_y', 'ball_dx', 'ball_dy', 'ball_launched',
+              'balls', 'lives', 'bricks_left', 'laser_mode', 'sticky')
+OBS_SIZE = len(OBS_FIELDS)
+
+_DIRECTION_KEYS = {LEFT: pg.K_LEFT, RIGHT: pg.K_RIGHT}
+_HELD = {'left': LEFT, 'right': RIGHT}
+
+
+def episode_seed(seed, episode):
+    """Seed of a session's nth episode, derived from its base seed."""
+    return int(np.random.SeedSequence((seed, episode)).generate_state(1, np.uint64)[0] >> 1)
+
+
+class BatchEnv:
+    """
+    N headless Game sessions stepped together in this process.
+
+    Attributes:
+        seeds (list): Base seed of each session.
+        games (list): The Game of each session.
+        frame_skip (int): Simulation steps per step() call, repeating the action.
+        max_ticks (int): Steps after which an episode is cut off, or None.
+        life_penalty (float): Subtracted from the reward for each life lost.
+        episodes (numpy.ndarray): Episodes started per session.
+        auto_reset (bool): Restart sessions as soon as they finish.
+        active (numpy.ndarray): Sessions still being stepped (bool per session).
+    """
+
+    def __init__(self, seeds, level=None, frame_skip=1, max_ticks=None, life_penalty=0.0, tick_rate=TICK_RATE,
+                 auto_reset=True, game_options=None):
+        """
+        Args:
+            seeds (iterable): One int seed per session; N is its length.
+            level (str): Level under assets/levels to play, default wall when None.
+            frame_skip (int): Simulation steps per step() call.
+            max_ticks (int): Cut episodes off after this many simulation steps.
+            life_penalty (float): Reward subtracted per life lost.
+            tick_rate (int): Simulation steps per second.
+            auto_reset (bool): Restart a finished session right away; when
+                False it stays finished and is skipped by later steps.
+            game_options (dict): Extra keyword arguments for every Game, e.g.
+                config, a BalanceConfig.
+        """
+        from screens.game import Game
+        pg.font.init()  # the game's menu code builds fonts; no display or mixer is needed
+        self.seeds = [int(seed) for seed in seeds]
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ticks
+        self.life_penalty = life_penalty
+        self.step_time = 1.0 / tick_rate
+        self.auto_reset = auto_reset
+        self.games = [Game(level=level, seed=seed, render=False, **(game_options or {})) for seed in self.seeds]
+        for game in self.games:
+            game.verbose = False  # no startup line per episode
+        self.episodes = np.zeros(len(self.games), dtype=np.int64)
+        self.active = np.ones(len(self.games), dtype=bool)
+        self._scores = np.zeros(len(self.games))
+        self._lives = np.zeros(len(self.games))
+
+    def __len__(self):
+        return len(self.games)
+
+    def reset(self):
+        """
+        Start every session over from its base seed.
+
+        Returns:
+            numpy.ndarray: (N, OBS_SIZE) float32 observations.
+        """
+        self.episodes[:] = 0
+        self.active[:] = True
+        for i in range(len(self.games)):
+            self._start(i)
+        return self.observations()
+
+    def step(self, actions):
+        """
+        Apply one action per session and advance each by frame_skip steps.
+
+        Args:
+            actions (array-like): N actions out of NOOP, LEFT, RIGHT, FIRE.
+
+        Returns:
+            tuple: observations (N, OBS_SIZE) float32, rewards (N,) float32,
+            dones (N,) bool, and info, a dict of (N,) arrays 'score', 'lives'
+            and 'won' giving each finished episode's result.
+        """
+        actions = np.asarray(actions).tolist()
+        n = len(self.games)
+        rewards = np.zeros(n, dtype=np.float32)
+        dones = np.zeros(n, dtype=bool)
+        info = {'score': np.zeros(n, dtype=np.int64), 'lives': np.zeros(n, dtype=np.int64),
+                'won': np.zeros(n, dtype=bool)}
+
+        for i, (game, action) in enumerate(zip(self.games, actions)):
+            if not self.active[i]:
+                continue
+            self._act(game, action)
+            for _ in range(self.frame_skip):
+                game.update(self.step_time)
+                if game.done:
+                    break
+            stats = game.game_stats
+            rewards[i] = (stats['score'] - self._scores[i]) - self.life_penalty * (self._lives[i] - stats['lives'])
+            self._scores[i], self._lives[i] = stats['score'], stats['lives']
+            if game.done or (self.max_ticks is not None and game.tick >= self.max_ticks):
+                dones[i] = True
+                info['score'][i], info['lives'][i], info['won'][i] = stats['score'], stats['lives'], game.won
+                self.episodes[i] += 1
+                if self.auto_reset:
+                    self._start(i)
+                else:
+                    self.active[i] = False
+        return self.observations(), rewards, dones, info
+
+    def observations(self):
+        """Return the (N, OBS_SIZE) float32 observations of the current states."""
+        obs = np.zeros((len(self.games), OBS_SIZE), dtype=np.float32)
+        for row, game in zip(obs, self.games):
+            paddle, ball = game.paddle.rect, game.ball
+            row[:] = (paddle.centerx / WINDOW_WIDTH, paddle.width / WINDOW_WIDTH,
+                      ball.rect.centerx / WINDOW_WIDTH, ball.rect.centery / WINDOW_HEIGHT, ball.dx, ball.dy,
+                      game.ball_launched, len(game.balls), game.game_stats['lives'],
+                      len(game.brick_wall) / max(len(game.bricks), 1), game.laser_mode, ball.sticky)
+        return obs
+
+    def brick_masks(self):
+        """
+        Return which bricks of each session's wall are still standing.
+
+        Returns:
+            numpy.ndarray: (N, max wall size) bool, padded with False.
+        """
+        masks = np.zeros((len(self.games), max(len(game.bricks) for game in self.games)), dtype=bool)
+        for mask, game in zip(masks, self.games):
+            in_wall = game.brick_wall.spritedict
+            mask[:len(game.bricks)] = [brick in in_wall for brick in game.bricks]
+        return masks
+
+    def _start(self, i):
+        """Start session i's next episode."""
+        game = self.games[i]
+        game.seed = episode_seed(self.seeds[i], self.episodes[i]) if self.episodes[i] else self.seeds[i]
+        game.game_stats.update(new_game_stats())  # the End screen does this between real games
+        game.done = False
+        game.startup({})
+        self._scores[i], self._lives[i] = game.game_stats['score'], game.game_stats['lives']
+
+    def _act(self, game, action):
+        """Turn an action into the key events a player would have sent."""
+        direction = action if action in _DIRECTION_KEYS else NOOP
+        held = _HELD.get(game.last_direction, NOOP)  # the game drops it when a life is lost
+        if direction != held:
+            if held != NOOP:
+                game.get_event(pg.event.Event(pg.KEYUP, key=_DIRECTION_KEYS[held]))
+            if direction != NOOP:
+                game.get_event(pg.event.Event(pg.KEYDOWN, key=_DIRECTION_KEYS[direction]))
+        if action == FIRE:
+            game.get_event(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+
+
+def _shard_worker(conn, seeds, options):
+    """Serve one shard's BatchEnv to a ParallelBatchEnv over a pipe."""
+    env = BatchEnv(seeds, **options)
+    while True:
+        command, argument = conn.recv()
+        if command == 'step':
+            conn.send(env.step(argument) + (env.episodes, env.active))
+        elif command == 'reset':
+            conn.send(env.reset())
+        elif command == 'observations':
+            conn.send(env.observations())
+        elif command == 'brick_masks':
+            conn.send(env.brick_masks())
+        else:  # 'close'
+            conn.close()
+            return
+
+
+class ParallelBatchEnv:
+    """
+    BatchEnv with its sessions split over worker processes.
+
+    Each worker owns a contiguous shard of the seeds and steps it as a BatchEnv;
+    step() sends every worker its slice of the actions before waiting for any
+    of them, so the shards run at the same time. Results are the same as a
+    single BatchEnv over the same seeds. The Game objects live in the workers,
+    so there is no ``games`` attribute; call close() (or use it as a context
+    manager) to stop the workers.
+
+    Attributes:
+        seeds (list): Base seed of each session.
+        episodes (numpy.ndarray): Episodes started per session.
+        active (numpy.ndarray): Sessions still being stepped (bool per session).
+    """
+
+    def __init__(self, seeds, workers=None, **options):
+        """
+        Args:
+            seeds (iterable): One int seed per session.
+            workers (int): Worker processes, at most one per session (all
+                cores when None).
+            **options: BatchEnv arguments (level, frame_skip, max_ticks, ...).
+        """
+        self.seeds = [int(seed) for seed in seeds]
+        workers = max(1, min(workers or os.cpu_count() or 1, len(self.seeds)))
+        bounds = np.linspace(0, len(self.seeds), workers + 1).astype(int)
+        self._slices = [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+        self.episodes = np.zeros(len(self.seeds), dtype=np.int64)
+        self.active = np.ones(len(self.seeds), dtype=bool)
+
+        # Spawned, not forked: the parent may already have SDL initialised.
+        # Workers inherit the environment, so they skip pygame's import banner.
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+        context = multiprocessing.get_context('spawn')
+        self._pipes = []
+        self._processes = []
+        for shard in self._slices:
+            parent, child = context.Pipe()
+            process = context.Process(target=_shard_worker, args=(child, self.seeds[shard], options), daemon=True)
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+
+    def __len__(self):
+        return len(self.seeds)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _call(self, command, arguments=None):
+        """Send a command to every worker, then collect their replies in shard order."""
+        for i, pipe in enumerate(self._pipes):
+            pipe.send((command, arguments[i] if arguments is not None else None))
+        return [pipe.recv() for pipe in self._pipes]
+
+    def reset(self):
+        """Start every session over from its base seed; see BatchEnv.reset()."""
+        self.episodes[:] = 0
+        self.active[:] = True
+        return np.concatenate(self._call('reset'))
+
+    def step(self, actions):
+        """Apply one action per session on all workers at once; see BatchEnv.step()."""
+        actions = np.asarray(actions)
+        replies = self._call('step', [actions[shard] for shard in self._slices])
+        for shard, (_, _, _, _, episodes, active) in zip(self._slices, replies):
+            self.episodes[shard] = episodes
+            self.active[shard] = active
+        obs, rewards, dones, infos = zip(*(reply[:4] for reply in replies))
+        info = {key: np.concatenate([part[key] for part in infos]) for key in infos[0]}
+        return np.concatenate(obs), np.concatenate(rewards), np.concatenate(dones), info
+
+    def observations(self):
+        return np.concatenate(self._call('observations'))
+
+    def brick_masks(self):
+        """See BatchEnv.brick_masks(); shards are padded to the widest wall."""
+        masks = self._call('brick_masks')
+        width = max(mask.shape[1] for mask in masks)
+        return np.concatenate([np.pad(mask, ((0, 0), (0, width - mask.shape[1]))) for mask in masks])
+
+    def close(self):
+        """Stop the worker processes."""
+        for pipe in self._pipes:
+            with contextlib.suppress(OSError):
+                pipe.send(('close', None))
+                pipe.close()
+        for process in self._processes:
+            process.join(timeout=5)
+        self._pipes, self._processes = [], []
@@ -1,4 +1,8 @@
 import pygame as pg
+
+from config import MAX_FRAME_TIME
+from engine.profiler import ProfilerOverlay, profiler
+from state_manager.states import new_game_stats
 """
 State Control is based on a design by metulburr from the Python forum:
     https://python-forum.io/thread-336-post-64464.html#pid64464
@@ -12,15 +16,27 @@ class Control:
     and the main game loop. It allows for switching between different game screens
     (like menu, gameplay, pause screens) cleanly.
 
+    Control is the only owner of the window: it calls pygame.display.set_mode once
+    and passes the display surface and clock to every screen in setup_states().
+
     Attributes:
         done (bool): Flag indicating when the main game loop should exit.
-        fps (int): Target frames per second for the game.
+        fps (int): Target frames per second for rendering.
+        tick_rate (int): Simulation steps per second.
+        step (float): Length of one simulation step in seconds.
+        accumulator (float): Unsimulated time carried over between frames.
+        headless (bool): Run without frame cap or rendering (turbo mode).
+        max_steps (int): Headless runs stop after this many steps, or None.
+        steps (int): Simulation steps run so far.
         screen (pygame.Surface): The main display surface.
         screen_rect (pygame.Rect): Rectangle representing the screen dimensions.
         clock (pygame.time.Clock): Game clock for controlling frame rate.
         state_dict (dict): Dictionary mapping state names to state instances.
+        game_stats (dict): Score and lives, shared by all the screens.
         state_name (str): Current state's name.
         state (object): Current state instance.
+        profiler (FrameProfiler): Times the loop's phases, see engine.profiler.
+        overlay (ProfilerOverlay): Frame timing panel, toggled with F3.
     """
 
     def __init__(self, settings):
@@ -30,25 +46,47 @@ class Control:
         Args:
             settings (dict): Dictionary containing game settings with keys:
                 - 'FPS': Target frames per second
+                - 'TICK_RATE': Simulation steps per second (defaults to FPS)
+                - 'HEADLESS': Optional, run one step per loop with no frame cap
+                  and no drawing (use with state_manager.headless.enable_headless)
+                - 'MAX_STEPS': Optional, in headless mode stop after this many
+                  simulation steps
                 - 'SIZE': Tuple of (width, height) for screen dimensions
         """
         self.done = False
         self.fps = settings['FPS']
-        self.screen = pg.display.set_mode(settings['SIZE'])
+        self.tick_rate = settings.get('TICK_RATE', self.fps)
+        self.step = 1.0 / self.tick_rate
+        self.accumulator = 0.0
+        self.headless = settings.get('HEADLESS', False)
+        self.max_steps = settings.get('MAX_STEPS')
+        self.steps = 0
+        self.screen = pg.display.get_surface()
+        if self.screen is None or self.screen.get_size() != tuple(settings['SIZE']):
+            self.screen = pg.display.set_mode(settings['SIZE'])
         self.screen_rect = self.screen.get_rect()
         self.clock = pg.time.Clock()
+        self.game_stats = new_game_stats()
+        self.profiler = profiler
+        self.overlay = ProfilerOverlay(profiler, self.fps)
 
     def setup_states(self, state_dict, start_state):
         """
         Set up the game screens and initialize the starting state.
 
+        Every state is attached to this controller's display surface, clock
+        and game statistics, and the starting state is started.
+
         Args:
             state_dict (dict): Dictionary mapping state names to state instances.
             start_state (str): Name of the initial state to start with.
         """
         self.state_dict = state_dict
+        for state in self.state_dict.values():
+            state.attach(self.screen, self.clock, self.game_stats)
         self.state_name = start_state
         self.state = self.state_dict[self.state_name]
+        self.state.startup({})
 
     def flip_state(self):
         """
@@ -56,7 +94,12 @@ class Control:
 
         Performs cleanup of the current state, switches to the next state,
         and initializes the new state. Also keeps track of the previous state.
+        A state without a next state ends the loop instead.
         """
+        if self.state.next is None:
+            self.state.cleanup()
+            self.done = True
+            return
         self.state.done = False
         previous, self.state_name = self.state_name, self.state.next
 
@@ -70,37 +113,108 @@ class Control:
         Update the current state and handle state transitions.
 
         Args:
-            dt (float): Delta time (time since last frame) in seconds.
+            dt (float): Length of the simulation step in seconds.
         """
         if self.state.quit:
             self.done = True
         elif self.state.done:
             self.flip_state()
-        self.state.update(self.screen, dt)
+        if not self.done:
+            self.state.update(dt)
+            self.steps += 1
+
+    def draw(self, alpha):
+        """
+        Draw the current state.
+
+        Args:
+            alpha (float): Fraction of a simulation step left in the accumulator,
+                used by states to interpolate moving objects between steps.
+
+        Returns:
+            list or None: Changed screen regions reported by a state drawing in
+            dirty-rect mode, or None when the whole screen must be updated.
+        """
+        return self.state.draw(self.screen, alpha)
 
     def event_loop(self):
         """
         Process all events in the pygame event queue.
 
-        Handles system events (like quitting) and passes all events to the current state.
+        Handles system events (like quitting) and the profiler overlay key (F3),
+        and passes all other events to the current state.
         """
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 self.done = True
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                self.toggle_overlay()
+                continue
             self.state.get_event(event)
 
+    def toggle_overlay(self):
+        """Show or hide the frame timing overlay."""
+        self.overlay.toggle()
+        if not self.overlay.visible:
+            # A state drawing dirty rects would leave the last panel on screen
+            tracker = getattr(self.state, 'dirty_tracker', None)
+            if tracker is not None:
+                tracker.invalidate()
+
     def main_game_loop(self):
         """
         Run the main game loop until the done flag is set.
 
         This loop:
-        1. Calculates delta time
+        1. Calculates the frame time and adds it to the accumulator
         2. Processes events
-        3. Updates game state
-        4. Updates the display
+        3. Runs as many fixed simulation steps as the accumulator holds
+        4. Draws the current state, interpolated by the leftover time
+        5. Updates the display, only the changed regions if the state reports them
+
+        The frame time is clamped to MAX_FRAME_TIME so a long hitch does not
+        make the simulation try to catch up with an unbounded number of steps.
+
+        In headless mode the loop skips the clock and the display entirely and
+        runs exactly one simulation step per iteration, as fast as possible,
+        until the states finish or max_steps is reached.
+
+        Each phase is timed by the profiler; that costs next to nothing unless
+        the overlay is shown or the profiler was enabled.
         """
+        profiler = self.profiler
         while not self.done:
-            delta_time = self.clock.tick(self.fps) / 1000.0
+            profiler.end_frame()
+            if self.headless:
+                start = profiler.start()
+                self.event_loop()
+                profiler.stop('events', start)
+                start = profiler.start()
+                self.update(self.step)
+                profiler.stop('update', start)
+                if self.max_steps is not None and self.steps >= self.max_steps and not self.done:
+                    self.state.cleanup()
+                    self.done = True
+                continue
+            frame_time = self.clock.tick(self.fps) / 1000.0
+            self.accumulator += min(frame_time, MAX_FRAME_TIME)
+            start = profiler.start()
             self.event_loop()
-            self.update(delta_time)
-            pg.display.update()
+            profiler.stop('events', start)
+            start = profiler.start()
+            while self.accumulator >= self.step and not self.done:
+                self.update(self.step)
+                self.accumulator -= self.step
+            profiler.stop('update', start)
+            start = profiler.start()
+            dirty = self.draw(self.accumulator / self.step)
+            profiler.stop('draw', start)
+            if self.overlay.visible:
+                self.overlay.census = getattr(self.state, 'sprite_census', None)
+                dirty = self.overlay.draw(self.screen, dirty)
+            start = profiler.start()
+            if dirty is None:
+                pg.display.update()
+            else:
+                pg.display.update(dirty)
+            profiler.stop('display', start)
@@ -0,0 +1,90 @@
+import os
+
+import pygame as pg
+
+from config import SETTINGS, TICK_RATE
+"""
+Headless support for running game states without a window, audio device or frame cap.
+
+Typical use (soak tests, bots, balance runs):
+
+    from state_manager.headless import enable_headless, HeadlessRunner
+    enable_headless()
+    from screens import Game
+    runner = HeadlessRunner(Game())
+    runner.run(10000)
+"""
+
+
+def enable_headless():
+    """
+    Select SDL's dummy video and audio drivers and initialise pygame.
+
+    Must be called before any pygame display or mixer initialisation. Drawing
+    still works on surfaces, it just never reaches a real window. A dummy display
+    mode of the configured window size is set so images can be converted to the
+    display format when a Game is run without a Control.
+
+    Returns:
+        pygame.Surface: The dummy display surface.
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pg.init()
+    pg.mixer.init()
+    return pg.display.set_mode(SETTINGS['SIZE'])
+
+
+class HeadlessRunner:
+    """
+    Steps a single state as fast as possible with the same logic as the game loop.
+
+    There is no frame cap and no rendering unless asked for: each call to step()
+    is exactly one fixed simulation step of 1 / tick_rate seconds.
+
+    Attributes:
+        state (States): The state being simulated (usually a Game).
+        step_time (float): Length of one simulation step in seconds.
+        ticks (int): Number of steps run so far.
+    """
+
+    def __init__(self, state, tick_rate=TICK_RATE, persist=None):
+        """
+        Args:
+            state (States): The state to run. Its startup() is called here.
+            tick_rate (int): Simulation steps per second.
+            persist (dict): Data passed to the state's startup().
+        """
+        self.state = state
+        self.step_time = 1.0 / tick_rate
+        self.ticks = 0
+        self.state.startup(persist if persist is not None else {})
+
+    def step(self, events=()):
+        """
+        Feed events to the state and advance it by one simulation step.
+
+        Args:
+            events (iterable): pygame events to deliver before the step.
+        """
+        for event in events:
+            self.state.get_event(event)
+        self.state.update(self.step_time)
+        self.ticks += 1
+
+    def run(self, ticks, until_done=True):
+        """
+        Run a number of steps.
+
+        Args:
+            ticks (int): Maximum number of steps to run.
+            until_done (bool): Stop early when the state sets done or quit.
+
+        Returns:
+            int: Number of steps actually run.
+        """
+        for i in range(ticks):
+            if until_done and (self.state.done or self.state.quit):
+                return i
+            self.step()
+        return ticks
@@ -1,6 +1,7 @@
 import pygame as pg
 
 from config import FONT, FONT_SIZE, BLACK, GRAY, WHITE
+from engine.fonts import get_font, render_text
 """
 State Control is based on a design by metulburr from the Python forum:
     https://python-forum.io/thread-336-post-64464.html#pid64464
@@ -37,7 +38,7 @@ class MenuManager:
         self.button_height = 100
         self.button_padding = 50
         self.button_spacing = 15
-        self.font = pg.font.SysFont(FONT, FONT_SIZE)
+        self.font = get_font(FONT, FONT_SIZE)
 
     def draw_menu(self, screen):
         """
@@ -49,17 +50,42 @@ class MenuManager:
         The selected button is drawn with a different background color and text color
         for visual feedback. Each button has a white border.
         """
-        for i, button in enumerate(self.buttons):
-            # Draw button background
-            bg_color = BLACK if i == self.hover_index else GRAY
-            pg.draw.rect(screen, bg_color, button['rect'])
-            pg.draw.rect(screen, WHITE, button['rect'], 2)  # Border
+        for i in range(len(self.buttons)):
+            self.draw_button(screen, i, i == getattr(self, 'hover_index', -1))
+
+    def draw_menu_highlight(self, screen):
+        """
+        Draw only the highlighted button.
+
+        Used by screens whose cached static layer already contains every button
+        in its normal state, so a frame costs at most one button redraw.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+        """
+        if getattr(self, 'hover_index', -1) >= 0:
+            self.draw_button(screen, self.hover_index, True)
 
-            # Draw button text
-            text_color = WHITE if i == self.hover_index else BLACK
-            text_surf = self.font.render(button['text'], True, text_color)
-            text_rect = text_surf.get_rect(center=button['rect'].center)
-            screen.blit(text_surf, text_rect)
+    def draw_button(self, screen, i, highlighted):
+        """
+        Draw a single menu button.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            i (int): Index of the button.
+            highlighted (bool): Draw with the hover colors.
+        """
+        button = self.buttons[i]
+        # Draw button background
+        bg_color = BLACK if highlighted else GRAY
+        pg.draw.rect(screen, bg_color, button['rect'])
+        pg.draw.rect(screen, WHITE, button['rect'], 2)  # Border
+
+        # Draw button text
+        text_color = WHITE if highlighted else BLACK
+        text_surf = render_text(self.font, button['text'], text_color)
+        text_rect = text_surf.get_rect(center=button['rect'].center)
+        screen.blit(text_surf, text_rect)
 
     def update_menu(self):
         """
@@ -136,7 +162,7 @@ class MenuManager:
 
         # Calculate maximum text width
         for option in self.options:
-            text_width = self.font.render(option, True, BLACK).get_width()
+            text_width = self.font.size(option)[0]
             max_width = max(max_width, text_width)
 
         # Calculate button width with padding
@@ -0,0 +1,217 @@
+import argparse
+import struct
+
+import numpy as np
+import pygame as pg
+
+from config import TICK_RATE
+"""
+Input recording and exact replay of game sessions.
+
+A session is fully determined by its seed (see state_manager.rng), its level and
+the KEYDOWN/KEYUP events Game.get_event received, each stamped with the number
+of simulation steps run before it. InputRecorder captures that into a compact
+binary file; ReplayRunner feeds the events back at the same ticks to a fresh
+Game and so plays the session again exactly, either headless at full speed or
+in real time on screen:
+
+    python -m state_manager.replay session.bkrp [--realtime]
+
+File layout: a fixed header (magic, format version, seed, tick rate, length in
+ticks, game clock at the start, event count, level name length), the UTF-8
+level name, then one packed 9-byte record per event.
+"""
+
+MAGIC = b'BKRP'
+FORMAT_VERSION = 1
+
+# magic, format version, seed, tick rate, ticks, clock start, event count, level name length
+HEADER = struct.Struct('<4sHQHIdIH')
+
+EVENT_DTYPE = np.dtype([
+    ('tick', '<u4'),
+    ('type', 'u1'),
+    ('key', '<u4'),
+])
+
+# Event types that are recorded, by their code in the file
+EVENT_TYPES = (pg.KEYDOWN, pg.KEYUP)
+_EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+
+
+class Replay:
+    """
+    A recorded session.
+
+    Attributes:
+        seed (int): Session seed.
+        level (str): Level name, or None for the default wall.
+        tick_rate (int): Simulation steps per second the session ran at.
+        ticks (int): Length of the session in simulation steps.
+        clock_start (float): Game clock time in ms when the session started.
+        events (numpy.ndarray): EVENT_DTYPE records in the order they happened.
+    """
+
+    def __init__(self, seed, level=None, tick_rate=TICK_RATE, ticks=0, clock_start=0.0, events=None):
+        self.seed = seed
+        self.level = level
+        self.tick_rate = tick_rate
+        self.ticks = ticks
+        self.clock_start = clock_start
+        self.events = events if events is not None else np.zeros(0, dtype=EVENT_DTYPE)
+
+    def to_bytes(self):
+        """Encode the replay in the binary file format."""
+        level = (self.level or '').encode('utf-8')
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, self.seed, self.tick_rate, self.ticks, self.clock_start,
+                             len(self.events), len(level))
+        return header + level + self.events.astype(EVENT_DTYPE).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode a replay.
+
+        Raises:
+            ValueError: If data is not a replay of this format version.
+        """
+        magic, version, seed, tick_rate, ticks, clock_start, count, name_length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"not a version {FORMAT_VERSION} replay")
+        offset = HEADER.size + name_length
+        level = bytes(data[HEADER.size:offset]).decode('utf-8') or None
+        events = np.frombuffer(data, dtype=EVENT_DTYPE, count=count, offset=offset)
+        return cls(seed, level, tick_rate, ticks, clock_start, events)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def events_by_tick(self):
+        """
+        Yield (tick, events) for every tick from 0 to ticks, where events are
+        the pygame events to deliver before that tick's step.
+        """
+        records = self.events
+        bounds = np.searchsorted(records['tick'], np.arange(self.ticks + 2))
+        for tick in range(self.ticks + 1):
+            yield tick, [pg.event.Event(EVENT_TYPES[code], key=key)
+                         for code, key in records[['type', 'key']][bounds[tick]:bounds[tick + 1]].tolist()]
+
+
+class InputRecorder:
+    """
+    Records the key events a Game receives during one session.
+
+    Give one to Game(recorder=...): the game starts a recording in startup(),
+    records every KEYDOWN/KEYUP in get_event() and stops it in cleanup(), at
+    which point it is written to path if one was given.
+
+    Attributes:
+        path (str): File to write each finished session to, or None.
+        replay (Replay): The session being recorded, or the last one finished.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.replay = None
+        self._records = []
+
+    def start(self, seed, level=None, clock_start=0.0, tick_rate=TICK_RATE):
+        """Begin recording a new session."""
+        self.replay = Replay(seed, level, tick_rate, clock_start=clock_start)
+        self._records = []
+
+    def record(self, tick, event):
+        """Record an event delivered before the given tick. Other event types are ignored."""
+        code = _EVENT_CODES.get(event.type)
+        if code is not None and self.replay is not None:
+            self._records.append((tick, code, event.key))
+
+    def stop(self, ticks):
+        """
+        Finish the session after the given number of ticks.
+
+        Returns:
+            Replay: The recorded session.
+        """
+        replay = self.replay
+        replay.ticks = ticks
+        replay.events = np.array(self._records, dtype=EVENT_DTYPE)
+        if self.path:
+            replay.save(self.path)
+        return replay
+
+
+class ReplayRunner:
+    """
+    Plays a recorded session back on a fresh Game.
+
+    Attributes:
+        replay (Replay): The session being played.
+        game (Game): The game it is played on.
+    """
+
+    def __init__(self, replay, game=None):
+        """
+        Args:
+            replay (Replay): The session to play.
+            game (Game): Game to play it on; a new one with the replay's seed
+                and level when omitted.
+        """
+        from screens.game import Game
+        self.replay = replay
+        self.game = game if game is not None else Game(seed=replay.seed, level=replay.level)
+        self.game.seed = replay.seed
+        self.game.level = replay.level
+
+    def run(self, realtime=False):
+        """
+        Play the whole session.
+
+        Args:
+            realtime (bool): Draw every step to the display and pace the steps
+                at the recorded tick rate instead of running at full speed.
+
+        Returns:
+            Game: The game in its final state.
+        """
+        from state_manager.headless import HeadlessRunner
+        runner = HeadlessRunner(self.game, tick_rate=self.replay.tick_rate)
+        self.game.sim_clock.time = self.replay.clock_start
+        screen = pg.display.get_surface() if realtime else None
+        clock = pg.time.Clock()
+        for tick, events in self.replay.events_by_tick():
+            if tick == self.replay.ticks:
+                for event in events:  # arrived after the last step
+                    self.game.get_event(event)
+                break
+            runner.step(events)
+            if screen is not None:
+                pg.event.pump()
+                self.game.draw(screen)
+                pg.display.update()
+                clock.tick(self.replay.tick_rate)
+        return self.game
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play back a recorded game session.")
+    parser.add_argument('path')
+    parser.add_argument('--realtime', action='store_true', help="draw the replay at the recorded speed")
+    args = parser.parse_args()
+    if args.realtime:
+        pg.init()
+        pg.mixer.init()
+        from config import SETTINGS
+        pg.display.set_mode(SETTINGS['SIZE'])
+    else:
+        from state_manager.headless import enable_headless
+        enable_headless()
+    game = ReplayRunner(Replay.load(args.path)).run(realtime=args.realtime)
+    print(f"score {game.game_stats['score']}, lives {game.game_stats['lives']}, won {game.won}")
@@ -0,0 +1,57 @@
+import operator
+import random
+
+import numpy as np
+"""
+Seeded random number streams for one game session.
+
+Everything random in a game (the ball's launch angle, the brick colors, power-up
+drops and debris velocities) draws from its own stream derived from a single
+session seed. Two sessions with the same seed and the same input therefore play
+out identically, and one system drawing more numbers does not shift the others.
+"""
+
+SEED_LIMIT = 2 ** 64  # seeds are stored as unsigned 64-bit ints (see state_manager.replay)
+
+
+class SessionRng:
+    """
+    The random streams of a game session, all derived from one seed.
+
+    Attributes:
+        seed (int): The session seed.
+        ball (random.Random): Ball launch angles.
+        bricks (random.Random): Wall colors of the default brick wall.
+        powerups (random.Random): Power item drops and their effects.
+        particles (numpy.random.Generator): Debris spawn velocities.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed (int): Session seed, 0 <= seed < 2**64; a fresh random seed
+                when omitted.
+        """
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Restart every stream from a seed (a fresh random seed when omitted).
+
+        Raises:
+            ValueError: If seed is not an integer with 0 <= seed < 2**64.
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        else:
+            try:
+                seed = operator.index(seed)  # accepts NumPy integers too
+            except TypeError:
+                raise ValueError(f"seed must be an integer, got {seed!r}") from None
+            if not 0 <= seed < SEED_LIMIT:
+                raise ValueError(f"seed must be in [0, 2**64), got {seed}")
+        self.seed = seed
+        self.ball = random.Random(f"{seed}/ball")
+        self.bricks = random.Random(f"{seed}/bricks")
+        self.powerups = random.Random(f"{seed}/powerups")
+        self.particles = np.random.default_rng([seed, 1])
@@ -0,0 +1,33 @@
+class SimClock:
+    """
+    Simulation clock measured in milliseconds of game time.
+
+    Timed game logic (power-up expiry, laser cooldown) reads this clock instead of
+    pygame.time.get_ticks() so that it follows the simulation, not the wall clock.
+    The clock only moves when advance() is called, once per simulation step, which
+    keeps timing identical whether the game runs in real time or headless at full
+    speed.
+
+    Attributes:
+        time (float): Elapsed game time in milliseconds.
+    """
+
+    def __init__(self, start=0):
+        """
+        Args:
+            start (float): Initial game time in milliseconds.
+        """
+        self.time = start
+
+    def advance(self, dt):
+        """
+        Move the clock forward by one simulation step.
+
+        Args:
+            dt (float): Step length in seconds.
+        """
+        self.time += dt * 1000.0
+
+    def get_ticks(self):
+        """Return the elapsed game time in whole milliseconds, like pygame.time.get_ticks()."""
+        return round(self.time)
@@ -0,0 +1,288 @@
+import math
+from collections import deque
+
+import numpy as np
+
+from config import TICK_RATE
+from objects.ball import Ball, STATE_SIZE, SYNC_X, SYNC_Y
+from objects.effects import EFFECTS
+"""
+Snapshots of a running Game and a rewind buffer built on them.
+
+A snapshot holds everything the simulation reads: the clock and flags, score
+and lives, the random streams, and every ball, the paddle, lasers, power items,
+debris, running effects and the power items caught so far. The bricks are a bitset over the wall the session
+started with plus one byte of hit points each; moving things are packed float
+arrays. Taking one copies a few small arrays and restoring one only touches
+the bricks whose state differs, so both are far cheaper than a frame and much
+cheaper than Game.startup().
+
+Snapshots belong to the session they were taken in: a new game (startup())
+starts a new wall, and older snapshots can no longer be restored.
+"""
+
+# Ball rows: the ball's state row followed by these columns
+BALL_SPEED, BALL_ORIGINAL_SPEED, BALL_STICKY, BALL_OFFSET_X = range(STATE_SIZE, STATE_SIZE + 4)
+BALL_COLUMNS = STATE_SIZE + 4
+
+# Movable sprite rows (paddle, lasers, power items): float position, position
+# at the start of the step, last synced rect position, then per-kind extras
+MOVABLE_COLUMNS = 6
+
+
+def _movable_row(sprite, *extra):
+    return (sprite.pos.x, sprite.pos.y, sprite.prev_pos.x, sprite.prev_pos.y) + tuple(sprite._synced) + extra
+
+
+def _set_movable(sprite, row):
+    sprite.pos.update(row[0], row[1])
+    sprite.prev_pos.update(row[2], row[3])
+    sprite._synced = (int(row[4]), int(row[5]))
+    sprite.rect.topleft = sprite._synced
+
+
+def _random_state(rng):
+    """A random.Random's state as (uint32 array, gauss_next)."""
+    version, internal, gauss_next = rng.getstate()
+    return np.array(internal, dtype=np.uint32), gauss_next
+
+
+def _set_random_state(rng, state):
+    internal, gauss_next = state
+    rng.setstate((3, tuple(internal.tolist()), gauss_next))
+
+
+class GameSnapshot:
+    """
+    The state of a Game at the end of one simulation step.
+
+    Attributes:
+        session (int): Game.session the snapshot was taken in.
+        tick (int): Game.tick at the time of the snapshot.
+        scalars (dict): Clock, flags, score and lives.
+        bricks_alive (numpy.ndarray): Packed bitset, one bit per brick of the
+            session's wall.
+        brick_hp (numpy.ndarray): Hit points left per brick (uint8).
+        balls (numpy.ndarray): One row of BALL_COLUMNS floats per ball, in
+            BallSet row order.
+        paddle (numpy.ndarray): Movable row plus the paddle's width.
+        lasers (numpy.ndarray): Movable row plus speed per laser.
+        power_items (numpy.ndarray): Movable row plus speed and effect index per item.
+        effects (list): Running effects as (name, ends_at).
+        collected (dict): Game.effects_collected, power items caught by effect.
+        particles (tuple): Debris arrays from ParticleSystem.get_state().
+        rng (tuple): States of the session's random streams.
+    """
+
+    __slots__ = ('session', 'tick', 'scalars', 'bricks_alive', 'brick_hp', 'balls', 'paddle', 'lasers',
+                 'power_items', 'effects', 'collected', 'particles', 'rng')
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the snapshot's arrays."""
+        arrays = [self.bricks_alive, self.brick_hp, self.balls, self.paddle, self.lasers, self.power_items]
+        arrays.extend(self.particles)
+        arrays.extend(state[0] for state in self.rng[:3])
+        return sum(array.nbytes for array in arrays)
+
+
+def capture(game):
+    """Take a snapshot of a started Game."""
+    snapshot = GameSnapshot()
+    snapshot.session = game.session
+    snapshot.tick = game.tick
+    snapshot.scalars = {
+        'time': game.sim_clock.time,
+        'ball_launched': game.ball_launched,
+        'last_direction': game.last_direction,
+        'won': game.won,
+        'done': game.done,
+        'laser_mode': game.laser_mode,
+        'last_laser_time': game.last_laser_time,
+        'score': game.game_stats['score'],
+        'lives': game.game_stats['lives'],
+    }
+
+    in_wall = game.brick_wall.spritedict
+    bricks = game.bricks
+    snapshot.bricks_alive = np.packbits(np.fromiter((brick in in_wall for brick in bricks), bool, len(bricks)))
+    snapshot.brick_hp = np.fromiter((max(brick.hp, 0) for brick in bricks), np.uint8, len(bricks))
+
+    balls = game.balls.members
+    rows = np.empty((len(balls), BALL_COLUMNS))
+    rows[:, :STATE_SIZE] = game.balls.state[:len(balls)]
+    for row, ball in zip(rows, balls):
+        row[STATE_SIZE:] = (ball.speed, ball.original_speed, ball.sticky, getattr(ball, 'offset_x', math.nan))
+    snapshot.balls = rows
+
+    paddle = game.paddle
+    snapshot.paddle = np.array(_movable_row(paddle, paddle.rect.width, paddle.slow, paddle.reverse))
+    snapshot.lasers = np.array([_movable_row(laser, laser.speed) for laser in game.lasers],
+                               dtype=float).reshape(-1, MOVABLE_COLUMNS + 1)
+    effect_names = list(EFFECTS)
+    snapshot.power_items = np.array([_movable_row(item, item.speed, effect_names.index(item.effect_type))
+                                     for item in game.power_items], dtype=float).reshape(-1, MOVABLE_COLUMNS + 2)
+
+    snapshot.effects = list(game.active_effects)
+    snapshot.collected = dict(game.effects_collected)
+    snapshot.particles = game.particles.get_state()
+    rng = game.rng
+    snapshot.rng = (_random_state(rng.ball), _random_state(rng.bricks), _random_state(rng.powerups),
+                    rng.particles.bit_generator.state)
+    return snapshot
+
+
+def restore(game, snapshot):
+    """
+    Put a Game back into the state of a snapshot taken in its current session.
+
+    Raises:
+        ValueError: If the snapshot comes from another session.
+    """
+    if snapshot.session != game.session:
+        raise ValueError("snapshot was taken in a different game session")
+
+    scalars = snapshot.scalars
+    game.tick = snapshot.tick
+    game.sim_clock.time = scalars['time']
+    game.ball_launched = scalars['ball_launched']
+    game.last_direction = scalars['last_direction']
+    game.won = scalars['won']
+    game.done = scalars['done']
+    game.laser_mode = scalars['laser_mode']
+    game.last_laser_time = scalars['last_laser_time']
+    game.game_stats['score'] = scalars['score']
+    game.game_stats['lives'] = scalars['lives']
+
+    # Only the bricks whose state differs are touched
+    wall = game.brick_wall
+    bricks = game.bricks
+    alive = np.unpackbits(snapshot.bricks_alive, count=len(bricks)).astype(bool)
+    current = np.fromiter((brick in wall.spritedict for brick in bricks), bool, len(bricks))
+    for i in np.flatnonzero(alive & ~current).tolist():
+        wall.add(bricks[i])
+    for i in np.flatnonzero(current & ~alive).tolist():
+        bricks[i].kill()
+    for brick, hp in zip(bricks, snapshot.brick_hp.tolist()):
+        brick.hp = hp
+
+    _restore_balls(game, snapshot.balls)
+
+    paddle = game.paddle
+    row = snapshot.paddle
+    paddle.resize(int(row[MOVABLE_COLUMNS]))
+    _set_movable(paddle, row)
+    paddle.slow = bool(row[MOVABLE_COLUMNS + 1])
+    paddle.reverse = bool(row[MOVABLE_COLUMNS + 2])
+
+    for laser in game.lasers.sprites():
+        laser.kill()
+    for row in snapshot.lasers:
+        laser = game.laser_pool.acquire(0, 0, speed=row[MOVABLE_COLUMNS])
+        _set_movable(laser, row)
+        game.lasers.add(laser)
+        game.all_sprites.add(laser)
+
+    for item in game.power_items.sprites():
+        item.kill()
+    effect_names = list(EFFECTS)
+    for row in snapshot.power_items:
+        item = game.power_item_pool.acquire(0, 0, effect_names[int(row[MOVABLE_COLUMNS + 1])], row[MOVABLE_COLUMNS])
+        _set_movable(item, row)
+        game.power_items.add(item)
+        game.all_sprites.add(item)
+
+    game.active_effects.restore(snapshot.effects)
+    game.effects_collected.clear()
+    game.effects_collected.update(snapshot.collected)
+    game.particles.set_state(snapshot.particles)
+    rng = game.rng
+    for stream, state in zip((rng.ball, rng.bricks, rng.powerups), snapshot.rng):
+        _set_random_state(stream, state)
+    rng.particles.bit_generator.state = snapshot.rng[3]
+    game.dirty_tracker.invalidate()
+
+
+def _restore_balls(game, rows):
+    balls = game.balls
+    for ball in balls.members[len(rows):]:
+        ball.kill()
+    while len(balls) < len(rows):
+        ball = Ball((255, 0, 0), radius=10, speed=rows[len(balls), BALL_SPEED], sounds=game.sounds)
+        balls.add(ball)
+        game.all_sprites.add(ball)
+    balls.state[:len(rows)] = rows[:, :STATE_SIZE]
+    for ball, row in zip(balls.members, rows.tolist()):
+        ball.rect.topleft = (int(row[SYNC_X]), int(row[SYNC_Y]))
+        ball.speed = row[BALL_SPEED]
+        ball.original_speed = row[BALL_ORIGINAL_SPEED]
+        ball.sticky = bool(row[BALL_STICKY])
+        if not math.isnan(row[BALL_OFFSET_X]):
+            ball.offset_x = row[BALL_OFFSET_X]
+        elif hasattr(ball, 'offset_x'):
+            del ball.offset_x
+
+
+class RewindBuffer:
+    """
+    Ring buffer of the last few seconds of a game's snapshots.
+
+    Holds at most ``capacity`` snapshots, taken every ``interval`` steps, so its
+    memory is bounded by the session's wall size and the sprite pool sizes.
+    Call record() after every simulation step; Game does this when it is
+    created with rewind_seconds.
+
+    Attributes:
+        game (Game): The game being recorded.
+        interval (int): Steps between snapshots.
+        capacity (int): Maximum number of snapshots kept.
+    """
+
+    def __init__(self, game, seconds=5.0, interval=6, tick_rate=TICK_RATE):
+        """
+        Args:
+            game (Game): The game to record.
+            seconds (float): How far back the buffer reaches.
+            interval (int): Take a snapshot every this many steps.
+            tick_rate (int): Simulation steps per second.
+        """
+        self.game = game
+        self.interval = interval
+        self.tick_rate = tick_rate
+        self.capacity = max(1, math.ceil(seconds * tick_rate / interval))
+        self._snapshots = deque(maxlen=self.capacity)
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def record(self):
+        """Snapshot the game if a snapshot is due this step."""
+        if self.game.tick % self.interval == 0:
+            self._snapshots.append(capture(self.game))
+
+    def rewind(self, seconds):
+        """
+        Restore the game to the newest snapshot at least ``seconds`` old.
+
+        Newer snapshots are dropped. The oldest snapshot is used if the buffer
+        does not reach back that far.
+
+        Returns:
+            GameSnapshot or None: The restored snapshot, or None if the buffer is empty.
+        """
+        snapshots = self._snapshots
+        if not snapshots:
+            return None
+        target = self.game.tick - round(seconds * self.tick_rate)
+        while len(snapshots) > 1 and snapshots[-1].tick > target:
+            snapshots.pop()
+        restore(self.game, snapshots[-1])
+        return snapshots[-1]
+
+    def clear(self):
+        """Drop every snapshot (e.g. when a new session starts)."""
+        self._snapshots.clear()
+
+    def nbytes(self):
+        """Approximate memory held by the buffered snapshots."""
+        return sum(snapshot.nbytes for snapshot in self._snapshots)
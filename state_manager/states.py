@@ -1,13 +1,27 @@
+import pygame as pg
+
 from config import STARTING_LIVES, SETTINGS
-from .control import Control
 """
 State Control is based on a design by metulburr from the Python forum:
     https://python-forum.io/thread-336-post-64464.html#pid64464
 """
 
-class States(Control):
+def new_game_stats():
+    """Statistics of a fresh game: starting lives and no score."""
+    return {
+        'lives': STARTING_LIVES,
+        'score': 0
+    }
+
+
+class States:
     """
-    Base class for game screens, inheriting from Control to provide state management functionality.
+    Base class for game screens in the finite state machine.
+
+    Screens do not own the window: Control creates the single display surface and
+    clock and hands them to every screen through attach() when the states are set
+    up. Until then screen_rect describes the configured window size, so layout
+    code can run in __init__.
 
     This class serves as the foundation for all game screens in a finite state machine system.
     It maintains common game statistics and state transition flags that are shared across
@@ -15,29 +29,54 @@ class States(Control):
 
     Attributes:
         game_stats (dict): Dictionary tracking persistent game statistics across screens.
-            Contains:
+            Each state starts with its own; Control replaces them with one dict
+            shared by all its screens in attach(), so separate Game instances
+            (batch simulation) never share a score. Contains:
                 - 'lives': Number of remaining player lives
                 - 'score': Current player score
+        screen (pygame.Surface): The shared display surface, set by attach().
+        screen_rect (pygame.Rect): Rectangle of the display surface.
+        clock (pygame.time.Clock): The shared game clock, set by attach().
         done (bool): Flag indicating if the current state should transition to next state.
         next (str): Name of the next state to transition to.
         quit (bool): Flag indicating if the game should exit.
         previous (str): Name of the previous state (for return navigation).
+        verbose (bool): Print a line when the state starts up or is cleaned
+            up. Batch runs of many games switch it off per game, or for every
+            state on the class.
     """
 
-    # Class-level game statistics shared across all screens
-    game_stats = {
-        'lives': STARTING_LIVES,
-        'score': 0
-    }
+    verbose = True
 
     def __init__(self):
         """
         Initialize the base state with common settings and transition flags.
-
-        Sets up the control system with game settings and initializes state transition flags.
         """
-        Control.__init__(self, SETTINGS)
+        self.game_stats = new_game_stats()
+        self.screen = None
+        self.screen_rect = pg.Rect((0, 0), SETTINGS['SIZE'])
+        self.clock = None
         self.done = False
         self.next = None
         self.quit = False
         self.previous = None
+
+    def attach(self, screen, clock, game_stats=None):
+        """
+        Give the state the shared display surface and clock owned by Control.
+
+        Args:
+            screen (pygame.Surface): The display surface.
+            clock (pygame.time.Clock): The main loop's clock.
+            game_stats (dict): Statistics shared with the other screens, if any.
+        """
+        if game_stats is not None:
+            self.game_stats = game_stats
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.clock = clock
+
+    def announce(self, message):
+        """Print a lifecycle message unless the state is quiet."""
+        if self.verbose:
+            print(message)
@@ -0,0 +1,261 @@
+import argparse
+import itertools
+import json
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from config import TICK_RATE
+from objects.effects import EFFECTS, BalanceConfig
+"""
+Power-up balance sweeps: thousands of seeded headless games on all cores.
+
+Every combination of the swept drop chances and effect durations is one
+parameter set; each set plays --games games with seeds base_seed .. +games-1
+under a scripted paddle (see track_ball()). Games are split into shards run
+by a ProcessPoolExecutor, each shard stepping its games together in a
+BatchEnv, and results are streamed to a columnar file as shards finish:
+
+    python -m state_manager.sweep --games 2000 --drop-chance 0.2 0.3 0.4 \\
+        --duration 3000 5000 --weight multi_ball=0.5 --out sweep.cols
+
+One row per game: parameter set, drop chance, duration, seed, score, lives
+left, won, game time, and how many items of each effect were caught.
+read_columns() loads the file back as a dict of NumPy arrays.
+
+File layout: a JSON header line naming the columns and their dtypes, then one
+block per shard: a uint32 row count followed by each column's packed values.
+"""
+
+DEFAULT_MAX_TICKS = TICK_RATE * 60 * 5  # five minutes of game time
+
+
+def result_dtype():
+    """Columns of the results file."""
+    return np.dtype([
+        ('param_set', '<i4'),
+        ('drop_chance', '<f8'),
+        ('duration_ms', '<i8'),
+        ('seed', '<i8'),
+        ('score', '<i8'),
+        ('lives', '<i4'),
+        ('won', '?'),
+        ('ticks', '<i8'),
+        ('seconds', '<f8'),
+    ] + [(f'caught_{name}', '<i4') for name in EFFECTS])
+
+
+class ColumnWriter:
+    """Appends blocks of rows to a columnar results file."""
+
+    def __init__(self, path, dtype):
+        self.dtype = dtype
+        self.rows = 0
+        self._file = open(path, 'wb')
+        header = {'columns': [[name, dtype[name].str] for name in dtype.names]}
+        self._file.write(json.dumps(header).encode('utf-8') + b'\n')
+
+    def write(self, columns):
+        """Append one block given as a dict of equally long column arrays."""
+        count = len(columns[self.dtype.names[0]])
+        self._file.write(struct.pack('<I', count))
+        for name in self.dtype.names:
+            self._file.write(np.ascontiguousarray(columns[name], dtype=self.dtype[name]).tobytes())
+        self._file.flush()
+        self.rows += count
+
+    def close(self):
+        self._file.close()
+
+
+def read_columns(path):
+    """
+    Load a file written by ColumnWriter.
+
+    Returns:
+        dict: Column name -> NumPy array of all rows.
+    """
+    with open(path, 'rb') as f:
+        columns = [(name, np.dtype(kind)) for name, kind in json.loads(f.readline())['columns']]
+        blocks = {name: [] for name, _ in columns}
+        while True:
+            head = f.read(4)
+            if len(head) < 4:
+                break
+            count, = struct.unpack('<I', head)
+            for name, dtype in columns:
+                blocks[name].append(np.frombuffer(f.read(count * dtype.itemsize), dtype=dtype))
+    return {name: np.concatenate(parts) if parts else np.zeros(0, dtype)
+            for (name, dtype), parts in zip(columns, blocks.values())}
+
+
+def track_ball(obs):
+    """
+    Scripted paddle policy over BatchEnv observations: follow the ball.
+
+    Launches a waiting ball, releases a sticky one and otherwise moves the
+    paddle's center under the ball's.
+
+    Returns:
+        numpy.ndarray: One BatchEnv action per row of obs.
+    """
+    from state_manager.batch import FIRE, LEFT, NOOP, OBS_FIELDS, RIGHT
+    column = {name: obs[:, i] for i, name in enumerate(OBS_FIELDS)}
+    offset = column['ball_x'] - column['paddle_x']
+    dead_zone = column['paddle_width'] / 4
+    actions = np.where(offset < -dead_zone, LEFT, np.where(offset > dead_zone, RIGHT, NOOP))
+    waiting = column['ball_launched'] == 0
+    actions = np.where(waiting & (column['sticky'] != 0), FIRE, actions)
+    return np.where(waiting & (column['sticky'] == 0) & (actions == NOOP), LEFT, actions)
+
+
+def run_shard(shard):
+    """
+    Play one shard of games to the end. Runs in a worker process.
+
+    Args:
+        shard (dict): 'param_set', 'seeds', 'drop_chance', 'duration_ms',
+            'weights', 'durations', 'level' and 'max_ticks'.
+
+    Returns:
+        dict: Result columns for the shard's games.
+    """
+    from state_manager.batch import BatchEnv
+    durations = {name: shard['duration_ms'] for name, effect in EFFECTS.items() if effect.duration is not None}
+    durations.update(shard['durations'])
+    config = BalanceConfig(shard['drop_chance'], shard['weights'], durations)
+    env = BatchEnv(shard['seeds'], level=shard['level'], max_ticks=shard['max_ticks'], auto_reset=False,
+                   game_options={'config': config})
+    obs = env.reset()
+    while env.active.any():
+        obs, _, _, _ = env.step(track_ball(obs))
+
+    # Finished games are left as they ended
+    games = env.games
+    ticks = np.array([game.tick for game in games])
+    columns = {
+        'param_set': np.full(len(games), shard['param_set']),
+        'drop_chance': np.full(len(games), shard['drop_chance']),
+        'duration_ms': np.full(len(games), shard['duration_ms']),
+        'seed': np.array(shard['seeds']),
+        'score': [game.game_stats['score'] for game in games],
+        'lives': [game.game_stats['lives'] for game in games],
+        'won': [game.won for game in games],
+        'ticks': ticks,
+        'seconds': ticks / TICK_RATE,
+    }
+    columns.update((f'caught_{name}', [game.effects_collected[name] for game in games]) for name in EFFECTS)
+    return columns
+
+
+def make_shards(games, shard_size, base_seed, drop_chances, durations, weights, duration_overrides, level, max_ticks):
+    """Split every parameter set's games into shards for run_shard()."""
+    shards = []
+    for param_set, (drop_chance, duration) in enumerate(itertools.product(drop_chances, durations)):
+        for start in range(0, games, shard_size):
+            shards.append({
+                'param_set': param_set,
+                'seeds': list(range(base_seed + start, base_seed + min(start + shard_size, games))),
+                'drop_chance': drop_chance,
+                'duration_ms': duration,
+                'weights': weights,
+                'durations': duration_overrides,
+                'level': level,
+                'max_ticks': max_ticks,
+            })
+    return shards
+
+
+def sweep(out, shards, workers=None, progress=None):
+    """
+    Run shards on a process pool and stream their results to out.
+
+    Args:
+        out (str): Results file path.
+        shards (list): From make_shards().
+        workers (int): Worker processes (all cores when None).
+        progress (callable): Called with (games done, games total) after each shard.
+
+    Returns:
+        int: Number of games written.
+    """
+    writer = ColumnWriter(out, result_dtype())
+    total = sum(len(shard['seeds']) for shard in shards)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(run_shard, shard) for shard in shards]):
+                writer.write(future.result())
+                if progress:
+                    progress(writer.rows, total)
+    finally:
+        writer.close()
+    return writer.rows
+
+
+def effect_value(kind):
+    """
+    Argparse type for EFFECT=VALUE arguments.
+
+    Args:
+        kind (callable): Converts the value, e.g. float or int.
+
+    Returns:
+        callable: Parses one argument into an (effect name, value) pair,
+        raising argparse.ArgumentTypeError so bad input is a usage error.
+    """
+    def parse(text):
+        name, sep, number = text.partition('=')
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected EFFECT=VALUE, got {text!r}")
+        if name not in EFFECTS:
+            raise argparse.ArgumentTypeError(f"unknown effect {name!r}; choose from {', '.join(EFFECTS)}")
+        try:
+            return name, kind(number)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid {kind.__name__} value {number!r} for {name}") from None
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Power-up balance sweep over seeded headless games.")
+    parser.add_argument('--games', type=int, default=1000, help="games per parameter set")
+    parser.add_argument('--drop-chance', type=float, nargs='+', default=[0.3], help="drop chances to sweep")
+    parser.add_argument('--duration', type=int, nargs='+', default=[5000],
+                        help="durations in ms of every timed effect to sweep")
+    parser.add_argument('--duration-of', type=effect_value(int), nargs='*', default=[], metavar='EFFECT=MS',
+                        help="fixed duration for single effects, overriding --duration")
+    parser.add_argument('--weight', type=effect_value(float), nargs='*', default=[], metavar='EFFECT=W',
+                        help="relative drop weight per effect; unlisted effects weigh 1")
+    parser.add_argument('--seed', type=int, default=0, help="first seed; games use consecutive seeds")
+    parser.add_argument('--level', default=None, help="level under assets/levels instead of the default wall")
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS, help="cut games off after this many steps")
+    parser.add_argument('--shard-size', type=int, default=50, help="games per worker task")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--out', default='sweep.cols', help="results file")
+    args = parser.parse_args(argv)
+
+    weights = None
+    if args.weight:
+        weights = dict.fromkeys(EFFECTS, 1.0)
+        weights.update(args.weight)
+    shards = make_shards(args.games, args.shard_size, args.seed, args.drop_chance, args.duration, weights,
+                         dict(args.duration_of), args.level, args.max_ticks)
+
+    start = time.perf_counter()
+    games = sweep(args.out, shards, args.workers,
+                  lambda done, total: print(f"\r{done}/{total} games", end='', flush=True))
+    elapsed = time.perf_counter() - start
+    print(f"\n{games} games in {elapsed:.1f} s ({games / elapsed:.0f} games/s), results in {args.out}")
+
+    results = read_columns(args.out)
+    sets = itertools.product(args.drop_chance, args.duration)
+    for param_set, (drop_chance, duration) in enumerate(sets):
+        rows = results['param_set'] == param_set
+        print(f"drop {drop_chance:.2f} duration {duration} ms: mean score {results['score'][rows].mean():.0f}, "
+              f"win rate {results['won'][rows].mean():.1%}, mean lives left {results['lives'][rows].mean():.2f}")
+
+
+if __name__ == "__main__":
+    main()
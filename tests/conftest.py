@@ -0,0 +1,20 @@
+import pygame as pg
+import pytest
+
+from state_manager.headless import enable_headless
+
+"""Run the test suite without a window or audio device, and helpers shared by its tests."""
+enable_headless()
+
+
+def key(event_type, key_code):
+    """A key event to hand to HeadlessRunner.step()."""
+    return pg.event.Event(event_type, key=key_code)
+
+
+@pytest.fixture
+def runner():
+    """A started default Game in a HeadlessRunner."""
+    from screens.game import Game
+    from state_manager.headless import HeadlessRunner
+    return HeadlessRunner(Game())
@@ -0,0 +1,48 @@
+import pygame as pg
+from engine.assets import AssetManager, assets
+from screens.game import Game
+
+"""
+Tests for the central asset manager.
+Every image variant and sound must be loaded from disk only once.
+"""
+
+def test_image_loaded_once_per_variant():
+    manager = AssetManager()
+    first = manager.image('heart', (50, 50), alpha=True)
+    assert manager.image('heart', (50, 50), alpha=True) is first
+    assert first.get_size() == (50, 50)
+    manager.image('heart', (20, 20), alpha=True)
+    assert manager.stats() == {'hits': 1, 'misses': 2, 'images': 2, 'sounds': 0}
+
+def test_evict_drops_all_variants_of_a_key():
+    manager = AssetManager()
+    manager.image('heart', (50, 50))
+    manager.image('heart', (20, 20))
+    manager.sound('wall')
+    manager.evict('heart')
+    assert manager.stats()['images'] == 0
+    assert manager.stats()['sounds'] == 1
+    manager.evict()
+    assert manager.stats()['sounds'] == 0
+
+def test_new_game_reuses_decoded_sounds():
+    game = Game()
+    game.startup({})
+    sounds = dict(game.sounds)
+    misses = assets.misses
+    game.startup({})
+    assert assets.misses == misses
+    assert all(game.sounds[key] is sound for key, sound in sounds.items())
+
+def test_same_colored_bricks_share_one_surface():
+    from engine.surfaces import SurfaceCache
+    from objects.brick import Brick
+    a, b = Brick((10, 20, 30), 60, 15), Brick((10, 20, 30), 60, 15)
+    assert a.image is b.image
+    assert Brick((10, 20, 31), 60, 15).image is not a.image
+    cache = SurfaceCache()
+    circle = cache.get('ball', (20, 20), (255, 0, 0), pg.SRCALPHA)
+    assert cache.get('ball', (20, 20), (255, 0, 0), pg.SRCALPHA) is circle
+    assert circle.get_at((0, 0)).a == 0 and circle.get_at((10, 10)) == (255, 0, 0, 255)
+    assert cache.stats()['misses'] == 1
@@ -0,0 +1,65 @@
+import pygame as pg
+from objects.ball import Ball
+from screens.game import Game
+from state_manager.autopilot import Autopilot, landing
+from state_manager.headless import HeadlessRunner
+from state_manager.replay import InputRecorder, ReplayRunner
+
+"""
+Tests for the autopilot: the analytic landing prediction against the simulated
+ball, and whole games played without losing a life.
+"""
+
+def simulate_landing(ball, floor):
+    """Step a lone ball (walls only) until its bottom reaches floor."""
+    frames = 0
+    while ball.rect.bottom < floor:
+        ball.update()
+        frames += 1
+    return ball.pos.x + ball.rect.width / 2, frames
+
+def test_landing_matches_simulation():
+    for dx, dy in ((0, 5), (3.7, 5), (-4.2, 5), (5, 1.5), (-2.5, -5), (4.9, -1)):
+        ball = Ball((255, 0, 0), radius=10, speed=5, sounds=None)
+        ball.rect.topleft = (300, 200)
+        ball.init_position()
+        ball.dx, ball.dy = dx, dy
+        predicted_x, predicted_frames = landing(ball.rect, dx, dy, 520)
+        actual_x, frames = simulate_landing(ball, 520)
+        assert abs(predicted_x - actual_x) <= abs(dx) + 1, (dx, dy)
+        assert frames - 1 <= predicted_frames <= frames
+
+def test_no_landing_for_still_or_missed_ball():
+    rect = pg.Rect(100, 600, 20, 20)
+    assert landing(rect, 2, 0, 520) is None
+    assert landing(rect, 2, 5, 520) is None
+
+def test_presses_keys_through_get_event():
+    game = HeadlessRunner(Game(seed=1)).state
+    pilot = Autopilot(game)
+    pilot.step()
+    assert game.ball_launched
+    game.ball.rect.centerx = game.paddle.rect.centerx + 200
+    game.ball.dx, game.ball.dy = 0, 5
+    events = pilot.events()
+    assert [(event.type, event.key) for event in events] == [(pg.KEYDOWN, pg.K_RIGHT)]
+    game.paddle.reverse = True
+    pilot.step()
+    assert game.last_direction == 'left'
+
+def test_never_loses_a_life():
+    for seed in range(2):
+        runner = HeadlessRunner(Game(seed=seed, autopilot=True, render=False))
+        runner.run(3000)
+        assert runner.state.game_stats['lives'] >= 3
+        assert runner.state.game_stats['score'] > 0
+
+def test_autopilot_session_replays():
+    recorder = InputRecorder()
+    runner = HeadlessRunner(Game(seed=4, recorder=recorder, autopilot=True))
+    runner.run(600)
+    game = runner.state
+    game.cleanup()
+    replayed = ReplayRunner(recorder.replay).run()
+    assert replayed.game_stats == game.game_stats
+    assert replayed.paddle.rect == game.paddle.rect
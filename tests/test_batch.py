@@ -0,0 +1,61 @@
+import numpy as np
+from screens.game import Game
+from state_manager.batch import BatchEnv, LEFT, NOOP, OBS_SIZE, ParallelBatchEnv, RIGHT
+from state_manager.headless import HeadlessRunner
+
+"""
+Tests for running many games in one process: separate statistics per game, and the
+batch environment's arrays, rewards and episode handling.
+"""
+
+def test_games_keep_their_own_stats():
+    first, second = HeadlessRunner(Game()).state, HeadlessRunner(Game()).state
+    first.game_stats['score'] += 500
+    first.game_stats['lives'] -= 1
+    assert second.game_stats == {'lives': 3, 'score': 0}
+
+def test_step_returns_arrays_per_session():
+    env = BatchEnv(range(4), max_ticks=200)
+    obs = env.reset()
+    assert obs.shape == (4, OBS_SIZE) and obs.dtype == np.float32
+    scores = np.zeros(4)
+    finished = np.zeros(4, dtype=bool)
+    for tick in range(200):
+        obs, rewards, dones, info = env.step(np.full(4, LEFT if tick < 20 else RIGHT))
+        assert rewards.shape == (4,) and dones.shape == (4,)
+        scores += np.where(finished, 0, rewards)
+        finished |= dones
+        np.testing.assert_array_equal(info['score'][dones], scores[dones])
+    assert finished.all()  # cut off at max_ticks
+    assert (env.episodes == 1).all()
+    assert env.brick_masks().shape == (4, 45)
+
+def test_same_seeds_same_rollout():
+    rollouts = []
+    for _ in range(2):
+        env = BatchEnv([5, 6])
+        env.reset()
+        rng = np.random.default_rng(0)
+        total = np.zeros(2)
+        for _ in range(300):
+            obs, rewards, dones, info = env.step(rng.integers(NOOP, RIGHT + 1, 2))
+            total += rewards
+        rollouts.append((total, obs))
+    np.testing.assert_array_equal(rollouts[0][0], rollouts[1][0])
+    np.testing.assert_array_equal(rollouts[0][1], rollouts[1][1])
+
+def test_parallel_matches_single_process():
+    rng = np.random.default_rng(1)
+    actions = rng.integers(NOOP, RIGHT + 1, (150, 5))
+    single = BatchEnv(range(5), max_ticks=100)
+    with ParallelBatchEnv(range(5), workers=2, max_ticks=100) as parallel:
+        np.testing.assert_array_equal(parallel.reset(), single.reset())
+        for step in actions:
+            expected = single.step(step)
+            obs, rewards, dones, info = parallel.step(step)
+            np.testing.assert_array_equal(obs, expected[0])
+            np.testing.assert_array_equal(rewards, expected[1])
+            np.testing.assert_array_equal(dones, expected[2])
+            np.testing.assert_array_equal(info['score'], expected[3]['score'])
+        np.testing.assert_array_equal(parallel.episodes, single.episodes)
+        np.testing.assert_array_equal(parallel.brick_masks(), single.brick_masks())
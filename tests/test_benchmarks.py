@@ -0,0 +1,27 @@
+from benchmarks.suite import SCENARIOS, compare, load_baseline, run_suite, save_baseline
+
+"""
+Tests for the benchmark suite's bookkeeping: running scenarios, the baseline file
+and the regression check.
+"""
+
+def test_run_and_save_baseline(tmp_path):
+    path = tmp_path / 'baseline.json'
+    results = run_suite(['particles_4096', 'create_bricks_45'], repeat=2)
+    assert set(results) == {'particles_4096', 'create_bricks_45'}
+    assert all(len(result['samples']) == 2 and result['median_ms'] > 0 for result in results.values())
+    save_baseline(results, path)
+    save_baseline({'startup': {'median_ms': 500.0}}, path)  # later saves keep other scenarios
+    baseline = load_baseline(path)
+    assert set(baseline['results']) == {'particles_4096', 'create_bricks_45', 'startup'}
+    assert 'python' in baseline['environment']
+
+def test_compare_flags_changes_over_threshold():
+    baseline = {'a': {'median_ms': 10.0}, 'b': {'median_ms': 10.0}, 'c': {'median_ms': 10.0}}
+    results = {name: {'median_ms': ms} for name, ms in
+               (('a', 11.0), ('b', 12.0), ('c', 8.0), ('d', 1.0))}
+    verdicts = {row[0]: row[4] for row in compare(results, baseline, threshold=0.15)}
+    assert verdicts == {'a': 'ok', 'b': 'regression', 'c': 'improvement', 'd': 'new'}
+
+def test_baseline_covers_every_scenario():
+    assert set(load_baseline()['results']) == set(SCENARIOS)
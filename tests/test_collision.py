@@ -0,0 +1,105 @@
+import pygame as pg
+from objects.ball import Ball
+from objects.brick import Brick
+from objects.collision import sweep
+from screens.game import Game
+
+"""
+Tests for swept ball collision.
+A ball moving further than a brick's height in one step must still hit it.
+"""
+
+def game_with_single_brick(brick_center):
+    """A game whose wall is one target brick plus a spare one far away, so hitting the target does not win."""
+    game = Game()
+    game.startup({})
+    game.brick_wall.empty()
+    bricks = []
+    for center in (brick_center, (60, 120)):
+        brick = Brick((255, 0, 0), 60, 15)
+        brick.rect.center = center
+        game.brick_wall.add(brick)
+        bricks.append(brick)
+    return game, bricks[0]
+
+def test_sweep_reports_time_and_face():
+    target = pg.Rect(100, 0, 10, 10)
+    assert sweep(0, 0, 10, 10, 180, 0, target) == (0.5, 'x')
+    assert sweep(0, 0, 10, 10, 80, 0, target) is None
+    assert sweep(100, 50, 10, 10, 0, -80, target) == (0.5, 'y')
+
+def test_fast_ball_does_not_tunnel_through_brick():
+    game, brick = game_with_single_brick((500, 300))
+    game.ball.rect.center = (500, 400)
+    game.ball.dx, game.ball.dy = 0, -60  # 60 px per step, brick is 15 px tall
+    game.ball_launched = True
+    game.update(1 / 60)
+    game.update(1 / 60)
+    assert brick not in game.brick_wall
+    assert game.ball.dy > 0
+    assert game.ball.rect.top >= brick.rect.bottom
+
+def test_fast_ball_bounces_off_paddle():
+    game, _ = game_with_single_brick((800, 120))
+    game.ball.rect.centerx = game.paddle.rect.centerx
+    game.ball.rect.bottom = game.paddle.rect.top - 10
+    game.ball.dx, game.ball.dy = 0, 100
+    game.ball_launched = True
+    game.update(1 / 60)
+    assert game.ball.dy < 0
+    assert game.ball.rect.bottom <= game.paddle.rect.top
+    assert game.game_stats['lives'] == 3
+
+def test_ball_reflects_off_wall_corner():
+    ball = Ball((255, 0, 0), 10, 5, sounds=None)
+    ball.rect.topleft = (25, 55)
+    ball.dx, ball.dy = -20, -20
+    ball.update(1 / 60)
+    assert ball.dx > 0 and ball.dy > 0
+    assert ball.rect.left >= 20 and ball.rect.top >= 50
+
+def test_collision_independent_of_tick_rate():
+    results = []
+    for tick_rate in (30, 60, 240):
+        game, brick = game_with_single_brick((500, 300))
+        game.ball.rect.center = (500, 600)
+        game.ball.dx, game.ball.dy = 0, -30
+        game.ball_launched = True
+        for _ in range(tick_rate * 2 // 5):  # 0.4 seconds
+            game.update(1 / tick_rate)
+        results.append((brick in game.brick_wall, round(game.ball.pos.y)))
+    assert results[0] == results[1] == results[2]
+
+# --- Brick grid index ---
+
+def brute_force(wall, rect):
+    return {brick for brick in wall if rect.colliderect(brick.rect)}
+
+def test_grid_query_matches_brute_force():
+    import random
+    from screens.game import create_bricks
+    wall = create_bricks(40, 25)
+    rng = random.Random(7)
+    for _ in range(200):
+        rect = pg.Rect(rng.randint(0, 980), rng.randint(0, 980), rng.randint(1, 120), rng.randint(1, 60))
+        assert set(wall.query(rect)) == brute_force(wall, rect)
+
+def test_grid_follows_removal_kill_and_empty():
+    from screens.game import create_bricks
+    wall = create_bricks(5, 9)
+    first, second = wall.sprites()[:2]
+    wall.remove(first)
+    second.kill()
+    assert first not in wall.query(first.rect)
+    assert second not in wall.query(second.rect)
+    assert len(wall.grid) == len(wall) == 43
+    wall.empty()
+    assert len(wall.grid) == 0
+
+def test_off_grid_brick_is_indexed():
+    from screens.game import create_bricks
+    wall = create_bricks(5, 9)
+    brick = Brick((255, 0, 0), 60, 15)
+    brick.rect.center = (97, 403)
+    wall.add(brick)
+    assert wall.query(pg.Rect(90, 400, 4, 4)) == [brick]
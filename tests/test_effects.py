@@ -0,0 +1,68 @@
+import pygame as pg
+from conftest import key
+from objects.effects import EFFECTS, Effect, register
+from objects.power_item import PowerItem
+from screens.game import Game
+from state_manager.headless import HeadlessRunner
+
+"""
+Tests for the power-up effect registry and its expiry scheduler.
+"""
+
+def test_pickup_and_debug_key_apply_the_same_effect(runner):
+    game = runner.state
+    width = game.paddle.rect.width
+    PowerItem(0, 0, 'shrink').apply_effect(game.paddle, game.ball, game)
+    picked_up = game.paddle.rect.width
+    game.paddle.reset_size()
+    runner.step([key(pg.KEYDOWN, pg.K_2)])
+    assert game.paddle.rect.width == picked_up == int(width * 0.6)
+
+def test_effects_expire_in_order_and_sticky_stays(runner):
+    game = runner.state
+    effects = game.active_effects
+    effects.start('sticky', 0)
+    effects.start('slow_paddle', 0)
+    effects.start('reverse_controls', 1000)
+    assert effects.expire(5001) == 1
+    assert effects.names() == ['sticky', 'reverse_controls']
+    assert game.paddle.slow is False and game.paddle.reverse is True
+    assert effects.expire(60000) == 1
+    assert effects.names() == ['sticky'] and game.ball.sticky is True
+
+def test_new_effect_needs_no_game_changes():
+    @register
+    class Frozen(Effect):
+        name = 'frozen_test'
+        duration = 100
+
+        def apply(self, paddle, ball, game=None):
+            paddle.frozen = True
+
+        def revert(self, paddle, ball, game=None):
+            paddle.frozen = False
+
+    try:
+        game = HeadlessRunner(Game()).state
+        game._apply_effect_directly('frozen_test')
+        assert game.paddle.frozen is True
+        game.active_effects.expire(game.sim_clock.get_ticks() + 101)
+        assert game.paddle.frozen is False
+    finally:
+        del EFFECTS['frozen_test']
+
+def test_stacked_resizes_are_capped_and_reuse_skins():
+    from objects.paddle import MAX_WIDTH, MIN_WIDTH, Paddle
+    paddle = Paddle((0, 255, 255), 160, 13)
+    original = paddle.image
+    for _ in range(5):
+        EFFECTS['expand'].apply(paddle, None)
+    assert paddle.rect.width == MAX_WIDTH
+    wide = paddle.image
+    for _ in range(10):
+        EFFECTS['shrink'].apply(paddle, None)
+    assert paddle.rect.width == MIN_WIDTH
+    paddle.reset_size()
+    assert paddle.image is original
+    paddle.set_width(MAX_WIDTH + 100)
+    assert paddle.image is wide
@@ -0,0 +1,77 @@
+import time
+
+import pygame as pg
+from conftest import key
+from screens.game import Game
+from state_manager.sim_clock import SimClock
+
+"""
+Tests for headless turbo mode.
+Game time comes from the injected simulation clock, so a run is not tied to the wall clock.
+"""
+
+def test_sim_clock_advances_per_step():
+    clock = SimClock()
+    for _ in range(60):
+        clock.advance(1 / 60)
+    assert clock.get_ticks() == 1000
+
+def test_effect_expires_on_simulated_time(runner):
+    game = runner.state
+    runner.step([key(pg.KEYDOWN, pg.K_8)])  # reverse controls for 5 seconds of game time
+    assert game.paddle.reverse is True
+    runner.run(299, until_done=False)
+    assert game.paddle.reverse is True
+    runner.run(2, until_done=False)
+    assert game.paddle.reverse is False
+
+def test_injected_clock_drives_laser_cooldown():
+    clock = SimClock()
+    game = Game(sim_clock=clock)
+    game.startup({})
+    game.laser_mode = True
+    game._fire_lasers()
+    game._fire_lasers()
+    assert len(game.lasers) == 2
+    clock.advance(0.5)
+    game._fire_lasers()
+    assert len(game.lasers) == 4
+
+def test_runs_faster_than_real_time(runner):
+    runner.step([key(pg.KEYDOWN, pg.K_LEFT)])
+    start = time.perf_counter()
+    steps = runner.run(2000, until_done=False)
+    elapsed = time.perf_counter() - start
+    # 2000 steps are 33 seconds of game time
+    assert elapsed < steps * runner.step_time
+
+def test_screens_share_one_display_surface():
+    from unittest.mock import patch
+    from config import SETTINGS
+    from screens import Menu, End, Help
+    from state_manager.control import Control
+
+    real_set_mode = pg.display.set_mode
+    with patch('pygame.display.get_surface', return_value=None), \
+            patch('pygame.display.set_mode', side_effect=real_set_mode) as set_mode:
+        app = Control(SETTINGS)
+        states = {'menu': Menu(), 'game': Game(), 'end': End(), 'help': Help()}
+        app.setup_states(states, 'menu')
+    assert set_mode.call_count == 1
+    assert all(state.screen is app.screen and state.clock is app.clock for state in states.values())
+
+def test_headless_control_plays_game_and_stops():
+    from config import SETTINGS
+    from state_manager.control import Control
+
+    app = Control(dict(SETTINGS, HEADLESS=True, MAX_STEPS=300))
+    game = Game(seed=1, autopilot=True)
+    game.next = None
+    app.setup_states({'game': game}, 'game')
+    app.main_game_loop()
+    assert app.steps == 300 and game.ball_launched
+
+    game.done = True  # a state with no next state ends the loop
+    app.done = False
+    app.main_game_loop()
+    assert app.done and app.steps == 300
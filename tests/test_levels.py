@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from engine.levels import LevelLoader, compile_level, read_level
+from screens.game import Game, create_level_bricks
+
+"""
+Tests for level files: compiling to the binary cache, reusing it while the source
+is unchanged, and building a wall with multi-hit bricks from a level.
+"""
+
+LEVEL = {
+    'top': 120,
+    'legend': {'r': {'color': [200, 0, 0]}, 'B': {'color': [0, 0, 200], 'hp': 2}},
+    'grid': ['r.r.', '.BB.', 'rrrr'],
+}
+
+
+@pytest.fixture
+def loader(tmp_path):
+    level_dir = tmp_path / 'levels'
+    level_dir.mkdir()
+    (level_dir / 'test.json').write_text(json.dumps(LEVEL))
+    return LevelLoader(str(level_dir), str(tmp_path / 'cache'))
+
+def test_level_compiles_to_packed_records(loader):
+    level = loader.load('test')
+    assert (level.rows, level.columns, level.top, len(level)) == (3, 4, 120, 8)
+    assert level.bricks.itemsize == 8
+    assert level.bricks['hp'].tolist() == [1, 1, 2, 2, 1, 1, 1, 1]
+    assert level.colors()[2].tolist() == [0, 0, 200]
+
+def test_cache_is_reused_until_source_changes(loader, tmp_path):
+    loader.load('test')
+    loader.load('test')
+    assert (loader.compiled, loader.mapped) == (1, 1)
+    (tmp_path / 'levels' / 'test.json').write_text(json.dumps(dict(LEVEL, top=140)))
+    assert loader.load('test').top == 140
+    assert loader.compiled == 2
+    assert len(list((tmp_path / 'cache').iterdir())) == 1  # stale version removed
+
+def test_bad_levels_are_rejected():
+    with pytest.raises(ValueError):
+        compile_level(json.dumps({'legend': {}, 'grid': ['x']}))
+    with pytest.raises(ValueError):
+        compile_level(json.dumps({'legend': {'x': {'color': [0, 0, 0], 'hp': 0}}, 'grid': ['x']}))
+    with pytest.raises(ValueError):
+        read_level(__file__)
+
+def test_out_of_range_fields_raise_value_error():
+    base = {'legend': {'r': {'color': [200, 0, 0]}}, 'grid': ['r.r']}
+    for change in ({'top': -5}, {'top': 1.5}, {'brick_height': 70000},
+                   {'legend': {'r': {'color': [200, 0, 0], 'hp': '2'}}},
+                   {'legend': {'r': {'color': [200, 'a', 0]}}},
+                   {'legend': {'r': {'color': [200, 0, 256]}}},
+                   {'grid': ['r' * 65536]}):
+        with pytest.raises(ValueError):
+            compile_level(json.dumps(dict(base, **change)))
+
+def test_level_wall_and_multi_hit_bricks(loader):
+    wall = create_level_bricks(loader.load('test'))
+    assert len(wall) == 8
+    tough = [brick for brick in wall if brick.hp == 2]
+    assert len(tough) == 2 and tough[0].rect.y > 120
+
+    game = Game()
+    game.startup({})
+    game.brick_wall = wall
+    score = game.game_stats['score']
+    game._hit_brick(tough[0])
+    assert tough[0] in wall and game.game_stats['score'] == score
+    game._hit_brick(tough[0])
+    assert tough[0] not in wall and game.game_stats['score'] == score + 100
+
+def test_shipped_levels_load(tmp_path):
+    loader = LevelLoader(cache_dir=str(tmp_path))
+    assert loader.names()
+    for name in loader.names():
+        assert len(loader.load(name)) > 0
@@ -0,0 +1,31 @@
+from config import WINDOW_HEIGHT
+from screens.game import Game
+from state_manager.headless import HeadlessRunner
+
+"""
+Tests for sprite lifecycle management: sprites that leave the screen are removed,
+and nothing from one game carries over into the next.
+"""
+
+def test_missed_power_item_is_culled_and_pooled():
+    runner = HeadlessRunner(Game())
+    game = runner.state
+    item = game.power_item_pool.acquire(100, WINDOW_HEIGHT - 25, 'expand')
+    game.power_items.add(item)
+    game.all_sprites.add(item)
+    runner.run(30, until_done=False)
+    assert item not in game.power_items and item not in game.all_sprites
+    assert game.power_item_pool.stats()['in_use'] == 0
+
+def test_startup_clears_previous_game():
+    runner = HeadlessRunner(Game())
+    game = runner.state
+    game.laser_mode = True
+    game._fire_lasers()
+    game.power_items.add(game.power_item_pool.acquire(100, 200, 'shrink'))
+    game.startup({})
+    census = game.sprite_census()
+    assert census['lasers'] == 0 and census['power_items'] == 0
+    assert census['laser_pool']['in_use'] == 0
+    assert census['power_item_pool']['in_use'] == 0
+    assert game.laser_mode is False
@@ -0,0 +1,64 @@
+import numpy as np
+from config import WINDOW_HEIGHT
+from objects.ball import Ball
+from objects.ball_set import BallSet
+from objects.brick import Brick
+from screens.game import Game
+from state_manager.headless import HeadlessRunner
+
+"""
+Tests for multi-ball play: balls share NumPy state and move and collide together.
+"""
+
+def make_ball(center, velocity):
+    ball = Ball((255, 0, 0), 10, 5, sounds=None)
+    ball.rect.center = center
+    ball.init_position()
+    ball.dx, ball.dy = velocity
+    return ball
+
+def test_ball_set_moves_like_single_balls():
+    bricks = []
+    for x in range(100, 700, 70):
+        brick = Brick((255, 0, 0), 60, 15)
+        brick.rect.topleft = (x, 200)
+        bricks.append(brick)
+    rng = np.random.default_rng(3)
+    starts = [((int(x), int(y)), (float(vx), float(vy))) for x, y, vx, vy in
+              zip(rng.integers(60, 740, 40), rng.integers(100, 500, 40),
+                  rng.uniform(-30, 30, 40), rng.uniform(-30, 30, 40))]
+    singles = [make_ball(*start) for start in starts]
+    group = BallSet(4, *[make_ball(*start) for start in starts])
+
+    for _ in range(20):
+        expected = [(i, sprite, axis) for i, ball in enumerate(singles)
+                    for sprite, axis in ball.update(1 / 60, bricks)]
+        got = [(group.members.index(ball), sprite, axis) for ball, sprite, axis in group.move(1 / 60, bricks)]
+        assert sorted(got, key=lambda hit: hit[0]) == sorted(expected, key=lambda hit: hit[0])
+    assert [ball.rect.topleft for ball in group.members] == [ball.rect.topleft for ball in singles]
+    assert [(ball.dx, ball.dy) for ball in group.members] == [(ball.dx, ball.dy) for ball in singles]
+
+def test_ball_state_follows_removal():
+    a, b, c = (make_ball((100 * i, 300), (i, -i)) for i in (1, 2, 3))
+    group = BallSet(2, a, b, c)
+    b.kill()
+    assert group.members == [a, c]
+    assert (c.dx, c.dy) == (3, -3)
+    c.dx = 7
+    assert group.state[1, 4] == 7
+    assert (b.dx, b.dy) == (2, -2)  # a removed ball keeps its own copy
+
+def test_life_is_lost_only_with_the_last_ball():
+    runner = HeadlessRunner(Game())
+    game = runner.state
+    game.add_balls(1)
+    extra = game.balls.members[1]
+    lives = game.game_stats['lives']
+    extra.rect.top = WINDOW_HEIGHT
+    runner.step()
+    assert len(game.balls) == 1 and extra not in game.all_sprites
+    assert game.game_stats['lives'] == lives
+    game.ball.rect.bottom = WINDOW_HEIGHT
+    runner.step()
+    assert game.game_stats['lives'] == lives - 1
+    assert len(game.balls) == 1
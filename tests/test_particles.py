@@ -0,0 +1,87 @@
+import numpy as np
+import pygame as pg
+from objects.debris import Debris
+from objects.particles import ParticleSystem
+
+"""
+Tests for the array-based particle system behind Debris.
+"""
+
+def test_particles_follow_debris_motion():
+    particles = ParticleSystem(rng=np.random.default_rng(1))
+    particles.add(Debris((100, 100), (255, 0, 0)))
+    vx, vy = particles.vel[0]
+    assert -2 <= vx <= 2 and -3 <= vy <= -1
+    particles.update()
+    # gravity is applied before the move, like the Debris sprite did
+    assert np.allclose(particles.pos[0], (98 + vx, 98 + vy + 0.1))
+
+def test_capacity_is_fixed():
+    particles = ParticleSystem(capacity=10)
+    particles.add(*[Debris((50, 50), (0, 255, 0)) for _ in range(25)])
+    assert len(particles) == 10
+    assert particles.pos.shape == (10, 2)
+
+def test_expired_particles_are_compacted():
+    particles = ParticleSystem(lifetime=2)
+    particles.add(*[Debris((50, 50), (0, 0, 255)) for _ in range(4)])
+    particles.update()
+    particles.life[1] = 5  # one particle outlives the rest
+    particles.update()
+    assert len(particles) == 1
+    assert particles.life[0] == 4
+
+def test_draw_uses_one_surface_per_color():
+    particles = ParticleSystem()
+    particles.add(*[Debris((50, 50), (255, 0, 0)) for _ in range(100)])
+    particles.add(*[Debris((60, 60), (0, 0, 255)) for _ in range(100)])
+    blits = particles.blits()
+    assert len(blits) == 200
+    assert len({id(surface) for surface, _ in blits}) == 2
+    screen = pg.Surface((200, 200))
+    particles.draw(screen)
+    x, y = blits[0][1]
+    assert screen.get_at((x + 1, y + 1))[:3] == (255, 0, 0)
+
+# --- Sprite pools ---
+
+def test_pool_recycles_killed_sprites_and_surfaces():
+    from objects.pool import SpritePool
+    from objects.power_item import Laser
+    pool = SpritePool(Laser)
+    group = pg.sprite.Group()
+    first = pool.acquire(100, 100)
+    group.add(first)
+    image = first.image
+    first.kill()
+    first.kill()  # double kill must not free it twice
+    assert pool.stats() == {'in_use': 0, 'free': 1, 'created': 1}
+    second = pool.acquire(300, 200)
+    assert second is first and second.image is image
+    assert second.rect.center == (300, 200)
+    assert pool.stats() == {'in_use': 1, 'free': 0, 'created': 1}
+
+def test_pool_hooks_and_effect_reset():
+    from objects.pool import SpritePool
+    from objects.power_item import PowerItem
+    seen = []
+    pool = SpritePool(PowerItem, on_acquire=lambda s: seen.append('acquire'),
+                      on_release=lambda s: seen.append('release'))
+    item = pool.acquire(50, 50, 'expand')
+    assert item.image.get_at((0, 0))[:3] == (0, 255, 0)
+    item.kill()
+    item = pool.acquire(50, 50, 'shrink')
+    assert item.effect_type == 'shrink'
+    assert item.image.get_at((0, 0))[:3] == (255, 0, 0)
+    assert seen == ['acquire', 'release', 'acquire']
+
+def test_steady_state_lasers_allocate_nothing():
+    from screens.game import Game
+    game = Game()
+    game.startup({})
+    game.laser_mode = True
+    for _ in range(30):
+        game._fire_lasers()
+        for _ in range(31):  # cooldown is 500 ms
+            game.update(1 / 60)
+    assert game.laser_pool.created <= 8
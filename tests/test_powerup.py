@@ -65,8 +65,8 @@ def test_powerup_spawns_on_brick_hit():
     game.ball.rect.center = brick.rect.center  # Force collision
 
     # Force a power-up to spawn and make sure it's the 'sticky' one
-    with patch('random.random', return_value=0.1):  # Ensure power-up spawns
-        with patch('random.choice', return_value='sticky'):
+    with patch.object(game.rng.powerups, 'random', return_value=0.1):  # Ensure power-up spawns
+        with patch.object(game.rng.powerups, 'choice', return_value='sticky'):
             game._handle_collisions()
 
     # Assert that at least one power-up is in the group
@@ -0,0 +1,79 @@
+import json
+from time import perf_counter
+
+from config import SETTINGS
+from engine.profiler import FrameProfiler, UPDATE_PHASES, profiler
+from screens.game import Game
+from state_manager.control import Control
+from state_manager.headless import HeadlessRunner
+
+"""
+Tests for frame timing: the ring buffer, its statistics and dump, the Game.update
+sub-step timers and the overlay drawn by the main loop.
+"""
+
+def test_disabled_profiler_records_nothing():
+    timer = FrameProfiler()
+    start = timer.start()
+    assert start is None
+    timer.stop('update', start)
+    timer.end_frame()
+    timer.end_frame()
+    assert timer.frames == 0 and len(timer.history()) == 0
+
+def test_ring_buffer_keeps_newest_frames_in_order(tmp_path):
+    timer = FrameProfiler(capacity=4)
+    timer.enable()
+    timer.end_frame()
+    for i in range(6):
+        timer.stop('update', perf_counter() - i / 1000)  # about i ms
+        timer.end_frame()
+    history = timer.history()
+    update = history[:, timer.phases.index('update')]
+    assert timer.frames == 6 and len(history) == 4
+    assert list(update.round()) == [2, 3, 4, 5]
+
+    summary = timer.summary()
+    assert round(summary['update']['last']) == 5
+    assert 3 <= summary['update']['p50'] <= 4 <= summary['update']['p99'] <= 5
+    data = timer.dump(tmp_path / 'frames.json')
+    assert json.loads((tmp_path / 'frames.json').read_text()) == data
+    assert len(data['history']['frame']) == 4
+
+def test_game_update_times_its_sub_steps():
+    runner = HeadlessRunner(Game(seed=2, autopilot=True))
+    profiler.clear()
+    profiler.enable()
+    try:
+        profiler.end_frame()
+        for _ in range(30):
+            runner.step()
+            profiler.end_frame()
+        summary = profiler.summary()
+    finally:
+        profiler.disable()
+        profiler.clear()
+    assert all(summary[phase]['mean'] > 0 for phase in UPDATE_PHASES)
+
+def test_overlay_drawn_by_main_loop():
+    app = Control(SETTINGS)
+    game = Game(seed=3)
+    app.setup_states({'game': game}, 'game')
+    frames = []
+    draw = game.draw
+
+    def counting_draw(screen, alpha=1.0):
+        frames.append(alpha)
+        game.quit = len(frames) >= 10
+        return draw(screen, alpha)
+
+    game.draw = counting_draw
+    app.toggle_overlay()
+    try:
+        app.main_game_loop()
+        assert profiler.frames >= 8
+        assert app.overlay._panel is not None
+        assert app.overlay.census == game.sprite_census  # live sprite counts under the graph
+    finally:
+        app.toggle_overlay()
+    assert not profiler.enabled
@@ -0,0 +1,127 @@
+import pygame as pg
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from screens.game import Game
+
+"""
+Tests for the game screen renderers.
+Dirty-rect mode must produce exactly the same picture as a full redraw.
+"""
+
+def full_frame(game):
+    screen = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    game.dirty_rects = False
+    game.draw(screen, 0.5)
+    game.dirty_rects = True
+    return pg.image.tobytes(screen, 'RGB')
+
+def test_dirty_rect_frames_match_full_redraw():
+    game = Game()
+    game.dirty_rects = True
+    game.startup({})
+    game.ball.launch()
+    game.ball_launched = True
+    game.last_direction = 'left'
+    game.laser_mode = True
+
+    screen = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    assert game.draw(screen) is None  # first frame pushes everything
+
+    pushed = []
+    for tick in range(240):
+        if tick % 40 == 0:
+            game._fire_lasers()
+        game.update(1 / 60)
+        dirty = game.draw(screen, 0.5)
+        pushed.append(sum(rect.width * rect.height for rect in dirty))
+    assert pg.image.tobytes(screen, 'RGB') == full_frame(game)
+    assert max(pushed) < WINDOW_WIDTH * WINDOW_HEIGHT // 10
+
+def test_baked_wall_erases_only_destroyed_brick():
+    game = Game()
+    game.startup({})
+    layer = game.brick_wall.layer
+    brick, neighbour = sorted(game.brick_wall, key=lambda b: (b.rect.y, b.rect.x))[:2]
+    game._destroy_brick(brick)
+    assert game.brick_wall.layer is layer
+    assert layer.get_at(brick.rect.center) == game.static_layer.get_at(brick.rect.center)
+    assert layer.get_at(neighbour.rect.center) == neighbour.image.get_at((0, 0))
+    assert brick not in game.all_sprites and not any(b in game.all_sprites for b in game.brick_wall)
+
+def test_startup_forces_full_redraw():
+    game = Game()
+    game.dirty_rects = True
+    game.startup({})
+    screen = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    game.draw(screen)
+    assert game.draw(screen) is not None
+    game.startup({})
+    assert game.draw(screen) is None
+
+def test_font_registry_resolves_once():
+    from engine.fonts import get_font
+    assert get_font('calibri', 31) is get_font('calibri', 31)
+    assert get_font('calibri', 31) is not get_font('calibri', 31, bold=True)
+
+def test_text_cache_is_bounded_lru():
+    from engine.fonts import TextCache, get_font
+    cache = TextCache(maxsize=2)
+    font = get_font('calibri', 20)
+    first = cache.render(font, "one", (0, 0, 0))
+    cache.render(font, "two", (0, 0, 0))
+    assert cache.render(font, "one", (0, 0, 0)) is first
+    cache.render(font, "three", (0, 0, 0))  # evicts "two"
+    assert len(cache) == 2
+    assert cache.render(font, "one", (0, 0, 0)) is first
+    misses = cache.misses
+    cache.render(font, "two", (0, 0, 0))
+    assert cache.misses == misses + 1
+
+def test_steady_state_hud_does_not_rasterise():
+    from engine.fonts import text_cache
+    game = Game()
+    game.startup({})
+    screen = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    game.draw(screen)
+    misses = text_cache.misses
+    for _ in range(10):
+        game.draw(screen)
+    assert text_cache.misses == misses
+
+def test_menu_screens_compose_static_layer_once():
+    from screens import Menu, Help
+    screen = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    for state in (Menu(), Help()):
+        state.startup({})
+        for _ in range(5):
+            state.update_menu()
+            state.draw(screen)
+        assert state.static_layer.builds == 1
+
+def test_end_layer_rebuilt_only_when_result_changes():
+    from screens import End
+    screen = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    end = End()
+    end.startup({'score': 1200, 'won': False})
+    end.update_menu()
+    end.draw(screen)
+    end.draw(screen)
+    assert end.static_layer.builds == 1
+    end.startup({'score': 1200, 'won': False})
+    end.draw(screen)
+    assert end.static_layer.builds == 1
+    end.startup({'score': 4500, 'won': True})
+    end.draw(screen)
+    assert end.static_layer.builds == 2
+
+def test_highlighted_button_drawn_over_static_layer():
+    from screens import Menu
+    menu = Menu()
+    menu.startup({})
+    plain = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    menu.hover_index = -1
+    menu.draw(plain)
+    highlighted = pg.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    menu.hover_index = 0
+    menu.draw(highlighted)
+    center = menu.buttons[0]['rect'].move(5, 5).topleft
+    assert plain.get_at(center) != highlighted.get_at(center)
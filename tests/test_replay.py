@@ -0,0 +1,62 @@
+import numpy as np
+import pygame as pg
+import pytest
+from conftest import key
+from screens.game import Game
+from state_manager.headless import HeadlessRunner
+from state_manager.replay import InputRecorder, Replay, ReplayRunner
+from state_manager.rng import SessionRng
+
+"""
+Tests for deterministic sessions: seeded random streams, and recorded input that
+replays to exactly the same game.
+"""
+
+def play_session(recorder=None, seed=1234):
+    """Play a scripted session: launch, sweep the paddle, grab effects, fire lasers."""
+    runner = HeadlessRunner(Game(seed=seed, recorder=recorder))
+    game = runner.state
+    script = {
+        0: [key(pg.KEYDOWN, pg.K_LEFT)],
+        40: [key(pg.KEYUP, pg.K_LEFT), key(pg.KEYDOWN, pg.K_5)],
+        41: [key(pg.KEYDOWN, pg.K_SPACE), key(pg.KEYDOWN, pg.K_RIGHT)],
+        120: [key(pg.KEYUP, pg.K_RIGHT), key(pg.KEYDOWN, pg.K_9)],
+        200: [key(pg.KEYDOWN, pg.K_SPACE)],
+    }
+    for tick in range(1500):
+        if game.done:
+            break
+        runner.step(script.get(tick, ()))
+    game.cleanup()
+    return game, (game.game_stats['score'], game.game_stats['lives'], len(game.brick_wall),
+                  game.ball.rect.topleft, game.paddle.rect.topleft)
+
+def test_same_seed_same_streams():
+    a, b = SessionRng(7), SessionRng(7)
+    assert [a.ball.random() for _ in range(3)] == [b.ball.random() for _ in range(3)]
+    assert a.particles.uniform(size=3).tolist() == b.particles.uniform(size=3).tolist()
+    assert SessionRng(8).powerups.random() != SessionRng(7).powerups.random()
+
+def test_recorded_session_replays_exactly(tmp_path):
+    path = str(tmp_path / 'session.bkrp')
+    game, outcome = play_session(InputRecorder(path))
+    replay = Replay.load(path)
+    assert replay.seed == 1234 and replay.ticks == game.tick
+    assert len(replay.events) == 8
+
+    replayed = ReplayRunner(replay).run()
+    assert (replayed.game_stats['score'], replayed.game_stats['lives'], len(replayed.brick_wall),
+            replayed.ball.rect.topleft, replayed.paddle.rect.topleft) == outcome
+
+def test_replay_round_trips_through_bytes():
+    replay = Replay(99, '01_classic', ticks=10)
+    copy = Replay.from_bytes(replay.to_bytes())
+    assert (copy.seed, copy.level, copy.ticks, len(copy.events)) == (99, '01_classic', 10, 0)
+
+def test_seed_must_fit_the_replay_header():
+    for bad in (-5, 2 ** 64, 1.5, '7'):
+        with pytest.raises(ValueError, match="seed"):
+            Game(seed=bad)
+    rng = SessionRng(np.uint64(2 ** 64 - 1))
+    replay = Replay(rng.seed)
+    assert Replay.from_bytes(replay.to_bytes()).seed == 2 ** 64 - 1
@@ -0,0 +1,85 @@
+import time
+
+import pygame as pg
+import pytest
+from conftest import key
+from screens.game import Game
+from state_manager.headless import HeadlessRunner
+from state_manager.snapshot import RewindBuffer
+
+"""
+Tests for game snapshots and the rewind buffer.
+"""
+
+def state_of(game):
+    return (game.tick, game.game_stats['score'], game.game_stats['lives'], len(game.brick_wall),
+            [ball.rect.topleft for ball in game.balls.members], game.paddle.rect.copy(),
+            sorted(laser.rect.topleft for laser in game.lasers), game.active_effects.names(),
+            len(game.particles), game.laser_mode, dict(game.effects_collected))
+
+def play(runner, ticks):
+    for _ in range(ticks):
+        runner.step()
+
+def test_restore_replays_the_same_future():
+    runner = HeadlessRunner(Game(seed=3))
+    game = runner.state
+    runner.step([key(pg.KEYDOWN, pg.K_LEFT)])
+    runner.step([key(pg.KEYDOWN, pg.K_1), key(pg.KEYDOWN, pg.K_5), key(pg.KEYDOWN, pg.K_9)])
+    play(runner, 60)
+    snapshot = game.snapshot()
+    before = state_of(game)
+    runner.step([key(pg.KEYDOWN, pg.K_SPACE)])
+    play(runner, 200)
+    after = state_of(game)
+
+    game.restore(snapshot)
+    assert state_of(game) == before
+    runner.step([key(pg.KEYDOWN, pg.K_SPACE)])
+    play(runner, 200)
+    assert state_of(game) == after
+
+def test_caught_power_items_rewind_with_the_game(runner):
+    game = runner.state
+    game.effects_collected['laser'] += 1
+    snapshot = game.snapshot()
+    game.effects_collected['laser'] += 2
+    game.effects_collected['expand'] += 1
+    game.restore(snapshot)
+    assert dict(game.effects_collected) == {'laser': 1}
+
+def test_destroyed_bricks_come_back_on_restore(runner):
+    game = runner.state
+    snapshot = game.snapshot()
+    layer = game.brick_wall.layer.copy()
+    for brick in game.bricks[:10]:
+        game._destroy_brick(brick)
+    game.restore(snapshot)
+    assert len(game.brick_wall) == len(game.bricks)
+    assert game.brick_wall.layer.get_view().raw == layer.get_view().raw
+
+def test_snapshots_are_small_and_fast(runner):
+    game = runner.state
+    snapshot = game.snapshot()
+    assert snapshot.nbytes < 16 * 1024
+    start = time.perf_counter()
+    for _ in range(100):
+        game.restore(snapshot)
+    assert (time.perf_counter() - start) / 100 < 1 / 60
+
+def test_rewind_buffer_is_bounded():
+    runner = HeadlessRunner(Game(rewind_seconds=2))
+    game = runner.state
+    assert isinstance(game.rewind, RewindBuffer)
+    runner.step([key(pg.KEYDOWN, pg.K_LEFT)])
+    play(runner, 600)
+    assert len(game.rewind) == game.rewind.capacity
+    tick = game.tick
+    runner.step([key(pg.KEYDOWN, pg.K_r)])
+    assert tick - 60 - game.rewind.interval <= game.tick <= tick - 60 + 1
+
+def test_snapshot_from_another_session_is_refused(runner):
+    snapshot = runner.state.snapshot()
+    runner.state.startup({})
+    with pytest.raises(ValueError):
+        runner.state.restore(snapshot)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from objects.effects import EFFECTS, BalanceConfig
+from screens.game import Game
+from state_manager.headless import HeadlessRunner
+from state_manager.sweep import main, make_shards, read_columns, run_shard, sweep
+
+"""
+Tests for the power-up balance sweep: tunable drop rules, shard results and the
+columnar results file.
+"""
+
+def test_drop_rules_are_tunable():
+    game = HeadlessRunner(Game(config=BalanceConfig(1.0, {'laser': 1}, {'laser': 100}))).state
+    game._destroy_brick(game.bricks[0])
+    assert [item.effect_type for item in game.power_items] == ['laser']
+    game.active_effects.start('laser', 0)
+    assert list(game.active_effects) == [('laser', 100)]
+
+def test_shard_plays_every_seed_once():
+    shard = make_shards(3, 10, 7, [0.5], [2000], None, {}, None, 200)[0]
+    columns = run_shard(shard)
+    assert list(columns['seed']) == [7, 8, 9]
+    assert list(columns['ticks']) == [200, 200, 200]
+    assert all(len(values) == 3 for values in columns.values())
+
+def test_sweep_streams_columns(tmp_path):
+    path = str(tmp_path / 'results.cols')
+    shards = make_shards(4, 2, 0, [0.0, 1.0], [5000], None, {}, None, 120)
+    assert len(shards) == 4
+    assert sweep(path, shards, workers=2) == 8
+    results = read_columns(path)
+    assert len(results['score']) == 8
+    assert sorted(results['param_set'].tolist()) == [0] * 4 + [1] * 4
+    assert set(results) >= {f'caught_{name}' for name in EFFECTS}
+    assert results['seconds'].dtype == np.float64
+
+def test_bad_effect_pairs_are_usage_errors(capsys):
+    for argv in (['--weight', 'laser'], ['--weight', 'nosuch=1'], ['--duration-of', 'laser=soon']):
+        with pytest.raises(SystemExit) as exit_info:
+            main(argv + ['--games', '0'])
+        assert exit_info.value.code == 2
+    assert 'expected EFFECT=VALUE' in capsys.readouterr().err
@@ -0,0 +1,66 @@
+import pygame as pg
+from objects.ball import Ball
+from objects.debris import Debris
+from objects.paddle import Paddle
+from objects.particles import ParticleSystem
+
+"""
+Tests for the fixed-step simulation.
+Movement must depend on simulated time only, not on how many steps it is split into,
+and rendering interpolates between the last two steps.
+"""
+pg.init()
+
+def make_ball():
+    ball = Ball((255, 0, 0), 10, 5, sounds=None)
+    ball.dx, ball.dy = 3, -4
+    return ball
+
+def test_ball_speed_independent_of_tick_rate():
+    slow, fast = make_ball(), make_ball()
+    for _ in range(10):
+        slow.update(1 / 60)
+    for _ in range(20):
+        fast.update(1 / 120)
+    assert slow.pos == fast.pos
+
+def test_float_position_keeps_sub_pixel_motion():
+    ball = make_ball()
+    ball.dx, ball.dy = 0.25, 0
+    start_x = ball.pos.x
+    for _ in range(8):
+        ball.update(1 / 60)
+    assert ball.pos.x == start_x + 2
+    assert ball.rect.x == round(ball.pos.x)
+
+def test_render_interpolates_between_steps():
+    ball = make_ball()
+    ball.update(1 / 60)
+    start = ball.prev_pos
+    assert ball.render_pos(0.0) == (round(start.x), round(start.y))
+    assert ball.render_pos(1.0) == ball.rect.topleft
+    assert ball.render_pos(0.5) == (round(start.x + 1.5), round(start.y - 2))
+
+def test_direct_rect_move_snaps_position():
+    ball = make_ball()
+    ball.update(1 / 60)
+    ball.rect.center = (100, 100)
+    assert ball.render_pos(0.5) == ball.rect.topleft
+    ball.dx = ball.dy = 0
+    ball.update(1 / 60)
+    assert ball.rect.center == (100, 100)
+
+def test_debris_lifetime_in_simulated_time():
+    particles = ParticleSystem()
+    particles.add(Debris((100, 100), (255, 255, 255)))
+    for _ in range(59):
+        particles.update(1 / 120)
+    assert len(particles) == 1
+    particles.update(1 / 120)
+    assert len(particles) == 0
+
+def test_paddle_stops_at_wall():
+    paddle = Paddle((255, 255, 255), 100, 20)
+    paddle.rect.x = 30
+    paddle.move(-1, 50)
+    assert paddle.rect.left == 20